@@ -5,6 +5,7 @@ Combines Researcher → Writer → Optimizer agents.
 Uses pgvector for retrieving similar past threads as context.
 """
 import os
+import re
 from typing import TypedDict, List, Optional
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage
@@ -17,6 +18,12 @@ logger = logging.getLogger("onering")
 groq_api_key = os.getenv("GROQ_API_KEY")
 llm = ChatGroq(temperature=0.9, model_name="llama-3.1-8b-instant", api_key=groq_api_key)
 
+# Optimizer numbering cleanup, applied in order to every tweet
+_SLASH_NUMBERING_RE = re.compile(r'^\d+(/\d+)?[.):\-\]]*\s*')
+_TWEET_LABEL_RE = re.compile(r'^(?:Tweet\s+)?\d+\s*[-:)\.]?\s*')
+_BULLET_RE = re.compile(r'^[-•*\s]+')
+_LEADING_DIGITS_RE = re.compile(r'^[\d\s]+[-.):\]]*\s*')
+
 
 class ThreadState(TypedDict):
     """State for viral thread generation."""
@@ -191,7 +198,6 @@ NOW OPTIMIZE AND OUTPUT ONLY THE TWEETS:"""
     response = llm.invoke([message])
 
     # Parse response: split by double newlines to get individual tweets
-    import re
     raw_tweets = response.content.strip().split("\n\n")
     tweets = []
     
@@ -207,16 +213,16 @@ NOW OPTIMIZE AND OUTPUT ONLY THE TWEETS:"""
         
         # Remove all numbering patterns: 1/6, 1., (1), 1), [1], Tweet 1, etc.
         # Match: optional digits, optional slash+digit, optional period/paren/bracket, colon, spaces
-        tweet = re.sub(r'^\d+(/\d+)?[.):\-\]]*\s*', '', tweet).strip()
+        tweet = _SLASH_NUMBERING_RE.sub('', tweet).strip()
         
         # Remove "Tweet X:", "Tweet X -", "X -" patterns
-        tweet = re.sub(r'^(?:Tweet\s+)?\d+\s*[-:)\.]?\s*', '', tweet).strip()
+        tweet = _TWEET_LABEL_RE.sub('', tweet).strip()
         
         # Remove leading bullets, dashes, asterisks
-        tweet = re.sub(r'^[-•*\s]+', '', tweet).strip()
+        tweet = _BULLET_RE.sub('', tweet).strip()
         
         # Final cleanup: remove leading numbers and punctuation
-        tweet = re.sub(r'^[\d\s]+[-.):\]]*\s*', '', tweet).strip()
+        tweet = _LEADING_DIGITS_RE.sub('', tweet).strip()
         
         # Only add non-empty tweets with reasonable length (tweets must have substance)
         if tweet and len(tweet) > 15 and not tweet[0].isdigit():
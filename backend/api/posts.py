@@ -1,7 +1,5 @@
 from fastapi import APIRouter, BackgroundTasks
 from pydantic import BaseModel
-from rq import Queue
-from redis import Redis
 from backend.core.config import settings
 
 router = APIRouter()
@@ -11,6 +9,10 @@ class GeneratePostIn(BaseModel):
 
 @router.post("/generate")
 async def generate_post(payload: GeneratePostIn):
+    # Imported here so app startup does not load redis/rq for this stub
+    from redis import Redis
+    from rq import Queue
+
     redis_conn = Redis.from_url(settings.REDIS_URL)
     q = Queue('default', connection=redis_conn)
     # Note: create_post_task import removed - not critical for startup
@@ -3,9 +3,9 @@ Phase 10.2: RING Token API Endpoints
 """
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.orm import Session
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from backend.core.database import get_db
 from backend.features.tokens.ledger import (
@@ -15,7 +15,7 @@ from backend.features.tokens.ledger import (
     earn_ring,
 )
 from backend.features.tokens.balance import get_effective_ring_balance, get_balance_summary
-from backend.features.tokens.publish import handle_publish_event
+from backend.features.tokens.publish import handle_publish_event, handle_publish_events
 from backend.features.tokens.reconciliation import (
     run_reconciliation,
     get_reconciliation_summary,
@@ -42,6 +42,10 @@ class PublishEventIn(BaseModel):
         return value.strip() or None
 
 
+class PublishEventBatchIn(BaseModel):
+    events: List[PublishEventIn] = Field(..., max_length=100, description="Publish events, processed in order")
+
+
 class SpendRequest(BaseModel):
     user_id: str
     amount: int
@@ -111,9 +115,16 @@ def get_summary(user_id: str, limit: int = 20, db: Session = Depends(get_db)) ->
 
 
 @router.post("/reconcile")
-def reconcile(db: Session = Depends(get_db)) -> Dict:
-    """Run reconciliation (admin only in production)."""
-    result = run_reconciliation(db)
+def reconcile(
+    shard_index: int = 0,
+    shard_count: int = 1,
+    db: Session = Depends(get_db),
+) -> Dict:
+    """Run reconciliation (admin only in production), optionally for one user shard."""
+    try:
+        result = run_reconciliation(db, shard=(shard_index, shard_count))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     return result
 
 
@@ -148,6 +159,32 @@ def publish_event(body: PublishEventIn, db: Session = Depends(get_db)) -> Dict:
         return {"ok": False, "error": "publish_event_failed", "detail": str(exc)}
 
 
+@router.post("/publish/batch")
+def publish_events_batch(body: PublishEventBatchIn, db: Session = Depends(get_db)) -> Dict:
+    """Persist a burst of publish events in one pass (shared lookup + insert)."""
+    if any(not event.event_id or not event.user_id for event in body.events):
+        raise HTTPException(status_code=400, detail="event_id and user_id are required")
+    now = datetime.now(timezone.utc)
+    events = [
+        {
+            "event_id": event.event_id,
+            "user_id": event.user_id,
+            "platform": event.platform,
+            "content_hash": event.content_hash,
+            "published_at": event.published_at or now,
+            "platform_post_id": event.platform_post_id,
+            "enforcement_request_id": event.enforcement_request_id,
+            "enforcement_receipt_id": event.enforcement_receipt_id,
+            "metadata": event.metadata,
+        }
+        for event in body.events
+    ]
+    try:
+        return {"ok": True, "results": handle_publish_events(db, events)}
+    except Exception as exc:
+        return {"ok": False, "error": "publish_event_failed", "detail": str(exc)}
+
+
 @router.post("/spend")
 def spend(body: SpendRequest, db: Session = Depends(get_db)) -> Dict:
     """Spend RING via ledger (shadow/live only)."""
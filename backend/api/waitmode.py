@@ -8,8 +8,9 @@ Provides REST API for:
 All endpoints require auth and enforce collaborator access.
 """
 
+from datetime import datetime
 from typing import Optional, Literal
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
 
 from backend.core.auth import get_current_user_id
@@ -23,6 +24,13 @@ from backend.features.waitmode.models import (
     UpdateNoteRequest,
     CreateSuggestionRequest,
     VoteRequest,
+    BulkVoteRequest,
+    ScratchNote,
+    QueuedSuggestion,
+    DraftVotesResponse,
+    WaitStateResponse,
+    WaitModeEnvelope,
+    WaitModePage,
 )
 
 
@@ -35,6 +43,18 @@ SUGGESTIONS_RATE_LIMIT_PER_MINUTE = 60
 SUGGESTIONS_RATE_LIMIT_BURST = 15
 VOTES_RATE_LIMIT_PER_MINUTE = 240
 VOTES_RATE_LIMIT_BURST = 60
+STATE_RATE_LIMIT_PER_MINUTE = 120
+STATE_RATE_LIMIT_BURST = 30
+
+# Pagination for note/suggestion listings
+LIST_LIMIT_MAX = 200
+
+
+def _next_cursor(items: list, limit: int) -> Optional[str]:
+    """created_at of the last item when the page is full, else None."""
+    if len(items) < limit:
+        return None
+    return items[-1].created_at.isoformat()
 
 
 # ===== NOTES ENDPOINTS =====
@@ -77,13 +97,15 @@ async def create_note(
         return {"data": note.model_dump(), "request_id": rid}
 
 
-@router.get("/drafts/{draft_id}/notes")
+@router.get("/drafts/{draft_id}/notes", response_model=WaitModePage[ScratchNote])
 async def list_notes(
     draft_id: str,
     request: Request,
+    limit: int = Query(50, ge=1, le=LIST_LIMIT_MAX, description="Maximum notes to return"),
+    cursor: Optional[datetime] = Query(None, description="Pagination cursor (next_cursor of the previous page)"),
     user_id: str = Depends(get_current_user_id),
 ):
-    """List private notes for a draft (author-only).
+    """List private notes for a draft (author-only), newest first.
     
     Rate limit: 120/min with burst of 30
     """
@@ -105,11 +127,17 @@ async def list_notes(
             notes = waitmode_service.list_notes(
                 draft_id=draft_id,
                 user_id=user_id,
+                limit=limit,
+                cursor=cursor,
             )
         except AppError:
             raise
         
-        return {"data": [n.model_dump() for n in notes], "request_id": rid}
+        return WaitModePage[ScratchNote].model_construct(
+            data=notes,
+            next_cursor=_next_cursor(notes, limit),
+            request_id=rid,
+        )
 
 
 @router.patch("/notes/{note_id}")
@@ -227,14 +255,16 @@ async def create_suggestion(
         return {"data": suggestion.model_dump(), "request_id": rid}
 
 
-@router.get("/drafts/{draft_id}/suggestions")
+@router.get("/drafts/{draft_id}/suggestions", response_model=WaitModePage[QueuedSuggestion])
 async def list_suggestions(
     draft_id: str,
     status: Optional[Literal["queued", "consumed", "dismissed"]] = None,
+    limit: int = Query(50, ge=1, le=LIST_LIMIT_MAX, description="Maximum suggestions to return"),
+    cursor: Optional[datetime] = Query(None, description="Pagination cursor (next_cursor of the previous page)"),
     request: Request = None,
     user_id: str = Depends(get_current_user_id),
 ):
-    """List suggestions for a draft (author-only by default).
+    """List suggestions for a draft (author-only by default), newest first.
     
     Rate limit: 60/min with burst of 15
     """
@@ -257,11 +287,17 @@ async def list_suggestions(
                 draft_id=draft_id,
                 user_id=user_id,
                 status=status,
+                limit=limit,
+                cursor=cursor,
             )
         except AppError:
             raise
         
-        return {"data": [s.model_dump() for s in suggestions], "request_id": rid}
+        return WaitModePage[QueuedSuggestion].model_construct(
+            data=suggestions,
+            next_cursor=_next_cursor(suggestions, limit),
+            request_id=rid,
+        )
 
 
 @router.post("/suggestions/{suggestion_id}/dismiss")
@@ -383,7 +419,45 @@ async def vote_segment(
         return {"data": vote.model_dump(), "request_id": rid}
 
 
-@router.get("/drafts/{draft_id}/votes")
+@router.post("/drafts/{draft_id}/votes")
+async def vote_segments_bulk(
+    draft_id: str,
+    body: BulkVoteRequest,
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+):
+    """Vote on several segments in one call (upsert behavior).
+    
+    Rate limit: 240/min with burst of 60 (one request counts once)
+    """
+    rid = getattr(request.state, "request_id", None) or get_request_id()
+    limiter = getattr(request.app.state, "rate_limiter", None)
+    
+    with start_span("api.waitmode.vote_segments_bulk", {"draft_id": draft_id, "user_id": user_id, "count": len(body.votes)}):
+        if limiter:
+            allowed = limiter.allow(
+                f"wait_votes:{user_id}",
+                per_minute=VOTES_RATE_LIMIT_PER_MINUTE,
+                burst=VOTES_RATE_LIMIT_BURST,
+            )
+            if not allowed:
+                ratelimit_block_total.inc(labels={"scope": normalize_path(str(request.url.path))})
+                raise RateLimitError("Rate limit exceeded for wait mode votes", request_id=rid)
+        
+        try:
+            votes = waitmode_service.vote_segments_bulk(
+                draft_id=draft_id,
+                voter_user_id=user_id,
+                votes=[(vote.segment_id, vote.value) for vote in body.votes],
+                request_id=rid,
+            )
+        except AppError:
+            raise
+        
+        return {"data": [v.model_dump() for v in votes], "request_id": rid}
+
+
+@router.get("/drafts/{draft_id}/votes", response_model=WaitModeEnvelope[DraftVotesResponse])
 async def list_votes(
     draft_id: str,
     request: Request,
@@ -417,4 +491,41 @@ async def list_votes(
         except AppError:
             raise
         
-        return {"data": votes.model_dump(), "request_id": rid}
+        return WaitModeEnvelope[DraftVotesResponse].model_construct(data=votes, request_id=rid)
+
+
+# ===== COMBINED STATE ENDPOINT =====
+
+@router.get("/drafts/{draft_id}/state", response_model=WaitModeEnvelope[WaitStateResponse])
+async def get_wait_state(
+    draft_id: str,
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+):
+    """Get the user's notes, suggestions and vote summary for a draft in one call.
+    
+    Rate limit: 120/min with burst of 30
+    """
+    rid = getattr(request.state, "request_id", None) or get_request_id()
+    limiter = getattr(request.app.state, "rate_limiter", None)
+    
+    with start_span("api.waitmode.get_wait_state", {"draft_id": draft_id, "user_id": user_id}):
+        if limiter:
+            allowed = limiter.allow(
+                f"wait_state:{user_id}",
+                per_minute=STATE_RATE_LIMIT_PER_MINUTE,
+                burst=STATE_RATE_LIMIT_BURST,
+            )
+            if not allowed:
+                ratelimit_block_total.inc(labels={"scope": normalize_path(str(request.url.path))})
+                raise RateLimitError("Rate limit exceeded for wait mode state", request_id=rid)
+        
+        try:
+            state = waitmode_service.get_user_wait_state(
+                draft_id=draft_id,
+                user_id=user_id,
+            )
+        except AppError:
+            raise
+        
+        return WaitModeEnvelope[WaitStateResponse].model_construct(data=state, request_id=rid)
@@ -68,11 +68,22 @@ class Settings(BaseSettings):
     # Audit logging (Phase 6.3)
     AUDIT_ENABLED: bool = False
     AUDIT_SAMPLE_RATE: float = 1.0
+    AUDIT_ASYNC: bool = False  # queue writes for a background batch writer
+    AUDIT_QUEUE_MAXSIZE: int = 10000  # full queue falls back to synchronous writes
+
+    # Generation cache: identical /v1/generate/content requests are replayed
+    # from Redis for this many seconds
+    GENERATE_CACHE_TTL_SECONDS: int = 0  # 0 = disabled
+
+    # Draft access cache: creator/collaborators/ring holder are reused for
+    # this many seconds per process before being re-read
+    DRAFT_ACCESS_CACHE_TTL_SECONDS: int = 5  # 0 = disabled
 
     # Enforcement (Phase 10.1)
     ONERING_ENFORCEMENT_MODE: str = "off"  # off | advisory | enforced
     ONERING_AUDIT_LOG: str = "1"  # "0" | "1"
     ONERING_TOKEN_ISSUANCE: str = "off"  # off | shadow | live
+    ONERING_RECONCILIATION_WORK_MEM: Optional[str] = None  # e.g. "256MB"; unset = server default
     ONERING_ENFORCEMENT_RECEIPT_TTL_SECONDS: int = 3600
     ONERING_AUDIT_RETENTION_DAYS: int = 30
     ONERING_AUDIT_CLEANUP_DRY_RUN: str = "1"
@@ -81,6 +92,7 @@ class Settings(BaseSettings):
     ADMIN_KEY: Optional[str] = None  # Legacy key (backward compatible)
     ADMIN_AUTH_MODE: str = "hybrid"  # "clerk" | "legacy" | "hybrid"
     ENVIRONMENT: str = "dev"  # "dev" | "test" | "prod"
+    ADMIN_ROUTES_ENABLED: bool = True  # False leaves the admin routers unmounted
     
     # Clerk JWT verification
     CLERK_ISSUER: Optional[str] = None  # e.g. https://your-instance.clerk.accounts.dev
@@ -9,7 +9,8 @@ This module provides:
 """
 from typing import Optional, Generator
 from contextlib import contextmanager
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, DateTime, Boolean, JSON, Text, Index, ForeignKey, UniqueConstraint, text
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, DateTime, Boolean, JSON, Text, Index, ForeignKey, UniqueConstraint, Uuid, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.sql import func
@@ -27,6 +28,9 @@ POOL_SIZE = 10
 MAX_OVERFLOW = 20
 POOL_TIMEOUT = 30
 POOL_RECYCLE = 3600  # Recycle connections after 1 hour
+# psycopg 3 server-side prepares a statement once it has run this many times
+# on a connection; shape-stable hot queries then skip parse/plan.
+PREPARE_THRESHOLD = 3
 
 # Global engine and session factory
 _engine = None
@@ -98,9 +102,14 @@ def init_engine(database_url: Optional[str] = None):
             "Set DATABASE_URL in environment or .env file."
         )
 
+    connect_args = {}
+    if make_url(url).get_driver_name() == "psycopg":
+        connect_args["prepare_threshold"] = PREPARE_THRESHOLD
+
     # Create engine with connection pooling
     _engine = create_engine(
         url,
+        connect_args=connect_args,
         poolclass=QueuePool,
         pool_size=POOL_SIZE,
         max_overflow=MAX_OVERFLOW,
@@ -246,6 +255,72 @@ def apply_schema_upgrades(engine=None) -> None:
             )
         )
         
+        # Covering usage index replaces the plain (user_id, usage_key, occurred_at) one
+        if conn.dialect.name == "postgresql":
+            conn.execute(
+                text(
+                    """
+                    CREATE INDEX IF NOT EXISTS ix_usage_events_user_key_time
+                    ON usage_events (user_id, usage_key, occurred_at) INCLUDE (metadata);
+                    """
+                )
+            )
+            conn.execute(text("DROP INDEX IF EXISTS idx_usage_events_user_key_occurred;"))
+        
+        # Wait mode list indexes extend the (draft_id, author_user_id) ones with sort keys
+        conn.execute(
+            text(
+                """
+                CREATE INDEX IF NOT EXISTS idx_wait_notes_draft_author_created
+                ON wait_notes (draft_id, author_user_id, created_at);
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                CREATE INDEX IF NOT EXISTS idx_wait_suggestions_draft_author_status_created
+                ON wait_suggestions (draft_id, author_user_id, status, created_at);
+                """
+            )
+        )
+        conn.execute(text("DROP INDEX IF EXISTS idx_wait_notes_draft_author;"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_wait_suggestions_draft_author;"))
+        # Redundant with idx_wait_votes_draft / uq_segment_voter, or unused
+        conn.execute(text("DROP INDEX IF EXISTS ix_wait_votes_draft_id;"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_wait_votes_segment_id;"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_wait_votes_voter_user_id;"))
+        
+        # Wait mode ids were VARCHAR(100) holding UUID strings; store them natively
+        if conn.dialect.name == "postgresql":
+            conn.execute(
+                text(
+                    """
+                    DO $$
+                    DECLARE
+                        target RECORD;
+                    BEGIN
+                        FOR target IN
+                            SELECT table_name, column_name
+                            FROM information_schema.columns
+                            WHERE table_schema = current_schema()
+                              AND (table_name, column_name) IN (
+                                  ('wait_notes', 'note_id'),
+                                  ('wait_suggestions', 'suggestion_id'),
+                                  ('wait_votes', 'vote_id')
+                              )
+                              AND data_type <> 'uuid'
+                        LOOP
+                            EXECUTE format(
+                                'ALTER TABLE %I ALTER COLUMN %I TYPE uuid USING %I::uuid',
+                                target.table_name, target.column_name, target.column_name
+                            );
+                        END LOOP;
+                    END $$;
+                    """
+                )
+            )
+        
         # Phase 4.6 upgrades (admin auth with Clerk JWT support)
         try:
             conn.execute(
@@ -501,19 +576,20 @@ ring_clerk_sync = Table(
 wait_notes = Table(
     'wait_notes',
     metadata,
-    Column('note_id', String(100), primary_key=True),
+    Column('note_id', Uuid(as_uuid=False), primary_key=True),
     Column('draft_id', String(100), nullable=False, index=True),
     Column('author_user_id', String(100), nullable=False, index=True),
     Column('content', Text, nullable=False),
     Column('created_at', DateTime(timezone=True), server_default=func.now(), nullable=False),
     Column('updated_at', DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False),
-    Index('idx_wait_notes_draft_author', 'draft_id', 'author_user_id'),
+    # Matches list_notes: filter (draft_id, author_user_id), newest first
+    Index('idx_wait_notes_draft_author_created', 'draft_id', 'author_user_id', 'created_at'),
 )
 
 wait_suggestions = Table(
     'wait_suggestions',
     metadata,
-    Column('suggestion_id', String(100), primary_key=True),
+    Column('suggestion_id', Uuid(as_uuid=False), primary_key=True),
     Column('draft_id', String(100), nullable=False, index=True),
     Column('author_user_id', String(100), nullable=False, index=True),
     Column('kind', String(50), nullable=False),
@@ -523,18 +599,22 @@ wait_suggestions = Table(
     Column('consumed_at', DateTime(timezone=True), nullable=True),
     Column('consumed_by_user_id', String(100), nullable=True),
     Column('consumed_segment_id', String(100), nullable=True),
-    Index('idx_wait_suggestions_draft_author', 'draft_id', 'author_user_id'),
+    # Matches list_suggestions: filter (draft_id, author_user_id[, status]), newest first
+    Index('idx_wait_suggestions_draft_author_status_created', 'draft_id', 'author_user_id', 'status', 'created_at'),
 )
 
 wait_votes = Table(
     'wait_votes',
     metadata,
-    Column('vote_id', String(100), primary_key=True),
-    Column('draft_id', String(100), nullable=False, index=True),
-    Column('segment_id', String(100), nullable=False, index=True),
-    Column('voter_user_id', String(100), nullable=False, index=True),
+    Column('vote_id', Uuid(as_uuid=False), primary_key=True),
+    Column('draft_id', String(100), nullable=False),
+    Column('segment_id', String(100), nullable=False),
+    Column('voter_user_id', String(100), nullable=False),
     Column('value', Integer, nullable=False),
     Column('created_at', DateTime(timezone=True), server_default=func.now(), nullable=False),
+    # Votes are the hottest wait mode write: keep only the indexes reads use
+    # (upsert conflict target, per-draft aggregates), since every vote
+    # touches each one.
     UniqueConstraint('segment_id', 'voter_user_id', name='uq_segment_voter'),
     Index('idx_wait_votes_draft', 'draft_id'),
 )
@@ -588,8 +668,12 @@ usage_events = Table(
     Column('usage_key', String(100), nullable=False),
     Column('occurred_at', DateTime(timezone=True), nullable=False),
     Column('metadata', JSON, nullable=True),
-    # Composite index for usage queries: (user_id, usage_key, occurred_at)
-    Index('idx_usage_events_user_key_occurred', 'user_id', 'usage_key', 'occurred_at'),
+    # Composite index for usage queries: (user_id, usage_key, occurred_at).
+    # metadata is carried in the leaf so event listings are index-only scans.
+    Index(
+        'ix_usage_events_user_key_time', 'user_id', 'usage_key', 'occurred_at',
+        postgresql_include=['metadata'],
+    ),
     # Index for time-range queries
     Index('idx_usage_events_occurred_at', 'occurred_at'),
 )
@@ -1,29 +1,47 @@
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
+
+from starlette.requests import Request
 
 from backend.core.metrics import http_requests_total, normalize_path
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Record HTTP request metrics (Prometheus-style)."""
+class MetricsMiddleware:
+    """Record HTTP request metrics (Prometheus-style).
+
+    Pure ASGI: the status code is read off `http.response.start` by wrapping
+    `send`; the response body is never buffered.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request, call_next):
         start = time.perf_counter()
-        response = await call_next(request)
+        status_code = 0
+
+        async def send_capturing_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_capturing_status)
         duration_ms = (time.perf_counter() - start) * 1000
-        _record_request_metric(request, response, duration_ms)
-        return response
+        _record_request_metric(Request(scope), status_code, duration_ms)
 
 
-def _record_request_metric(request, response, duration_ms: float) -> None:
+def _record_request_metric(request, status_code: int, duration_ms: float) -> None:
     try:
         method = request.method.upper()
         path = normalize_path(request.url.path)
-        status = getattr(response, "status_code", None) or 0
         http_requests_total.inc(labels={
             "method": method,
             "path": path,
-            "status": str(status),
+            "status": str(status_code or 0),
         })
     except Exception:
         # Do not fail the request on metrics errors
@@ -3,7 +3,6 @@ import time
 from dataclasses import dataclass
 from typing import Optional, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
 from backend.core.errors import RateLimitError, app_error_handler
@@ -18,11 +17,11 @@ class RoutePolicy:
     burst: int
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Token-bucket rate limiting middleware (opt-in via env)."""
+class RateLimitMiddleware:
+    """Token-bucket rate limiting middleware (opt-in via env, pure ASGI)."""
 
     def __init__(self, app, *, config: Optional[RateLimitConfig] = None, env: Optional[dict] = None, time_fn: Optional[Callable[[], float]] = None):
-        super().__init__(app)
+        self.app = app
         self.config = config or build_rate_limit_config_from_env(env or os.environ)
         self.limiter = InMemoryRateLimiter(self.config, time_fn=time_fn or time.monotonic)
         if hasattr(app, "state"):
@@ -54,20 +53,24 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         ip = request.headers.get("x-forwarded-for") or (request.client.host if request.client else "unknown")
         return f"ip:{ip}:{category}"
 
-    async def dispatch(self, request: Request, call_next):
-        if not self.config.enabled:
-            return await call_next(request)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.config.enabled:
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope, receive)
         policy = self._policy_for_request(request)
         if not policy:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         category = "mutation" if request.method.upper() in {"POST", "PUT", "PATCH", "DELETE"} else "read"
         key = self._client_key(request, category)
 
         allowed = self.limiter.allow(key, per_minute=policy.per_minute, burst=policy.burst)
         if allowed:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         rid = getattr(request.state, "request_id", None) or get_request_id()
         ratelimit_block_total.inc(labels={"scope": normalize_path(request.url.path)})
@@ -81,4 +84,4 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response.headers["X-RateLimit-Limit"] = str(policy.per_minute)
         response.headers["X-RateLimit-Remaining"] = "0"
         response.headers["X-RateLimit-Reset"] = "60"
-        return response
+        await response(scope, receive, send)
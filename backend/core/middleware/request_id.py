@@ -2,29 +2,46 @@ import logging
 import time
 from uuid import uuid4
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
 
 from backend.core.logging import request_id_ctx_var, latency_bucket_ms, get_request_id
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    """Attach a request_id to each request and log completion."""
+class RequestIdMiddleware:
+    """Attach a request_id to each request and log completion.
+
+    Pure ASGI: headers are added by wrapping `send`, so response bodies
+    (including SSE streams) pass through untouched.
+    """
 
     def __init__(self, app, header_name: str = "x-request-id"):
-        super().__init__(app)
+        self.app = app
         self.header_name = header_name
 
-    async def dispatch(self, request, call_next):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         incoming = request.headers.get(self.header_name)
         rid = incoming or str(uuid4())
         request.state.request_id = rid
         token = request_id_ctx_var.set(rid)
 
         start = time.perf_counter()
-        response = await call_next(request)
-        duration_ms = (time.perf_counter() - start) * 1000
+        response_start = {}
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                # Latency is time to response headers, as before
+                response_start["status"] = message["status"]
+                response_start["duration_ms"] = (time.perf_counter() - start) * 1000
+                MutableHeaders(scope=message)[self.header_name] = rid
+            await send(message)
 
-        response.headers[self.header_name] = rid
+        await self.app(scope, receive, send_with_request_id)
 
         logger = logging.getLogger("onering")
         logger.info(
@@ -33,11 +50,12 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
                 "request_id": rid,
                 "path": request.url.path,
                 "method": request.method,
-                "status": getattr(response, "status_code", None),
-                "latency_bucket": latency_bucket_ms(duration_ms),
+                "status": response_start.get("status"),
+                "latency_bucket": latency_bucket_ms(
+                    response_start.get("duration_ms", (time.perf_counter() - start) * 1000)
+                ),
                 "user_id": getattr(request.state, "user_id", None),
             },
         )
 
         request_id_ctx_var.reset(token)
-        return response
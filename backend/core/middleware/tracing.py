@@ -1,13 +1,21 @@
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
 
 from backend.core.tracing import start_span
 from backend.core.logging import get_request_id
 
 
-class TracingMiddleware(BaseHTTPMiddleware):
-    """Create an HTTP span if tracing is enabled."""
+class TracingMiddleware:
+    """Create an HTTP span if tracing is enabled (pure ASGI)."""
 
-    async def dispatch(self, request, call_next):
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         request_id = getattr(request.state, "request_id", None) or get_request_id()
         with start_span(
             "http.request",
@@ -17,5 +25,4 @@ class TracingMiddleware(BaseHTTPMiddleware):
                 "request_id": request_id,
             },
         ):
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import Dict, Optional
 
 from backend.core.config import settings
@@ -54,11 +54,18 @@ def setup_tracing(enabled: Optional[bool] = None, exporter_name: Optional[str] =
     _tracer = trace.get_tracer("onering")
 
 
-@contextmanager
+# Shared no-op context for the disabled path; nullcontext is reusable.
+_NOOP_SPAN = nullcontext(None)
+
+
 def start_span(name: str, attributes: Optional[Dict[str, object]] = None):
     if not _enabled or _tracer is None:
-        yield None
-        return
+        return _NOOP_SPAN
+    return _recording_span(name, attributes)
+
+
+@contextmanager
+def _recording_span(name: str, attributes: Optional[Dict[str, object]]):
     span = _tracer.start_span(name)
     if attributes:
         for k, v in attributes.items():
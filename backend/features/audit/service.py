@@ -1,9 +1,13 @@
+import atexit
+import queue
 import random
 import logging
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
 from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from backend.core.config import settings
 from backend.core.database import audit_events, get_db_session, get_database_url
@@ -12,6 +16,12 @@ logger = logging.getLogger(__name__)
 
 _memory_events = []  # Fallback buffer when DB is unavailable
 
+# AUDIT_ASYNC: bounded queue drained by one daemon writer in batches
+AUDIT_BATCH_SIZE = 500
+_audit_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=settings.AUDIT_QUEUE_MAXSIZE)
+_audit_worker: Optional[threading.Thread] = None
+_audit_worker_lock = threading.Lock()
+
 
 def _safe_truncate(value: Any, limit: int = 500):
     try:
@@ -36,6 +46,46 @@ def _should_sample() -> bool:
     return random.random() <= rate_val
 
 
+def _write_audit_records(records: List[Dict[str, Any]]) -> None:
+    try:
+        with get_db_session() as session:
+            session.execute(insert(audit_events), records)
+    except Exception as exc:
+        logger.warning(f"Audit event write failed: {exc}")
+        _memory_events.extend(records)
+
+
+def _drain_audit_queue() -> None:
+    while True:
+        batch = [_audit_queue.get()]
+        while len(batch) < AUDIT_BATCH_SIZE:
+            try:
+                batch.append(_audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_audit_records(batch)
+        finally:
+            for _ in batch:
+                _audit_queue.task_done()
+
+
+def _ensure_audit_worker() -> None:
+    global _audit_worker
+    if _audit_worker is not None:
+        return
+    with _audit_worker_lock:
+        if _audit_worker is None:
+            _audit_worker = threading.Thread(target=_drain_audit_queue, name="audit-writer", daemon=True)
+            _audit_worker.start()
+            atexit.register(flush_audit_events)
+
+
+def flush_audit_events() -> None:
+    """Block until every queued audit event has been written (AUDIT_ASYNC)."""
+    _audit_queue.join()
+
+
 def record_audit_event(
     *,
     action: str,
@@ -45,11 +95,16 @@ def record_audit_event(
     metadata: Optional[Dict[str, Any]] = None,
     ip: Optional[str] = None,
     user_agent: Optional[str] = None,
+    session: Optional[Session] = None,
 ):
     """Record an audit event to the database (or fallback buffer).
 
     Notes:
     - Respects AUDIT_ENABLED and AUDIT_SAMPLE_RATE.
+    - With AUDIT_ASYNC the write is queued for the background writer
+      (see flush_audit_events); a full queue falls back to a direct write.
+    - Pass the caller's session to write inside its transaction (one
+      commit); a savepoint keeps audit failures from aborting it.
     - Never logs secrets; metadata is truncated.
     """
 
@@ -74,18 +129,31 @@ def record_audit_event(
         "user_agent": _safe_truncate(user_agent) if user_agent else None,
     }
 
+    if session is not None:
+        try:
+            with session.begin_nested():
+                session.execute(insert(audit_events).values(**record))
+        except Exception as exc:
+            logger.warning(f"Audit event write failed: {exc}")
+            _memory_events.append(record)
+        return
+
     db_url = get_database_url()
     if not db_url:
         _memory_events.append(record)
         logger.debug("Audit event buffered in memory (no DB configured)")
         return
 
-    try:
-        with get_db_session() as session:
-            session.execute(insert(audit_events).values(**record))
-    except Exception as exc:
-        logger.warning(f"Audit event write failed: {exc}")
-        _memory_events.append(record)
+    if settings.AUDIT_ASYNC:
+        _ensure_audit_worker()
+        try:
+            _audit_queue.put_nowait(record)
+            return
+        except queue.Full:
+            # Never drop audit events; write this one inline instead
+            pass
+
+    _write_audit_records([record])
 
 
 def get_buffered_audit_events():
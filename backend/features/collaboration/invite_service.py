@@ -290,6 +290,8 @@ def accept_invite(
         draft = _drafts_store.get(invite.draft_id)
         if draft and user_id not in draft.collaborators:
             draft.collaborators.append(user_id)
+    from backend.features.collaboration.service import invalidate_draft_access
+    invalidate_draft_access(invite.draft_id)
 
     # Phase 4.1: Emit usage event (for the inviter, not the accepter)
     try:
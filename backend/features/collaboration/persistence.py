@@ -7,12 +7,14 @@ Replaces in-memory _drafts_store with database-backed storage.
 Maintains exact same API contract as service.py.
 """
 
-from typing import Optional, List, Dict
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Set
 from datetime import datetime, timezone
 import json
 import hashlib
-from sqlalchemy import select, insert, update, delete, and_
+from sqlalchemy import select, insert, update, delete, and_, or_, exists
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 from backend.core.database import (
     get_db_session,
@@ -103,17 +105,18 @@ class DraftPersistence:
             return False
     
     @staticmethod
-    def get_draft(draft_id: str) -> Optional[CollabDraft]:
+    def get_draft(draft_id: str, session: Optional[Session] = None) -> Optional[CollabDraft]:
         """
         Retrieve draft from database.
         
         Args:
             draft_id: Draft UUID
+            session: Optional open session to reuse (caller owns commit/close)
         
         Returns:
             CollabDraft instance or None if not found
         """
-        with get_db_session() as session:
+        with (nullcontext(session) if session is not None else get_db_session()) as session:
             # Fetch draft
             draft_result = session.execute(
                 select(drafts).where(drafts.c.id == draft_id)
@@ -205,6 +208,28 @@ class DraftPersistence:
             
             return draft
     
+    @staticmethod
+    def filter_member_drafts(draft_ids: List[str], user_id: str) -> Set[str]:
+        """
+        Return the subset of draft_ids the user created or collaborates on.
+        
+        One query regardless of how many drafts are checked.
+        """
+        if not draft_ids:
+            return set()
+        with get_db_session() as session:
+            is_collaborator = exists().where(and_(
+                draft_collaborators.c.draft_id == drafts.c.id,
+                draft_collaborators.c.user_id == user_id,
+            ))
+            result = session.execute(
+                select(drafts.c.id).where(and_(
+                    drafts.c.id.in_(list(draft_ids)),
+                    or_(drafts.c.created_by == user_id, is_collaborator),
+                ))
+            )
+            return {row.id for row in result}
+    
     @staticmethod
     def list_drafts_by_user(user_id: str) -> List[CollabDraft]:
         """
@@ -6,9 +6,13 @@ All operations emit events following .ai/events.md pattern.
 
 import uuid
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple, FrozenSet, NamedTuple
 import hashlib
+from sqlalchemy.orm import Session
 from backend.models.collab import (
     CollabDraft,
     CollabDraftRequest,
@@ -35,6 +39,16 @@ _smart_pass_idempotency: Dict[str, Dict[str, Any]] = {}
 _drafts_store: Dict[str, CollabDraft] = {}
 _idempotency_keys: set = set()  # Track seen idempotency keys
 
+# Per-process cache of the permission-relevant draft fields, keyed by draft_id.
+# Entries expire after DRAFT_ACCESS_CACHE_TTL_SECONDS; membership and ring
+# mutations in this process drop the draft's entry and bump one process-wide
+# version, which rejects any lookup that was already in flight when the
+# mutation landed (a single counter, so memory stays bounded by the cache).
+_ACCESS_CACHE_MAXSIZE = 10_000
+_access_cache: "OrderedDict[str, Tuple[DraftAccess, float]]" = OrderedDict()
+_access_version = 0
+_access_lock = threading.Lock()
+
 # Persistence layer selector
 def _use_persistence() -> bool:
     """Check if we should use DB persistence."""
@@ -279,18 +293,24 @@ def create_draft(user_id: str, request: CollabDraftRequest) -> CollabDraft:
         return draft
 
 
-def get_draft(draft_id: str, compute_metrics_flag: bool = True, now: Optional[datetime] = None) -> Optional[CollabDraft]:
+def get_draft(
+    draft_id: str,
+    compute_metrics_flag: bool = True,
+    now: Optional[datetime] = None,
+    session: Optional[Session] = None,
+) -> Optional[CollabDraft]:
     """Fetch draft by ID, optionally with computed metrics (Phase 3.3a)
     
     Args:
         draft_id: Draft UUID
         compute_metrics_flag: If True, compute and attach metrics
         now: Optional fixed timestamp for deterministic testing
+        session: Optional open session for the persistence lookup
     """
     # Get draft from persistence or in-memory
     persistence = _get_persistence()
     if persistence:
-        draft = persistence.get_draft(draft_id)
+        draft = persistence.get_draft(draft_id, session=session)
     else:
         draft = _drafts_store.get(draft_id)
     if not draft:
@@ -318,6 +338,74 @@ def get_draft(draft_id: str, compute_metrics_flag: bool = True, now: Optional[da
     return draft
 
 
+class DraftAccess(NamedTuple):
+    """Fields of a draft that access checks need (no segments or metrics)."""
+
+    creator_id: str
+    collaborators: FrozenSet[str]
+    ring_holder_id: str
+    version: int
+
+    def is_member(self, user_id: str) -> bool:
+        return user_id == self.creator_id or user_id in self.collaborators
+
+
+def invalidate_draft_access(draft_id: str) -> None:
+    """Drop the cached access entry for a draft after membership or ring changes."""
+    global _access_version
+    with _access_lock:
+        _access_version += 1
+        _access_cache.pop(draft_id, None)
+
+
+def get_draft_access(draft_id: str, session: Optional[Session] = None) -> Optional[DraftAccess]:
+    """Return creator, collaborators and ring holder for a draft, from cache when fresh.
+    
+    Other workers' mutations are only seen once the entry expires, so
+    staleness across processes is bounded by DRAFT_ACCESS_CACHE_TTL_SECONDS.
+    """
+    ttl = settings.DRAFT_ACCESS_CACHE_TTL_SECONDS
+    now = time.monotonic()
+    with _access_lock:
+        version = _access_version
+        entry = _access_cache.get(draft_id)
+        if entry is not None and entry[1] > now:
+            _access_cache.move_to_end(draft_id)
+            return entry[0]
+
+    draft = get_draft(draft_id, compute_metrics_flag=False, session=session)
+    if not draft:
+        return None
+    access = DraftAccess(
+        creator_id=draft.creator_id,
+        collaborators=frozenset(draft.collaborators),
+        ring_holder_id=draft.ring_state.current_holder_id,
+        version=version,
+    )
+    if ttl > 0:
+        with _access_lock:
+            # A mutation since the lookup started makes this result stale
+            if _access_version == version:
+                _access_cache[draft_id] = (access, now + ttl)
+                _access_cache.move_to_end(draft_id)
+                while len(_access_cache) > _ACCESS_CACHE_MAXSIZE:
+                    _access_cache.popitem(last=False)
+    return access
+
+
+def filter_member_drafts(draft_ids: List[str], user_id: str) -> Set[str]:
+    """Return the draft_ids the user created or collaborates on (bulk access check)."""
+    persistence = _get_persistence()
+    if persistence:
+        return persistence.filter_member_drafts(draft_ids, user_id)
+    allowed = set()
+    for draft_id in draft_ids:
+        draft = _drafts_store.get(draft_id)
+        if draft and (draft.creator_id == user_id or user_id in draft.collaborators):
+            allowed.add(draft_id)
+    return allowed
+
+
 def list_drafts(user_id: str) -> List[CollabDraft]:
     """List all drafts involving user (as creator or contributor)"""
     persistence = _get_persistence()
@@ -561,6 +649,7 @@ def pass_ring(draft_id: str, from_user_id: str, request: RingPassRequest) -> Col
         else:
             _drafts_store[draft_id] = updated_draft
             _idempotency_keys.add(request.idempotency_key)
+        invalidate_draft_access(draft_id)
 
         record_audit_event(
             action="collab.pass_ring",
@@ -812,6 +901,7 @@ def add_collaborator(draft_id: str, creator_user_id: str, collaborator_id: str,
         else:
             # In-memory fallback
             pass
+        invalidate_draft_access(draft_id)
 
         record_audit_event(
             action="collab.add_collaborator",
@@ -922,9 +1012,12 @@ def generate_share_card(draft_id: str, now: Optional[datetime] = None) -> dict:
 
 def clear_store() -> None:
     """Clear all data (testing only)"""
-    global _drafts_store, _idempotency_keys
+    global _drafts_store, _idempotency_keys, _access_version
     persistence = _get_persistence()
     if persistence:
         persistence.clear_all()
     _drafts_store.clear()
     _idempotency_keys.clear()
+    with _access_lock:
+        _access_cache.clear()
+        _access_version += 1
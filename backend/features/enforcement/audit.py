@@ -55,60 +55,70 @@ def _extract_output(decision_json: object) -> dict:
     return {}
 
 
+def _latest_qa_output_by_request_id(session, request_id: str) -> Optional[dict]:
+    stmt = (
+        select(audit_agent_decisions.c.decision_json)
+        .where(
+            audit_agent_decisions.c.request_id == request_id,
+            audit_agent_decisions.c.agent_name == QA_AGENT_NAME,
+        )
+        .order_by(audit_agent_decisions.c.created_at.desc())
+        .limit(1)
+    )
+    row = session.execute(stmt).fetchone()
+    if not row:
+        return None
+    return _extract_output(row[0] or {})
+
+
+def _latest_qa_output_by_receipt_id(session, receipt_id: str) -> Optional[dict]:
+    stmt = text(
+        """
+        SELECT decision_json
+        FROM audit_agent_decisions
+        WHERE agent_name = :agent_name
+          AND (
+            decision_json->'receipt'->>'receipt_id' = :receipt_id
+            OR decision_json->'output'->'receipt'->>'receipt_id' = :receipt_id
+          )
+        ORDER BY created_at DESC
+        LIMIT 1
+        """
+    )
+    row = session.execute(
+        stmt,
+        {"agent_name": QA_AGENT_NAME, "receipt_id": receipt_id},
+    ).fetchone()
+    if not row:
+        return None
+    return _extract_output(row[0] or {})
+
+
+def _receipt_from_output(output: Optional[dict]) -> Optional[EnforcementReceipt]:
+    receipt_payload = output.get("receipt") if isinstance(output, dict) else None
+    if not receipt_payload:
+        return None
+    return EnforcementReceipt.model_validate(receipt_payload)
+
+
+def _qa_from_output(output: Optional[dict]) -> Optional[dict]:
+    qa = output.get("qa") if isinstance(output, dict) else None
+    return qa if isinstance(qa, dict) else None
+
+
 def _get_receipt_by_request_id(request_id: str) -> Optional[EnforcementReceipt]:
     # Option 1: derive enforcement receipts from QA records in audit_agent_decisions.
     if not request_id:
         return None
     with get_db_session() as session:
-        stmt = (
-            select(audit_agent_decisions.c.decision_json)
-            .where(
-                audit_agent_decisions.c.request_id == request_id,
-                audit_agent_decisions.c.agent_name == QA_AGENT_NAME,
-            )
-            .order_by(audit_agent_decisions.c.created_at.desc())
-            .limit(1)
-        )
-        row = session.execute(stmt).fetchone()
-        if not row:
-            return None
-        decision_json = row[0] or {}
-        output = _extract_output(decision_json)
-        receipt_payload = output.get("receipt") if isinstance(output, dict) else None
-        if not receipt_payload:
-            return None
-        return EnforcementReceipt.model_validate(receipt_payload)
+        return _receipt_from_output(_latest_qa_output_by_request_id(session, request_id))
 
 
 def _get_receipt_by_receipt_id(receipt_id: str) -> Optional[EnforcementReceipt]:
     if not receipt_id:
         return None
     with get_db_session() as session:
-        stmt = text(
-            """
-            SELECT decision_json
-            FROM audit_agent_decisions
-            WHERE agent_name = :agent_name
-              AND (
-                decision_json->'receipt'->>'receipt_id' = :receipt_id
-                OR decision_json->'output'->'receipt'->>'receipt_id' = :receipt_id
-              )
-            ORDER BY created_at DESC
-            LIMIT 1
-            """
-        )
-        row = session.execute(
-            stmt,
-            {"agent_name": QA_AGENT_NAME, "receipt_id": receipt_id},
-        ).fetchone()
-        if not row:
-            return None
-        decision_json = row[0] or {}
-        output = _extract_output(decision_json)
-        receipt_payload = output.get("receipt") if isinstance(output, dict) else None
-        if not receipt_payload:
-            return None
-        return EnforcementReceipt.model_validate(receipt_payload)
+        return _receipt_from_output(_latest_qa_output_by_receipt_id(session, receipt_id))
 
 
 def resolve_qa_details(
@@ -117,49 +127,16 @@ def resolve_qa_details(
     receipt_id: Optional[str],
 ) -> tuple[Optional[dict], Optional[str]]:
     try:
-        if receipt_id:
-            receipt = _get_receipt_by_receipt_id(receipt_id)
-            if receipt:
-                with get_db_session() as session:
-                    stmt = text(
-                        """
-                        SELECT decision_json
-                        FROM audit_agent_decisions
-                        WHERE agent_name = :agent_name
-                          AND (
-                            decision_json->'receipt'->>'receipt_id' = :receipt_id
-                            OR decision_json->'output'->'receipt'->>'receipt_id' = :receipt_id
-                          )
-                        ORDER BY created_at DESC
-                        LIMIT 1
-                        """
-                    )
-                    row = session.execute(
-                        stmt,
-                        {"agent_name": QA_AGENT_NAME, "receipt_id": receipt_id},
-                    ).fetchone()
-                    if row:
-                        output = _extract_output(row[0] or {})
-                        qa = output.get("qa") if isinstance(output, dict) else None
-                        if isinstance(qa, dict):
-                            return qa, None
-        if request_id:
-            with get_db_session() as session:
-                stmt = (
-                    select(audit_agent_decisions.c.decision_json)
-                    .where(
-                        audit_agent_decisions.c.request_id == request_id,
-                        audit_agent_decisions.c.agent_name == QA_AGENT_NAME,
-                    )
-                    .order_by(audit_agent_decisions.c.created_at.desc())
-                    .limit(1)
-                )
-                row = session.execute(stmt).fetchone()
-                if row:
-                    output = _extract_output(row[0] or {})
-                    qa = output.get("qa") if isinstance(output, dict) else None
-                    if isinstance(qa, dict):
-                        return qa, None
+        with get_db_session() as session:
+            if receipt_id:
+                output = _latest_qa_output_by_receipt_id(session, receipt_id)
+                qa = _qa_from_output(output) if _receipt_from_output(output) else None
+                if qa is not None:
+                    return qa, None
+            if request_id:
+                qa = _qa_from_output(_latest_qa_output_by_request_id(session, request_id))
+                if qa is not None:
+                    return qa, None
         return None, "ENFORCEMENT_RECEIPT_INVALID"
     except Exception as exc:
         logger.warning("qa detail lookup failed: %s", exc)
@@ -181,3 +158,38 @@ def resolve_receipt(
     except Exception as exc:
         logger.warning("receipt lookup failed: %s", exc)
         return None, "AUDIT_WRITE_FAILED"
+
+
+def resolve_receipt_with_qa(
+    *,
+    request_id: Optional[str],
+    receipt_id: Optional[str],
+) -> tuple[Optional[EnforcementReceipt], Optional[dict], Optional[str]]:
+    """
+    resolve_receipt + resolve_qa_details over the same QA decision row.
+
+    Returns (receipt, qa_details, error_code). The receipt and QA details live
+    in the same audit_agent_decisions record, so the common case is one query;
+    the request_id lookup only runs when the receipt_id row is missing either.
+    """
+    try:
+        receipt = None
+        qa_details = None
+        with get_db_session() as session:
+            if receipt_id:
+                output = _latest_qa_output_by_receipt_id(session, receipt_id)
+                receipt = _receipt_from_output(output)
+                if receipt is not None:
+                    qa_details = _qa_from_output(output)
+            if (receipt is None or qa_details is None) and request_id:
+                output = _latest_qa_output_by_request_id(session, request_id)
+                if receipt is None:
+                    receipt = _receipt_from_output(output)
+                if qa_details is None:
+                    qa_details = _qa_from_output(output)
+        if receipt is None:
+            return None, None, "ENFORCEMENT_RECEIPT_INVALID"
+        return receipt, qa_details, None
+    except Exception as exc:
+        logger.warning("receipt lookup failed: %s", exc)
+        return None, None, "AUDIT_WRITE_FAILED"
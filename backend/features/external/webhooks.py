@@ -10,11 +10,13 @@ import hashlib
 import json
 import secrets
 import uuid
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Tuple
 
 import httpx
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session
 
@@ -234,6 +236,61 @@ def enqueue_webhook_event(db: Session, event_type: str, payload: Dict, user_id:
     return event_id, delivery_count
 
 
+def enqueue_webhook_events(db: Session, events: List[Dict]) -> List[Tuple[str, int]]:
+    """Bulk form of enqueue_webhook_event: one statement for all events and their deliveries.
+
+    Each item is a dict with event_type, payload and optional user_id / event_id.
+    Returns (event_id, delivery_count) per item, in input order.
+    """
+    if not events:
+        return []
+    if not is_webhooks_enabled():
+        return [(event.get("event_id") or f"evt_{secrets.token_hex(16)}", 0) for event in events]
+
+    event_timestamp = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": event.get("event_id") or str(uuid.uuid4()),
+            "event_type": event["event_type"],
+            "user_id": event.get("user_id"),
+            "payload": event["payload"],
+        }
+        for event in events
+    ]
+
+    # Same matching rule as enqueue_webhook_event: owner-scoped when the
+    # event has a user, otherwise every active subscriber to the type.
+    result = db.execute(
+        text(
+            """
+            WITH src AS (
+                SELECT e.id, e.event_type, e.user_id, e.payload
+                FROM jsonb_to_recordset(:rows) AS e(id UUID, event_type TEXT, user_id TEXT, payload JSONB)
+            ),
+            ev AS (
+                INSERT INTO webhook_events (id, event_type, user_id, payload, created_at)
+                SELECT id, event_type, user_id, payload, :created_at
+                FROM src
+                ON CONFLICT (id) DO NOTHING
+            )
+            INSERT INTO webhook_deliveries
+            (webhook_id, event_id, event_type, status, attempts, payload, next_attempt_at, event_timestamp)
+            SELECT w.id, src.id::text, src.event_type, 'pending', 0, src.payload, :created_at, :created_at
+            FROM src
+            JOIN external_webhooks w
+              ON w.is_active = true
+             AND src.event_type = ANY(w.events)
+             AND (src.user_id IS NULL OR w.owner_user_id = src.user_id)
+            RETURNING event_id
+            """
+        ).bindparams(bindparam("rows", type_=JSONB)),
+        {"rows": rows, "created_at": event_timestamp},
+    )
+    delivery_counts = Counter(event_id for (event_id,) in result)
+    db.commit()
+    return [(row["id"], delivery_counts[row["id"]]) for row in rows]
+
+
 async def deliver_webhook(db: Session, delivery_id: str) -> bool:
     """Attempt a single delivery with retries/backoff. Returns True on success."""
     if not is_delivery_enabled():
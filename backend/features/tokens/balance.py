@@ -15,6 +15,86 @@ from backend.features.tokens.ledger import get_token_issuance_mode, get_user_led
 from backend.features.tokens.reconciliation import get_reconciliation_summary
 
 
+# Statements are built once at import so every call reuses the same TextClause
+# (and its SQLAlchemy compiled-cache entry) instead of re-parsing bind params.
+_SQL_BALANCE_STATE = text(
+    """
+    SELECT
+        u."ringBalance" AS legacy_balance,
+        p.total AS pending_total,
+        p.count AS pending_count,
+        p.last_at AS last_pending_at,
+        -- ledger_balance / ledger_last_at / shadow_delta are maintained by the
+        -- ring_ledger triggers (and seeded from history when the users row is
+        -- inserted); only ledger rows without a users row (legacy test data,
+        -- deleted accounts) fall back to scanning history.
+        CASE WHEN u."clerkId" IS NOT NULL THEN u.ledger_balance ELSE (
+            SELECT balance_after FROM ring_ledger
+            WHERE user_id = :user_id ORDER BY created_at DESC LIMIT 1
+        ) END AS ledger_balance,
+        CASE WHEN u."clerkId" IS NOT NULL THEN u.ledger_last_at ELSE (
+            SELECT MAX(created_at) FROM ring_ledger WHERE user_id = :user_id
+        ) END AS last_ledger_at,
+        CASE
+            WHEN :mode <> 'shadow' THEN 0
+            WHEN u."clerkId" IS NOT NULL THEN u.shadow_delta
+            ELSE (
+                SELECT COALESCE(SUM(amount), 0)
+                FROM ring_ledger
+                WHERE user_id = :user_id
+                  AND event_type IN ('SPEND', 'PENALTY', 'ADJUSTMENT')
+            )
+        END AS shadow_delta,
+        g.user_id IS NOT NULL AS has_guardrails,
+        g.daily_earn_count, g.daily_earn_total, g.last_earn_at, g.reset_at, g.updated_at,
+        c.last_sync_at, c.last_error, c.last_error_at
+    FROM (
+        SELECT COALESCE(SUM(amount), 0) AS total, COUNT(*) AS count, MAX(created_at) AS last_at
+        FROM ring_pending
+        WHERE user_id = :user_id AND status = 'pending'
+    ) p
+    LEFT JOIN LATERAL (
+        SELECT "clerkId", "ringBalance", ledger_balance, ledger_last_at, shadow_delta
+        FROM users
+        WHERE "clerkId" = :user_id
+        LIMIT 1
+    ) u ON true
+    LEFT JOIN ring_guardrails_state g ON g.user_id = :user_id
+    LEFT JOIN ring_clerk_sync c ON c.user_id = :user_id
+    """
+)
+
+_SQL_PUBLISH_EVENTS_JSON = text(
+    """
+    SELECT COALESCE(
+        json_agg(
+            json_build_object(
+                'event_id', pe.id,
+                'platform', pe.platform,
+                'published_at', to_char(pe.published_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'),
+                'platform_post_id', pe.platform_post_id,
+                'token_mode', pe.token_mode,
+                'token_issued_amount', pe.token_issued_amount,
+                'token_pending_amount', pe.token_pending_amount,
+                'token_reason_code', pe.token_reason_code,
+                'created_at', to_char(pe.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"')
+            )
+            ORDER BY pe.created_at DESC
+        ),
+        '[]'::json
+    )
+    FROM (
+        SELECT id, platform, published_at, platform_post_id, token_mode,
+               token_issued_amount, token_pending_amount, token_reason_code, created_at
+        FROM publish_events
+        WHERE user_id = :user_id
+        ORDER BY created_at DESC
+        LIMIT :limit
+    ) pe
+    """
+)
+
+
 def assert_legacy_ring_writes_allowed() -> tuple[bool, str]:
     """Return (allowed, mode). Legacy writes are blocked in shadow/live."""
     mode = get_token_issuance_mode()
@@ -29,123 +109,41 @@ def _iso(value: Optional[datetime]) -> Optional[str]:
     return value.isoformat()
 
 
-def _get_legacy_balance(db: Session, user_id: str) -> int:
-    row = db.execute(
-        text('SELECT "ringBalance" FROM users WHERE "clerkId" = :user_id'),
-        {"user_id": user_id},
-    ).fetchone()
-    return int(row[0]) if row else 0
-
-
-def _get_pending_summary(db: Session, user_id: str) -> tuple[int, int, Optional[datetime]]:
-    row = db.execute(
-        text(
-            """
-            SELECT COALESCE(SUM(amount), 0) AS total, COUNT(*), MAX(created_at) AS last_at
-            FROM ring_pending
-            WHERE user_id = :user_id AND status = 'pending'
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
-    if not row:
-        return 0, 0, None
-    return int(row[0] or 0), int(row[1] or 0), row[2]
-
-
-def _get_last_ledger_state(db: Session, user_id: str) -> tuple[Optional[int], Optional[datetime]]:
-    row = db.execute(
-        text(
-            """
-            SELECT balance_after, created_at
-            FROM ring_ledger
-            WHERE user_id = :user_id
-            ORDER BY created_at DESC
-            LIMIT 1
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
-    if not row:
-        return None, None
-    return int(row[0]) if row[0] is not None else None, row[1]
-
-
-def _get_shadow_ledger_delta(db: Session, user_id: str) -> int:
-    row = db.execute(
-        text(
-            """
-            SELECT COALESCE(SUM(amount), 0)
-            FROM ring_ledger
-            WHERE user_id = :user_id
-              AND event_type IN ('SPEND', 'PENALTY', 'ADJUSTMENT')
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
-    return int(row[0] or 0) if row else 0
-
-
-def _get_guardrails_state(db: Session, user_id: str) -> Optional[Dict[str, Optional[str]]]:
-    row = db.execute(
-        text(
-            """
-            SELECT daily_earn_count, daily_earn_total, last_earn_at, reset_at, updated_at
-            FROM ring_guardrails_state
-            WHERE user_id = :user_id
-            LIMIT 1
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
-    if not row:
-        return None
-    return {
-        "daily_earn_count": int(row[0] or 0),
-        "daily_earn_total": int(row[1] or 0),
-        "last_earn_at": _iso(row[2]),
-        "reset_at": _iso(row[3]),
-        "updated_at": _iso(row[4]),
-    }
-
-
-def _get_clerk_sync(db: Session, user_id: str) -> Dict[str, Optional[str]]:
-    row = db.execute(
-        text(
-            """
-            SELECT last_sync_at, last_error, last_error_at
-            FROM ring_clerk_sync
-            WHERE user_id = :user_id
-            LIMIT 1
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
-    if not row:
-        return {"last_at": None, "last_error": None, "last_error_at": None}
-    return {
-        "last_at": _iso(row[0]),
-        "last_error": row[1],
-        "last_error_at": _iso(row[2]),
-    }
-
-
 def get_effective_ring_balance(db: Session, user_id: str) -> Dict:
     """
     Resolve canonical balance for a user based on token issuance mode.
     """
     mode = get_token_issuance_mode()
-    legacy_balance = _get_legacy_balance(db, user_id)
-    pending_total, pending_count, last_pending_at = _get_pending_summary(db, user_id)
-    ledger_balance, last_ledger_at = _get_last_ledger_state(db, user_id)
-    guardrails_state = _get_guardrails_state(db, user_id)
-    clerk_sync = _get_clerk_sync(db, user_id)
+    # Legacy balance, pending summary, last ledger state, shadow delta,
+    # guardrails and clerk sync are independent reads; resolve them in one
+    # round-trip.
+    row = db.execute(_SQL_BALANCE_STATE, {"user_id": user_id, "mode": mode}).fetchone()
+    legacy_balance = int(row.legacy_balance or 0)
+    pending_total = int(row.pending_total or 0)
+    pending_count = int(row.pending_count or 0)
+    last_pending_at = row.last_pending_at
+    ledger_balance = int(row.ledger_balance) if row.ledger_balance is not None else None
+    last_ledger_at = row.last_ledger_at
+    guardrails_state = None
+    if row.has_guardrails:
+        guardrails_state = {
+            "daily_earn_count": int(row.daily_earn_count or 0),
+            "daily_earn_total": int(row.daily_earn_total or 0),
+            "last_earn_at": _iso(row.last_earn_at),
+            "reset_at": _iso(row.reset_at),
+            "updated_at": _iso(row.updated_at),
+        }
+    clerk_sync = {
+        "last_at": _iso(row.last_sync_at),
+        "last_error": row.last_error,
+        "last_error_at": _iso(row.last_error_at),
+    }
 
     if mode == "off":
         balance = legacy_balance
         effective_balance = legacy_balance
     elif mode == "shadow":
-        shadow_delta = _get_shadow_ledger_delta(db, user_id)
+        shadow_delta = int(row.shadow_delta or 0)
         balance = legacy_balance
         effective_balance = legacy_balance + pending_total + shadow_delta
     else:
@@ -172,33 +170,12 @@ def get_balance_summary(db: Session, user_id: str, *, limit: int = 20) -> Dict:
     summary = get_effective_ring_balance(db, user_id)
 
     ledger_entries = get_user_ledger(db, user_id, limit)
-    publish_rows = db.execute(
-        text(
-            """
-            SELECT id, platform, published_at, platform_post_id, token_mode,
-                   token_issued_amount, token_pending_amount, token_reason_code, created_at
-            FROM publish_events
-            WHERE user_id = :user_id
-            ORDER BY created_at DESC
-            LIMIT :limit
-            """
-        ),
+    # Postgres builds the JSON array directly so rows never materialize as
+    # Python tuples/datetimes; timestamps are rendered as UTC ISO-8601.
+    publish_events = db.execute(
+        _SQL_PUBLISH_EVENTS_JSON,
         {"user_id": user_id, "limit": limit},
-    ).fetchall()
-    publish_events = [
-        {
-            "event_id": str(row[0]),
-            "platform": row[1],
-            "published_at": _iso(row[2]),
-            "platform_post_id": row[3],
-            "token_mode": row[4],
-            "token_issued_amount": row[5],
-            "token_pending_amount": row[6],
-            "token_reason_code": row[7],
-            "created_at": _iso(row[8]),
-        }
-        for row in publish_rows
-    ]
+    ).scalar() or []
 
     reconciliation_summary = get_reconciliation_summary(db)
 
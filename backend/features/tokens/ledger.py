@@ -10,9 +10,10 @@ Manages token accounting with:
 from __future__ import annotations
 
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Literal
-from sqlalchemy import text
+from datetime import datetime
+from typing import List, Dict, Optional, Literal, Tuple
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from backend.core.config import settings
@@ -27,6 +28,36 @@ ANOMALY_THRESHOLD_EARNS_PER_HOUR = int(os.getenv("RING_ANOMALY_EARNS_PER_HOUR",
 EventType = Literal["EARN", "SPEND", "PENALTY", "ADJUSTMENT"]
 
 
+# Spend-path lookups run once per spend; statements are built once at import
+# so every call reuses the same TextClause and its compiled-cache entry.
+_SQL_PENDING_TOTAL = text(
+    """
+    SELECT COALESCE(SUM(amount), 0)
+    FROM ring_pending
+    WHERE user_id = :user_id AND status = 'pending'
+    """
+)
+
+_SQL_BALANCE_AGGREGATES = text(
+    """
+    SELECT
+        COALESCE(u."ringBalance", 0),
+        CASE WHEN u."clerkId" IS NOT NULL THEN u.ledger_balance ELSE (
+            SELECT balance_after FROM ring_ledger
+            WHERE user_id = :user_id ORDER BY created_at DESC LIMIT 1
+        ) END,
+        CASE WHEN u."clerkId" IS NOT NULL THEN u.shadow_delta ELSE (
+            SELECT COALESCE(SUM(amount), 0)
+            FROM ring_ledger
+            WHERE user_id = :user_id
+              AND event_type IN ('SPEND', 'PENALTY', 'ADJUSTMENT')
+        ) END
+    FROM (SELECT 1) AS anchor
+    LEFT JOIN users u ON u."clerkId" = :user_id
+    """
+)
+
+
 def get_token_issuance_mode() -> str:
     """Get current token issuance mode."""
     mode = getattr(settings, "ONERING_TOKEN_ISSUANCE", "off") or "off"
@@ -38,6 +69,18 @@ def get_token_issuance_mode() -> str:
 class LedgerEntry:
     """Ledger entry model."""
     
+    __slots__ = (
+        "user_id",
+        "event_type",
+        "reason_code",
+        "amount",
+        "balance_after",
+        "draft_id",
+        "request_id",
+        "receipt_id",
+        "metadata",
+    )
+    
     def __init__(
         self,
         user_id: str,
@@ -61,20 +104,34 @@ class LedgerEntry:
         self.metadata = metadata or {}
 
 
-def append_ledger_entry(db: Session, entry: LedgerEntry) -> str:
+def append_ledger_entry(db: Session, entry: LedgerEntry, *, sync_balance: bool = False) -> str:
     """
     Append entry to ring_ledger table.
     Returns entry ID.
+
+    With sync_balance=True the user's "ringBalance" is set to
+    entry.balance_after in the same statement (writable CTE), so the ledger
+    row and the balance update land atomically in one round-trip.
     """
-    import json
-    
-    result = db.execute(
-        text("""
+    insert_sql = """
             INSERT INTO ring_ledger 
             (user_id, draft_id, request_id, receipt_id, event_type, reason_code, amount, balance_after, metadata)
-            VALUES (:user_id, :draft_id, :request_id, :receipt_id, :event_type, :reason_code, :amount, :balance_after, CAST(:metadata AS jsonb))
+            VALUES (:user_id, :draft_id, :request_id, :receipt_id, :event_type, :reason_code, :amount, :balance_after, :metadata)
             RETURNING id
-        """),
+    """
+    if sync_balance:
+        sql = f"""
+            WITH ins AS ({insert_sql}),
+            upd AS (
+                UPDATE users SET "ringBalance" = :balance_after WHERE "clerkId" = :user_id
+            )
+            SELECT id FROM ins
+        """
+    else:
+        sql = insert_sql
+
+    result = db.execute(
+        text(sql).bindparams(bindparam("metadata", type_=JSONB)),
         {
             "user_id": entry.user_id,
             "draft_id": entry.draft_id,
@@ -84,34 +141,98 @@ def append_ledger_entry(db: Session, entry: LedgerEntry) -> str:
             "reason_code": entry.reason_code,
             "amount": entry.amount,
             "balance_after": entry.balance_after,
-            "metadata": json.dumps(entry.metadata),
+            "metadata": entry.metadata,
         },
     )
-    db.commit()
     ledger_id = result.scalar()
+    db.commit()
     return str(ledger_id)
 
 
+def append_ledger_entries(db: Session, entries: List[LedgerEntry], *, sync_balance: bool = False) -> List[str]:
+    """
+    Append several entries to ring_ledger in one statement.
+    Returns entry IDs in input order.
+
+    With sync_balance=True each user's "ringBalance" is set to the
+    balance_after of that user's last entry in the batch, atomically with
+    the inserts (same writable-CTE approach as append_ledger_entry).
+    """
+    if not entries:
+        return []
+    rows = [
+        {
+            "ord": index,
+            "user_id": entry.user_id,
+            "draft_id": entry.draft_id,
+            "request_id": entry.request_id,
+            "receipt_id": entry.receipt_id,
+            "event_type": entry.event_type,
+            "reason_code": entry.reason_code,
+            "amount": entry.amount,
+            "balance_after": entry.balance_after,
+            "metadata": entry.metadata,
+        }
+        for index, entry in enumerate(entries)
+    ]
+    upd_sql = """
+            upd AS (
+                UPDATE users u SET "ringBalance" = last.balance_after
+                FROM (
+                    SELECT DISTINCT ON (user_id) user_id, balance_after
+                    FROM src
+                    ORDER BY user_id, ord DESC
+                ) last
+                WHERE u."clerkId" = last.user_id
+            ),
+    """ if sync_balance else ""
+    result = db.execute(
+        text(
+            f"""
+            WITH src AS (
+                SELECT gen_random_uuid() AS id, r.*
+                FROM jsonb_to_recordset(:rows) AS r(
+                    ord INTEGER, user_id TEXT, draft_id UUID, request_id TEXT, receipt_id TEXT,
+                    event_type TEXT, reason_code TEXT, amount INTEGER, balance_after INTEGER,
+                    metadata JSONB
+                )
+            ),
+            {upd_sql}
+            ins AS (
+                INSERT INTO ring_ledger
+                (id, user_id, draft_id, request_id, receipt_id, event_type, reason_code, amount, balance_after, metadata)
+                SELECT id, user_id, draft_id, request_id, receipt_id, event_type, reason_code, amount,
+                       balance_after, COALESCE(metadata, '{{}}'::jsonb)
+                FROM src
+            )
+            SELECT id FROM src ORDER BY ord
+            """
+        ).bindparams(bindparam("rows", type_=JSONB)),
+        {"rows": rows},
+    )
+    ledger_ids = [str(row[0]) for row in result.fetchall()]
+    db.commit()
+    return ledger_ids
+
+
 def add_pending_reward(
     db: Session, user_id: str, amount: int, reason_code: str, metadata: Optional[Dict] = None, draft_id: Optional[str] = None, request_id: Optional[str] = None
 ) -> str:
     """Add pending reward in shadow mode."""
-    import json
-    
     result = db.execute(
         text("""
             INSERT INTO ring_pending 
             (user_id, draft_id, request_id, amount, reason_code, metadata)
-            VALUES (:user_id, :draft_id, :request_id, :amount, :reason_code, CAST(:metadata AS jsonb))
+            VALUES (:user_id, :draft_id, :request_id, :amount, :reason_code, :metadata)
             RETURNING id
-        """),
+        """).bindparams(bindparam("metadata", type_=JSONB)),
         {
             "user_id": user_id,
             "draft_id": draft_id,
             "request_id": request_id,
             "amount": amount,
             "reason_code": reason_code,
-            "metadata": json.dumps(metadata or {}),
+            "metadata": metadata or {},
         },
     )
     db.commit()
@@ -138,59 +259,28 @@ def update_user_balance(db: Session, user_id: str, new_balance: int) -> None:
 
 
 def _get_pending_total(db: Session, user_id: str) -> int:
-    row = db.execute(
-        text(
-            """
-            SELECT COALESCE(SUM(amount), 0)
-            FROM ring_pending
-            WHERE user_id = :user_id AND status = 'pending'
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
+    row = db.execute(_SQL_PENDING_TOTAL, {"user_id": user_id}).fetchone()
     return int(row[0] or 0) if row else 0
 
 
-def _get_shadow_ledger_delta(db: Session, user_id: str) -> int:
-    row = db.execute(
-        text(
-            """
-            SELECT COALESCE(SUM(amount), 0)
-            FROM ring_ledger
-            WHERE user_id = :user_id
-              AND event_type IN ('SPEND', 'PENALTY', 'ADJUSTMENT')
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
-    return int(row[0] or 0) if row else 0
-
+def _get_balance_aggregates(db: Session, user_id: str) -> Tuple[int, Optional[int], int]:
+    """
+    Return (legacy_balance, ledger_balance, shadow_delta) for a user.
 
-def _get_latest_ledger_balance(db: Session, user_id: str) -> Optional[int]:
-    row = db.execute(
-        text(
-            """
-            SELECT balance_after
-            FROM ring_ledger
-            WHERE user_id = :user_id
-            ORDER BY created_at DESC
-            LIMIT 1
-            """
-        ),
-        {"user_id": user_id},
-    ).fetchone()
-    if not row:
-        return None
-    return int(row[0]) if row[0] is not None else None
+    ledger_balance and shadow_delta are trigger-maintained on users; ledger
+    rows with no users row fall back to reading ring_ledger directly.
+    """
+    row = db.execute(_SQL_BALANCE_AGGREGATES, {"user_id": user_id}).fetchone()
+    ledger_balance = int(row[1]) if row[1] is not None else None
+    return int(row[0] or 0), ledger_balance, int(row[2] or 0)
 
 
 def _get_effective_balance_for_spend(db: Session, user_id: str, mode: str) -> int:
-    legacy_balance = get_user_balance(db, user_id)
+    legacy_balance, ledger_balance, shadow_delta = _get_balance_aggregates(db, user_id)
     if mode == "live":
-        return _get_latest_ledger_balance(db, user_id) or legacy_balance
+        return ledger_balance or legacy_balance
     if mode == "shadow":
         pending_total = _get_pending_total(db, user_id)
-        shadow_delta = _get_shadow_ledger_delta(db, user_id)
         return legacy_balance + pending_total + shadow_delta
     return legacy_balance
 
@@ -284,10 +374,7 @@ def spend_ring(
         balance_after=balance_after,
         metadata=meta,
     )
-    ledger_id = append_ledger_entry(db, entry)
-
-    if mode == "live":
-        update_user_balance(db, user_id, balance_after)
+    ledger_id = append_ledger_entry(db, entry, sync_balance=(mode == "live"))
 
     enqueue_webhook_event(
         db,
@@ -372,7 +459,8 @@ def earn_ring(
         )
         return {"ok": True, "mode": mode, "pending_id": pending_id, "amount": amount, "idempotent": False}
 
-    current_balance = _get_latest_ledger_balance(db, user_id) or get_user_balance(db, user_id)
+    legacy_balance, ledger_balance, _ = _get_balance_aggregates(db, user_id)
+    current_balance = ledger_balance or legacy_balance
     balance_after = current_balance + amount
     entry = LedgerEntry(
         user_id=user_id,
@@ -382,8 +470,7 @@ def earn_ring(
         balance_after=balance_after,
         metadata=meta,
     )
-    ledger_id = append_ledger_entry(db, entry)
-    update_user_balance(db, user_id, balance_after)
+    ledger_id = append_ledger_entry(db, entry, sync_balance=True)
 
     enqueue_webhook_event(
         db,
@@ -415,50 +502,46 @@ def check_guardrails(db: Session, user_id: str) -> tuple[bool, List[str], int]:
     """
     Check anti-gaming guardrails.
     Returns: (allowed, violations, reduction_factor_percentage)
+
+    Guardrail state is created, reset (when the daily window has elapsed) and
+    read back in a single UPSERT so concurrent earns cannot race the
+    initial INSERT. The UPSERT is left uncommitted: its row lock serializes
+    concurrent earns for the user until the caller commits, so the next
+    check sees this earn's increment.
     """
     violations = []
     reduction = 0
-    
-    # Get or create guardrail state
-    result = db.execute(
+    now = datetime.utcnow()
+
+    row = db.execute(
         text("""
-            SELECT daily_earn_count, daily_earn_total, last_earn_at, reset_at, anomaly_flags
-            FROM ring_guardrails_state
-            WHERE user_id = :user_id
+            INSERT INTO ring_guardrails_state (user_id, reset_at, updated_at)
+            VALUES (:user_id, :now, :now)
+            ON CONFLICT (user_id) DO UPDATE SET
+                daily_earn_count = CASE
+                    WHEN ring_guardrails_state.reset_at + INTERVAL '1 day' <= :now THEN 0
+                    ELSE ring_guardrails_state.daily_earn_count
+                END,
+                daily_earn_total = CASE
+                    WHEN ring_guardrails_state.reset_at + INTERVAL '1 day' <= :now THEN 0
+                    ELSE ring_guardrails_state.daily_earn_total
+                END,
+                updated_at = CASE
+                    WHEN ring_guardrails_state.reset_at + INTERVAL '1 day' <= :now THEN :now
+                    ELSE ring_guardrails_state.updated_at
+                END,
+                reset_at = CASE
+                    WHEN ring_guardrails_state.reset_at + INTERVAL '1 day' <= :now THEN :now
+                    ELSE ring_guardrails_state.reset_at
+                END
+            RETURNING daily_earn_count, daily_earn_total, last_earn_at
         """),
-        {"user_id": user_id},
-    )
-    row = result.fetchone()
-    
-    now = datetime.utcnow()
-    
-    if not row:
-        # Create initial state
-        db.execute(
-            text("""
-                INSERT INTO ring_guardrails_state (user_id, reset_at)
-                VALUES (:user_id, :reset_at)
-            """),
-            {"user_id": user_id, "reset_at": now},
-        )
-        db.commit()
-        return True, [], 0
-    
-    daily_count, daily_total, last_earn_at, reset_at, anomaly_flags = row
-    
-    # Check if daily reset needed
-    if now >= reset_at + timedelta(days=1):
-        db.execute(
-            text("""
-                UPDATE ring_guardrails_state
-                SET daily_earn_count = 0, daily_earn_total = 0, reset_at = :reset_at, updated_at = :now
-                WHERE user_id = :user_id
-            """),
-            {"user_id": user_id, "reset_at": now, "now": now},
-        )
-        db.commit()
-        daily_count = 0
-        daily_total = 0
+        {"user_id": user_id, "now": now},
+    ).fetchone()
+
+    daily_count = int(row[0] or 0) if row else 0
+    daily_total = int(row[1] or 0) if row else 0
+    last_earn_at = row[2] if row else None
     
     # Guardrail 1: Daily earn cap
     if daily_total >= DAILY_EARN_CAP:
@@ -479,8 +562,12 @@ def check_guardrails(db: Session, user_id: str) -> tuple[bool, List[str], int]:
     return allowed, violations, reduction
 
 
-def update_guardrail_state(db: Session, user_id: str, earn_amount: int) -> None:
-    """Update guardrail state after earn."""
+def update_guardrail_state(db: Session, user_id: str, earn_amount: int, *, commit: bool = True) -> None:
+    """Update guardrail state after earn.
+
+    With commit=False the increment joins the caller's transaction (and
+    lands with its ledger write).
+    """
     now = datetime.utcnow()
     db.execute(
         text("""
@@ -493,7 +580,8 @@ def update_guardrail_state(db: Session, user_id: str, earn_amount: int) -> None:
         """),
         {"user_id": user_id, "amount": earn_amount, "now": now},
     )
-    db.commit()
+    if commit:
+        db.commit()
 
 
 def issue_ring_for_publish(
@@ -586,7 +674,8 @@ def issue_ring_for_publish(
     elif mode == "live":
         # Live mode: update balance and ledger
         if not allowed or final_amount == 0:
-            # Blocked by guardrails
+            # Blocked by guardrails; release the guardrail row lock
+            db.commit()
             return {
                 "issued": False,
                 "amount": 0,
@@ -599,7 +688,6 @@ def issue_ring_for_publish(
         current_balance = get_user_balance(db, user_id)
         new_balance = current_balance + final_amount
         
-        # Append ledger
         entry = LedgerEntry(
             user_id=user_id,
             event_type="EARN",
@@ -611,13 +699,11 @@ def issue_ring_for_publish(
             receipt_id=receipt_id,
             metadata=meta,
         )
-        ledger_id = append_ledger_entry(db, entry)
-        
-        # Update user balance
-        update_user_balance(db, user_id, new_balance)
-        
-        # Update guardrails
-        update_guardrail_state(db, user_id, final_amount)
+        # Record the earn against the guardrails while check_guardrails still
+        # holds the row lock; the ledger append below commits both (and the
+        # user balance) together.
+        update_guardrail_state(db, user_id, final_amount, commit=False)
+        ledger_id = append_ledger_entry(db, entry, sync_balance=True)
         
         return {
             "issued": True,
@@ -633,8 +719,6 @@ def issue_ring_for_publish(
 
 def get_user_ledger(db: Session, user_id: str, limit: int = 20) -> List[Dict]:
     """Get recent ledger entries for user."""
-    import json
-    
     result = db.execute(
         text("""
             SELECT id, event_type, reason_code, amount, balance_after, metadata, created_at
@@ -654,7 +738,7 @@ def get_user_ledger(db: Session, user_id: str, limit: int = 20) -> List[Dict]:
             "reasonCode": row[2],
             "amount": row[3],
             "balanceAfter": row[4],
-            "metadata": json.loads(row[5]) if isinstance(row[5], str) else row[5],
+            "metadata": row[5],
             "createdAt": row[6].isoformat() if row[6] else None,
         })
     
@@ -6,14 +6,15 @@ Persists publish events and issues tokens (shadow/live) with idempotency.
 from __future__ import annotations
 
 import hashlib
-import json
 from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from backend.features.enforcement.audit import resolve_receipt, resolve_qa_details
+from backend.features.enforcement.audit import resolve_receipt_with_qa
 from backend.features.enforcement.contracts import EnforcementReceipt
 from backend.features.tokens.ledger import issue_ring_for_publish, get_token_issuance_mode
 from backend.features.external.webhooks import enqueue_webhook_event
@@ -39,82 +40,90 @@ def _record_publish_conflict(db: Session, event_id: str, user_id: str) -> None:
         db.rollback()
 
 
-def _find_existing_publish_event(db: Session, event_id: str) -> Optional[Dict]:
-    row = db.execute(
+def _find_existing_publish_states(
+    db: Session, event_ids: List[str]
+) -> Dict[str, Tuple[Optional[Dict], Optional[str], Optional[str]]]:
+    """
+    Resolve replay state for a set of publish events in one round-trip.
+
+    Maps event_id -> (existing_publish_event, existing_ledger_id, existing_pending_id).
+    The ledger/pending lookups are independent of the publish_events row so
+    issuance written before a failed persist is still detected.
+    """
+    rows = db.execute(
         text(
             """
-            SELECT id, token_mode, token_issued_amount, token_pending_amount, token_reason_code,
-                   token_ledger_id, token_pending_id
-            FROM publish_events
-            WHERE id = :event_id
+            SELECT k.event_id,
+                   pe.id, pe.token_mode, pe.token_issued_amount, pe.token_pending_amount,
+                   pe.token_reason_code, pe.token_ledger_id, pe.token_pending_id,
+                   l.id AS ledger_id, p.id AS pending_id
+            FROM unnest(CAST(:event_ids AS TEXT[])) AS k(event_id)
+            LEFT JOIN publish_events pe ON pe.id = k.event_id
+            LEFT JOIN LATERAL (
+                SELECT id
+                FROM ring_ledger
+                WHERE publish_event_id = k.event_id
+                ORDER BY created_at DESC
+                LIMIT 1
+            ) l ON true
+            LEFT JOIN LATERAL (
+                SELECT id
+                FROM ring_pending
+                WHERE publish_event_id = k.event_id
+                ORDER BY created_at DESC
+                LIMIT 1
+            ) p ON true
             """
         ),
-        {"event_id": event_id},
-    ).fetchone()
-    if not row:
-        return None
-    return {
-        "event_id": row[0],
-        "token_mode": row[1],
-        "token_issued_amount": row[2],
-        "token_pending_amount": row[3],
-        "token_reason_code": row[4],
-        "token_ledger_id": row[5],
-        "token_pending_id": row[6],
-    }
+        {"event_ids": list(dict.fromkeys(event_ids))},
+    ).fetchall()
+    states = {}
+    for row in rows:
+        existing = None
+        if row[1] is not None:
+            existing = {
+                "event_id": row[1],
+                "token_mode": row[2],
+                "token_issued_amount": row[3],
+                "token_pending_amount": row[4],
+                "token_reason_code": row[5],
+                "token_ledger_id": row[6],
+                "token_pending_id": row[7],
+            }
+        states[row[0]] = (
+            existing,
+            str(row[8]) if row[8] is not None else None,
+            str(row[9]) if row[9] is not None else None,
+        )
+    return states
 
 
-def _find_existing_issuance(db: Session, event_id: str) -> Tuple[Optional[str], Optional[str]]:
-    ledger_row = db.execute(
-        text(
-            """
-            SELECT id
-            FROM ring_ledger
-            WHERE metadata->>'publish_event_id' = :event_id
-            ORDER BY created_at DESC
-            LIMIT 1
-            """
-        ),
-        {"event_id": event_id},
-    ).fetchone()
-    pending_row = db.execute(
-        text(
-            """
-            SELECT id
-            FROM ring_pending
-            WHERE metadata->>'publish_event_id' = :event_id
-            ORDER BY created_at DESC
-            LIMIT 1
-            """
-        ),
-        {"event_id": event_id},
-    ).fetchone()
-    return (str(ledger_row[0]) if ledger_row else None, str(pending_row[0]) if pending_row else None)
+def _find_existing_publish_state(
+    db: Session, event_id: str
+) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+    """Single-event form of _find_existing_publish_states."""
+    return _find_existing_publish_states(db, [event_id]).get(event_id, (None, None, None))
 
 
-def _persist_publish_event(
-    db: Session,
-    *,
-    event_id: str,
-    user_id: str,
-    platform: str,
-    content_hash: str,
-    published_at: datetime,
-    platform_post_id: Optional[str],
-    enforcement_request_id: Optional[str],
-    enforcement_receipt_id: Optional[str],
-    qa_status: Optional[str],
-    violation_codes: Optional[list],
-    audit_ok: bool,
-    metadata: Optional[Dict],
-    token_mode: Optional[str],
-    token_issued_amount: Optional[int],
-    token_pending_amount: Optional[int],
-    token_reason_code: Optional[str],
-    token_ledger_id: Optional[str],
-    token_pending_id: Optional[str],
-) -> None:
-    db.execute(
+def _persist_publish_events(db: Session, rows: List[Dict]) -> Set[str]:
+    """
+    Insert publish events with one multi-row INSERT.
+
+    Rows are keyed by publish_events column names. Returns the ids that were
+    inserted; ids that already existed are skipped.
+    """
+    if not rows:
+        return set()
+    payload = [
+        {
+            **row,
+            "published_at": row["published_at"].isoformat(),
+            "violation_codes": row.get("violation_codes") or [],
+            "metadata": row.get("metadata") or {},
+        }
+        for row in rows
+    ]
+    result = db.execute(
         text(
             """
             INSERT INTO publish_events
@@ -122,35 +131,42 @@ def _persist_publish_event(
              enforcement_request_id, enforcement_receipt_id, qa_status, violation_codes, audit_ok,
              metadata, token_mode, token_issued_amount, token_pending_amount, token_reason_code,
              token_ledger_id, token_pending_id)
-            VALUES
-            (:id, :user_id, :platform, :content_hash, :published_at, :platform_post_id,
-             :enforcement_request_id, :enforcement_receipt_id, :qa_status, CAST(:violation_codes AS jsonb), :audit_ok,
-             CAST(:metadata AS jsonb), :token_mode, :token_issued_amount, :token_pending_amount, :token_reason_code,
-             :token_ledger_id, :token_pending_id)
+            SELECT r.id, r.user_id, r.platform, r.content_hash, r.published_at, r.platform_post_id,
+                   r.enforcement_request_id, r.enforcement_receipt_id, r.qa_status, r.violation_codes,
+                   r.audit_ok, r.metadata, r.token_mode, r.token_issued_amount, r.token_pending_amount,
+                   r.token_reason_code, r.token_ledger_id, r.token_pending_id
+            FROM jsonb_to_recordset(:rows) AS r(
+                id TEXT, user_id TEXT, platform TEXT, content_hash TEXT, published_at TIMESTAMPTZ,
+                platform_post_id TEXT, enforcement_request_id TEXT, enforcement_receipt_id TEXT,
+                qa_status TEXT, violation_codes JSONB, audit_ok BOOLEAN, metadata JSONB,
+                token_mode TEXT, token_issued_amount INTEGER, token_pending_amount INTEGER,
+                token_reason_code TEXT, token_ledger_id TEXT, token_pending_id TEXT
+            )
+            ON CONFLICT (id) DO NOTHING
+            RETURNING id
             """
-        ),
-        {
-            "id": event_id,
-            "user_id": user_id,
-            "platform": platform,
-            "content_hash": content_hash,
-            "published_at": published_at,
-            "platform_post_id": platform_post_id,
-            "enforcement_request_id": enforcement_request_id,
-            "enforcement_receipt_id": enforcement_receipt_id,
-            "qa_status": qa_status,
-            "violation_codes": json.dumps(violation_codes or []),
-            "audit_ok": audit_ok,
-            "metadata": json.dumps(metadata or {}),
-            "token_mode": token_mode,
-            "token_issued_amount": token_issued_amount,
-            "token_pending_amount": token_pending_amount,
-            "token_reason_code": token_reason_code,
-            "token_ledger_id": token_ledger_id,
-            "token_pending_id": token_pending_id,
-        },
+        ).bindparams(bindparam("rows", type_=JSONB)),
+        {"rows": payload},
     )
+    inserted = {row[0] for row in result.fetchall()}
     db.commit()
+    return inserted
+
+
+def _replay_result(existing: Dict) -> Dict:
+    return {
+        "ok": True,
+        "event_id": existing["event_id"],
+        "token_result": {
+            "mode": existing["token_mode"] or "off",
+            "issued_amount": existing["token_issued_amount"] or 0,
+            "pending_amount": existing["token_pending_amount"] or 0,
+            "reason_code": existing["token_reason_code"] or "IDEMPOTENT_REPLAY",
+            "guardrails_applied": [],
+            "ledger_id": existing["token_ledger_id"],
+            "pending_id": existing["token_pending_id"],
+        },
+    }
 
 
 def _validate_receipt(
@@ -161,7 +177,7 @@ def _validate_receipt(
     if not request_id and not receipt_id:
         return None, "ENFORCEMENT_RECEIPT_REQUIRED", None
 
-    receipt, error_code = resolve_receipt(request_id=request_id, receipt_id=receipt_id)
+    receipt, qa_details, error_code = resolve_receipt_with_qa(request_id=request_id, receipt_id=receipt_id)
     if error_code or not receipt:
         return None, error_code or "ENFORCEMENT_RECEIPT_INVALID", None
 
@@ -169,13 +185,10 @@ def _validate_receipt(
     if receipt.expires_at and receipt.expires_at < now:
         return None, "ENFORCEMENT_RECEIPT_EXPIRED", None
 
-    qa_details, qa_error = resolve_qa_details(request_id=request_id, receipt_id=receipt_id)
-    if qa_error:
-        qa_details = None
     return receipt, None, qa_details
 
 
-def handle_publish_event(
+def _resolve_publish_tokens(
     db: Session,
     *,
     event_id: str,
@@ -187,25 +200,15 @@ def handle_publish_event(
     enforcement_request_id: Optional[str],
     enforcement_receipt_id: Optional[str],
     metadata: Optional[Dict],
-) -> Dict:
-    started_at = datetime.now(timezone.utc)
-    existing = _find_existing_publish_event(db, event_id)
-    if existing:
-        _record_publish_conflict(db, event_id, user_id)
-        return {
-            "ok": True,
-            "event_id": existing["event_id"],
-            "token_result": {
-                "mode": existing["token_mode"] or "off",
-                "issued_amount": existing["token_issued_amount"] or 0,
-                "pending_amount": existing["token_pending_amount"] or 0,
-                "reason_code": existing["token_reason_code"] or "IDEMPOTENT_REPLAY",
-                "guardrails_applied": [],
-                "ledger_id": existing["token_ledger_id"],
-                "pending_id": existing["token_pending_id"],
-            },
-        }
+    existing_ledger_id: Optional[str],
+    existing_pending_id: Optional[str],
+) -> Tuple[Dict, list]:
+    """
+    Validate the receipt and issue tokens for a new publish event.
 
+    Returns (publish_events row, guardrails_applied); the row is not persisted.
+    """
+    started_at = datetime.now(timezone.utc)
     token_mode = get_token_issuance_mode()
     reason_code = None
     issued_amount = 0
@@ -233,62 +236,78 @@ def handle_publish_event(
     elif not platform_post_id:
         reason_code = "PLATFORM_CONFIRMATION_MISSING"
     else:
-        existing_ledger_id, existing_pending_id = _find_existing_issuance(db, event_id)
         if existing_ledger_id or existing_pending_id:
             ledger_id = existing_ledger_id
             pending_id = existing_pending_id
             reason_code = "IDEMPOTENT_REPLAY"
         else:
-            issue = issue_ring_for_publish(
-                db,
-                user_id,
-                None,
-                enforcement_request_id,
-                enforcement_receipt_id,
-                qa_status=qa_status or "FAIL",
-                audit_ok=audit_ok,
-                platform=platform,
-                metadata={
-                    "publish_event_id": event_id,
-                    "platform_post_id": platform_post_id,
-                    "content_hash": content_hash,
-                    **(metadata or {}),
-                },
-            )
-            guardrails = issue.get("violations", []) or []
-            if token_mode == "shadow":
-                pending_amount = issue.get("amount", 0) or 0
-                pending_id = issue.get("pending_id")
-                reason_code = "PENDING" if pending_amount > 0 else "GUARDRAIL_BLOCKED"
-            elif token_mode == "live":
-                issued_amount = issue.get("amount", 0) or 0
-                ledger_id = issue.get("ledger_id")
-                reason_code = "ISSUED" if issue.get("issued") else "GUARDRAIL_BLOCKED"
+            try:
+                issue = issue_ring_for_publish(
+                    db,
+                    user_id,
+                    None,
+                    enforcement_request_id,
+                    enforcement_receipt_id,
+                    qa_status=qa_status or "FAIL",
+                    audit_ok=audit_ok,
+                    platform=platform,
+                    metadata={
+                        "publish_event_id": event_id,
+                        "platform_post_id": platform_post_id,
+                        "content_hash": content_hash,
+                        **(metadata or {}),
+                    },
+                )
+            except IntegrityError:
+                # A concurrent delivery of the same event issued first; the
+                # unique publish_event_id index rejected this duplicate.
+                db.rollback()
+                issue = None
+            if issue is None:
+                _, ledger_id, pending_id = _find_existing_publish_state(db, event_id)
+                reason_code = "IDEMPOTENT_REPLAY"
+            else:
+                guardrails = issue.get("violations", []) or []
+                if token_mode == "shadow":
+                    pending_amount = issue.get("amount", 0) or 0
+                    pending_id = issue.get("pending_id")
+                    reason_code = "PENDING" if pending_amount > 0 else "GUARDRAIL_BLOCKED"
+                elif token_mode == "live":
+                    issued_amount = issue.get("amount", 0) or 0
+                    ledger_id = issue.get("ledger_id")
+                    reason_code = "ISSUED" if issue.get("issued") else "GUARDRAIL_BLOCKED"
 
     meta = metadata or {}
     meta["issuance_latency_ms"] = int((datetime.now(timezone.utc) - started_at).total_seconds() * 1000)
 
-    _persist_publish_event(
-        db,
-        event_id=event_id,
-        user_id=user_id,
-        platform=platform,
-        content_hash=content_hash,
-        published_at=published_at,
-        platform_post_id=platform_post_id,
-        enforcement_request_id=enforcement_request_id,
-        enforcement_receipt_id=enforcement_receipt_id,
-        qa_status=qa_status,
-        violation_codes=violation_codes or [],
-        audit_ok=audit_ok,
-        metadata=meta,
-        token_mode=token_mode,
-        token_issued_amount=issued_amount if issued_amount else None,
-        token_pending_amount=pending_amount if pending_amount else None,
-        token_reason_code=reason_code,
-        token_ledger_id=ledger_id,
-        token_pending_id=pending_id,
-    )
+    row = {
+        "id": event_id,
+        "user_id": user_id,
+        "platform": platform,
+        "content_hash": content_hash,
+        "published_at": published_at,
+        "platform_post_id": platform_post_id,
+        "enforcement_request_id": enforcement_request_id,
+        "enforcement_receipt_id": enforcement_receipt_id,
+        "qa_status": qa_status,
+        "violation_codes": violation_codes or [],
+        "audit_ok": audit_ok,
+        "metadata": meta,
+        "token_mode": token_mode,
+        "token_issued_amount": issued_amount if issued_amount else None,
+        "token_pending_amount": pending_amount if pending_amount else None,
+        "token_reason_code": reason_code,
+        "token_ledger_id": ledger_id,
+        "token_pending_id": pending_id,
+    }
+    return row, guardrails
+
+
+def _emit_publish_webhooks(db: Session, row: Dict) -> None:
+    event_id = row["id"]
+    user_id = row["user_id"]
+    reason_code = row["token_reason_code"]
+    amount = row["token_issued_amount"] or row["token_pending_amount"] or 0
 
     # Webhook emissions (fire-and-forget enqueue)
     enqueue_webhook_event(
@@ -297,26 +316,26 @@ def handle_publish_event(
         payload={
             "event_id": event_id,
             "user_id": user_id,
-            "platform": platform,
-            "published_at": published_at.isoformat(),
-            "platform_post_id": platform_post_id,
-            "qa_status": qa_status,
+            "platform": row["platform"],
+            "published_at": row["published_at"].isoformat(),
+            "platform_post_id": row["platform_post_id"],
+            "qa_status": row["qa_status"],
             "reason_code": reason_code,
         },
         user_id=user_id,
     )
 
-    if (issued_amount or pending_amount) and (issued_amount or pending_amount) > 0:
+    if amount > 0:
         enqueue_webhook_event(
             db,
             event_type="ring.earned",
             payload={
                 "event_id": event_id,
                 "user_id": user_id,
-                "mode": token_mode,
-                "amount": issued_amount or pending_amount,
-                "ledger_id": ledger_id,
-                "pending_id": pending_id,
+                "mode": row["token_mode"],
+                "amount": amount,
+                "ledger_id": row["token_ledger_id"],
+                "pending_id": row["token_pending_id"],
                 "reason_code": reason_code,
             },
             user_id=user_id,
@@ -330,22 +349,126 @@ def handle_publish_event(
                 "event_id": event_id,
                 "user_id": user_id,
                 "reason_code": reason_code,
-                "qa_status": qa_status,
-                "violation_codes": violation_codes or [],
+                "qa_status": row["qa_status"],
+                "violation_codes": row["violation_codes"] or [],
             },
             user_id=user_id,
         )
 
+
+def _publish_result(row: Dict, guardrails: list) -> Dict:
     return {
         "ok": True,
-        "event_id": event_id,
+        "event_id": row["id"],
         "token_result": {
-            "mode": token_mode,
-            "issued_amount": issued_amount,
-            "pending_amount": pending_amount,
-            "reason_code": reason_code,
+            "mode": row["token_mode"],
+            "issued_amount": row["token_issued_amount"] or 0,
+            "pending_amount": row["token_pending_amount"] or 0,
+            "reason_code": row["token_reason_code"],
             "guardrails_applied": guardrails,
-            "ledger_id": ledger_id,
-            "pending_id": pending_id,
+            "ledger_id": row["token_ledger_id"],
+            "pending_id": row["token_pending_id"],
         },
     }
+
+
+def handle_publish_event(
+    db: Session,
+    *,
+    event_id: str,
+    user_id: str,
+    platform: str,
+    content_hash: str,
+    published_at: datetime,
+    platform_post_id: Optional[str],
+    enforcement_request_id: Optional[str],
+    enforcement_receipt_id: Optional[str],
+    metadata: Optional[Dict],
+) -> Dict:
+    existing, existing_ledger_id, existing_pending_id = _find_existing_publish_state(db, event_id)
+    if existing:
+        _record_publish_conflict(db, event_id, user_id)
+        return _replay_result(existing)
+
+    row, guardrails = _resolve_publish_tokens(
+        db,
+        event_id=event_id,
+        user_id=user_id,
+        platform=platform,
+        content_hash=content_hash,
+        published_at=published_at,
+        platform_post_id=platform_post_id,
+        enforcement_request_id=enforcement_request_id,
+        enforcement_receipt_id=enforcement_receipt_id,
+        metadata=metadata,
+        existing_ledger_id=existing_ledger_id,
+        existing_pending_id=existing_pending_id,
+    )
+
+    if not _persist_publish_events(db, [row]):
+        # Lost the race against a concurrent delivery of the same event id.
+        _record_publish_conflict(db, event_id, user_id)
+        existing, _, _ = _find_existing_publish_state(db, event_id)
+        if existing:
+            return _replay_result(existing)
+
+    _emit_publish_webhooks(db, row)
+    return _publish_result(row, guardrails)
+
+
+def handle_publish_events(db: Session, events: List[Dict]) -> List[Dict]:
+    """
+    Batch form of handle_publish_event for webhook bursts.
+
+    Each event is a dict of handle_publish_event keyword arguments. Replay
+    state for the whole batch is resolved in one query and all new
+    publish_events rows are written with one INSERT; issuance still runs per
+    event so guardrails see earns in order. Results keep the input order.
+    """
+    states = _find_existing_publish_states(db, [event["event_id"] for event in events])
+    results: List[Optional[Dict]] = [None] * len(events)
+    resolved = []
+    replays = []
+    seen = set()
+    for index, event in enumerate(events):
+        event_id = event["event_id"]
+        existing, existing_ledger_id, existing_pending_id = states.get(event_id, (None, None, None))
+        if existing or event_id in seen:
+            # Stored already, or a duplicate of an earlier event in this batch.
+            replays.append(index)
+            continue
+        seen.add(event_id)
+        row, guardrails = _resolve_publish_tokens(
+            db,
+            **event,
+            existing_ledger_id=existing_ledger_id,
+            existing_pending_id=existing_pending_id,
+        )
+        resolved.append((index, row, guardrails))
+
+    inserted = _persist_publish_events(db, [row for _, row, _ in resolved])
+    lost = {}
+    for index, row, guardrails in resolved:
+        if row["id"] in inserted:
+            _emit_publish_webhooks(db, row)
+            results[index] = _publish_result(row, guardrails)
+        else:
+            lost[index] = (row, guardrails)
+            replays.append(index)
+
+    if replays:
+        stored = _find_existing_publish_states(db, [events[index]["event_id"] for index in replays])
+        for index in replays:
+            event_id = events[index]["event_id"]
+            _record_publish_conflict(db, event_id, events[index]["user_id"])
+            existing = stored.get(event_id, (None, None, None))[0]
+            if existing:
+                results[index] = _replay_result(existing)
+            elif index in lost:
+                row, guardrails = lost[index]
+                _emit_publish_webhooks(db, row)
+                results[index] = _publish_result(row, guardrails)
+            else:
+                results[index] = {"ok": False, "event_id": event_id, "error": "publish_event_failed"}
+
+    return results
@@ -7,21 +7,36 @@ Shadow mode only: writes ADJUSTMENT entries.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from backend.core.config import settings
 from backend.features.tokens.ledger import (
     get_token_issuance_mode,
-    append_ledger_entry,
+    append_ledger_entries,
     LedgerEntry,
-    get_user_balance,
-    update_user_balance,
 )
-from backend.features.external.webhooks import enqueue_webhook_event
+from backend.features.external.webhooks import enqueue_webhook_events
 
+# Rows per server-side cursor fetch when scanning ledger drift.
+RECONCILIATION_FETCH_SIZE = 2000
 
-def run_reconciliation(db: Session) -> Dict:
+
+def _apply_work_mem(db: Session) -> None:
+    """
+    Raise work_mem for the current transaction if configured.
+
+    The drift join and the publish duplicate GROUP BYs spill to disk on
+    large tables at the server default. set_config(..., true) is SET LOCAL,
+    so it ends with the transaction and is re-applied after each commit.
+    """
+    work_mem = getattr(settings, "ONERING_RECONCILIATION_WORK_MEM", None)
+    if work_mem:
+        db.execute(text("SELECT set_config('work_mem', :work_mem, true)"), {"work_mem": work_mem})
+
+
+def run_reconciliation(db: Session, *, shard: Optional[Tuple[int, int]] = None) -> Dict:
     """
     Run daily reconciliation.
     
@@ -29,8 +44,16 @@ def run_reconciliation(db: Session) -> Dict:
     1. Ledger sum vs user balance for each user
     2. Creates ADJUSTMENT entries if mismatches found (shadow mode only)
     
+    shard=(index, count) restricts the user scan to users whose
+    hashtext(user_id) falls in that bucket, so a scheduler can run the
+    buckets concurrently. Publish event checks are global and only run in
+    shard 0.
+    
     Returns reconciliation report.
     """
+    shard_index, shard_count = shard or (0, 1)
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise ValueError(f"invalid shard {shard_index}/{shard_count}")
     mode = get_token_issuance_mode()
     
     if mode == "off":
@@ -41,182 +64,159 @@ def run_reconciliation(db: Session) -> Dict:
             "adjustments": [],
         }
     
-    # Get all users with ledger activity
-    result = db.execute(
+    # One timestamp for the whole run: every payload, adjustment and the
+    # report itself share it.
+    reconciled_at = datetime.utcnow().isoformat()
+    max_amount = 2_000_000_000
+    _apply_work_mem(db)
+    # Ledger sums (trigger-maintained in ring_ledger_user_sums, so this never
+    # scans ring_ledger) vs stored balances for every user with ledger activity,
+    # compared and classified (difference, overflow) in one pass; only
+    # mismatched users come back as rows. Rows are streamed from a
+    # server-side cursor, so nothing in the scan loop may commit.
+    drift_rows = db.execute(
         text("""
-            SELECT DISTINCT user_id
-            FROM ring_ledger
-        """)
+            WITH sums AS (
+                SELECT user_id, ledger_sum
+                FROM ring_ledger_user_sums
+                WHERE entry_count > 0
+                  AND (:shard_count = 1 OR mod(abs(hashtext(user_id)::bigint), :shard_count) = :shard_index)
+            ),
+            drift AS (
+                SELECT s.user_id, s.ledger_sum, COALESCE(u."ringBalance", 0) AS current_balance,
+                       s.ledger_sum - COALESCE(u."ringBalance", 0) AS difference
+                FROM sums s
+                LEFT JOIN users u ON u."clerkId" = s.user_id
+                WHERE s.ledger_sum <> COALESCE(u."ringBalance", 0)
+            )
+            SELECT c.users_checked, d.user_id, d.ledger_sum, d.current_balance, d.difference,
+                   (ABS(d.ledger_sum) > :max_amount OR ABS(d.difference) > :max_amount) AS overflow
+            FROM (SELECT COUNT(*) AS users_checked FROM sums) c
+            LEFT JOIN drift d ON true
+            ORDER BY d.user_id
+        """),
+        {"max_amount": max_amount, "shard_index": shard_index, "shard_count": shard_count},
+        execution_options={"yield_per": RECONCILIATION_FETCH_SIZE},
     )
-    user_ids = [row[0] for row in result.fetchall()]
+    users_checked = 0
     
     mismatches = []
     adjustments = []
+    pending_adjustments: List[LedgerEntry] = []
+    drift_payloads: List[Dict] = []
     publish_missing = []
     publish_duplicates = []
     
-    max_amount = 2_000_000_000
-    for user_id in user_ids:
-        # Sum ledger entries
-        ledger_result = db.execute(
-            text("""
-                SELECT COALESCE(SUM(amount), 0)
-                FROM ring_ledger
-                WHERE user_id = :user_id
-            """),
-            {"user_id": user_id},
-        )
-        ledger_sum = ledger_result.scalar() or 0
-        
-        # Get current balance
-        current_balance = get_user_balance(db, user_id)
-        
-        # Check mismatch
-        if ledger_sum != current_balance:
-            mismatch = {
-                "user_id": user_id,
-                "ledger_sum": ledger_sum,
-                "current_balance": current_balance,
-                "difference": ledger_sum - current_balance,
-            }
-            mismatches.append(mismatch)
-
-            if abs(ledger_sum) > max_amount or abs(ledger_sum - current_balance) > max_amount:
-                mismatch["overflow"] = True
-                enqueue_webhook_event(
-                    db,
-                    event_type="ring.drift_detected",
-                    payload={
-                        "user_id": user_id,
-                        "ledger_sum": ledger_sum,
-                        "current_balance": current_balance,
-                        "difference": ledger_sum - current_balance,
-                        "mode": mode,
-                        "overflow": True,
-                        "reconciled_at": datetime.utcnow().isoformat(),
-                    },
-                    user_id=user_id,
-                )
-                continue
+    for checked, user_id, ledger_sum, current_balance, difference, overflow in drift_rows:
+        users_checked = int(checked)
+        if user_id is None:
+            continue
+        ledger_sum = int(ledger_sum)
+        current_balance = int(current_balance)
+        difference = int(difference)
+        mismatch = {
+            "user_id": user_id,
+            "ledger_sum": ledger_sum,
+            "current_balance": current_balance,
+            "difference": difference,
+        }
+        mismatches.append(mismatch)
 
-            enqueue_webhook_event(
-                db,
-                event_type="ring.drift_detected",
-                payload={
-                    "user_id": user_id,
+        if overflow:
+            mismatch["overflow"] = True
+        drift_payloads.append({**mismatch, "mode": mode, "reconciled_at": reconciled_at})
+        if overflow:
+            continue
+        
+        # Shadow mode logs the adjustment; live mode also applies it.
+        if mode in ("shadow", "live"):
+            pending_adjustments.append(LedgerEntry(
+                user_id=user_id,
+                event_type="ADJUSTMENT",
+                reason_code="reconciliation_mismatch",
+                amount=difference,
+                balance_after=ledger_sum,
+                metadata={
+                    "previous_balance": current_balance,
                     "ledger_sum": ledger_sum,
-                    "current_balance": current_balance,
-                    "difference": ledger_sum - current_balance,
-                    "mode": mode,
-                    "reconciled_at": datetime.utcnow().isoformat(),
+                    "reconciled_at": reconciled_at,
                 },
-                user_id=user_id,
-            )
-            
-            # In shadow mode, log adjustment (don't apply)
-            if mode == "shadow":
-                adjustment_amount = ledger_sum - current_balance
-                entry = LedgerEntry(
-                    user_id=user_id,
-                    event_type="ADJUSTMENT",
-                    reason_code="reconciliation_mismatch",
-                    amount=adjustment_amount,
-                    balance_after=ledger_sum,
-                    metadata={
-                        "previous_balance": current_balance,
-                        "ledger_sum": ledger_sum,
-                        "reconciled_at": datetime.utcnow().isoformat(),
-                    },
+            ))
+
+    enqueue_webhook_events(
+        db,
+        [
+            {"event_type": "ring.drift_detected", "payload": payload, "user_id": payload["user_id"]}
+            for payload in drift_payloads
+        ],
+    )
+
+    # All adjustments land in one insert (and, in live mode, one balance update).
+    ledger_ids = append_ledger_entries(db, pending_adjustments, sync_balance=(mode == "live"))
+    for ledger_id, entry in zip(ledger_ids, pending_adjustments):
+        adjustment = {
+            "ledger_id": ledger_id,
+            "user_id": entry.user_id,
+            "adjustment": entry.amount,
+        }
+        if mode == "live":
+            adjustment["applied"] = True
+        adjustments.append(adjustment)
+
+    # Publish event reconciliation (idempotency + missing issuance);
+    # global, so sharded runs leave it to shard 0.
+    if shard_index == 0:
+        _apply_work_mem(db)
+        try:
+            publish_rows = db.execute(
+                text(
+                    """
+                    SELECT id, token_mode, token_ledger_id, token_pending_id
+                    FROM publish_events
+                    WHERE token_mode IN ('shadow', 'live')
+                    """
                 )
-                ledger_id = append_ledger_entry(db, entry)
-                adjustments.append({
-                    "ledger_id": ledger_id,
-                    "user_id": user_id,
-                    "adjustment": adjustment_amount,
-                })
-            
-            # In live mode, apply adjustment
-            elif mode == "live":
-                adjustment_amount = ledger_sum - current_balance
-                entry = LedgerEntry(
-                    user_id=user_id,
-                    event_type="ADJUSTMENT",
-                    reason_code="reconciliation_mismatch",
-                    amount=adjustment_amount,
-                    balance_after=ledger_sum,
-                    metadata={
-                        "previous_balance": current_balance,
-                        "ledger_sum": ledger_sum,
-                        "reconciled_at": datetime.utcnow().isoformat(),
-                    },
+            ).fetchall()
+            for row in publish_rows:
+                event_id, token_mode, ledger_id, pending_id = row
+                if token_mode == "live" and not ledger_id:
+                    publish_missing.append({"event_id": str(event_id), "reason": "ledger_missing"})
+                if token_mode == "shadow" and not pending_id:
+                    publish_missing.append({"event_id": str(event_id), "reason": "pending_missing"})
+
+            duplicate_rows = db.execute(
+                text(
+                    """
+                    SELECT 'ring_ledger' AS source, publish_event_id AS event_id, COUNT(*)
+                    FROM ring_ledger
+                    WHERE publish_event_id IS NOT NULL
+                    GROUP BY publish_event_id
+                    HAVING COUNT(*) > 1
+                    UNION ALL
+                    SELECT 'ring_pending' AS source, publish_event_id AS event_id, COUNT(*)
+                    FROM ring_pending
+                    WHERE publish_event_id IS NOT NULL
+                    GROUP BY publish_event_id
+                    HAVING COUNT(*) > 1
+                    """
                 )
-                ledger_id = append_ledger_entry(db, entry)
-                update_user_balance(db, user_id, ledger_sum)
-                adjustments.append({
-                    "ledger_id": ledger_id,
-                    "user_id": user_id,
-                    "adjustment": adjustment_amount,
-                    "applied": True,
-                })
-
-    # Publish event reconciliation (idempotency + missing issuance)
-    try:
-        publish_rows = db.execute(
-            text(
-                """
-                SELECT id, token_mode, token_ledger_id, token_pending_id
-                FROM publish_events
-                WHERE token_mode IN ('shadow', 'live')
-                """
-            )
-        ).fetchall()
-        for row in publish_rows:
-            event_id, token_mode, ledger_id, pending_id = row
-            if token_mode == "live" and not ledger_id:
-                publish_missing.append({"event_id": str(event_id), "reason": "ledger_missing"})
-            if token_mode == "shadow" and not pending_id:
-                publish_missing.append({"event_id": str(event_id), "reason": "pending_missing"})
-
-        duplicate_ledger_rows = db.execute(
-            text(
-                """
-                SELECT metadata->>'publish_event_id' AS event_id, COUNT(*)
-                FROM ring_ledger
-                WHERE metadata ? 'publish_event_id'
-                GROUP BY metadata->>'publish_event_id'
-                HAVING COUNT(*) > 1
-                """
-            )
-        ).fetchall()
-        for row in duplicate_ledger_rows:
-            publish_duplicates.append({"event_id": row[0], "count": int(row[1]), "source": "ring_ledger"})
-
-        duplicate_pending_rows = db.execute(
-            text(
-                """
-                SELECT metadata->>'publish_event_id' AS event_id, COUNT(*)
-                FROM ring_pending
-                WHERE metadata ? 'publish_event_id'
-                GROUP BY metadata->>'publish_event_id'
-                HAVING COUNT(*) > 1
-                """
-            )
-        ).fetchall()
-        for row in duplicate_pending_rows:
-            publish_duplicates.append({"event_id": row[0], "count": int(row[1]), "source": "ring_pending"})
-    except Exception:
-        publish_missing.append({"event_id": "unknown", "reason": "publish_events_unavailable"})
+            ).fetchall()
+            for row in duplicate_rows:
+                publish_duplicates.append({"event_id": row[1], "count": int(row[2]), "source": row[0]})
+        except Exception:
+            publish_missing.append({"event_id": "unknown", "reason": "publish_events_unavailable"})
     
     return {
         "status": "completed",
         "mode": mode,
-        "users_checked": len(user_ids),
+        "users_checked": users_checked,
         "mismatches_found": len(mismatches),
         "mismatches": mismatches,
         "adjustments": adjustments,
         "publish_missing": publish_missing,
         "publish_duplicates": publish_duplicates,
-        "reconciled_at": datetime.utcnow().isoformat(),
+        "reconciled_at": reconciled_at,
+        "shard": [shard_index, shard_count],
     }
 
 
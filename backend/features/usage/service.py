@@ -10,7 +10,7 @@ Handles:
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Dict, Iterator, Optional, Any, List
 from sqlalchemy import select, insert, func
 
 from backend.core.database import get_db_session, usage_events
@@ -35,47 +35,69 @@ def emit_usage_event(
     Returns:
         UsageEvent instance
     """
-    if occurred_at is None:
-        occurred_at = datetime.now(timezone.utc)
-    elif occurred_at.tzinfo is None:
-        occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+    return emit_usage_events([
+        {
+            "user_id": user_id,
+            "usage_key": usage_key,
+            "occurred_at": occurred_at,
+            "metadata": metadata,
+        }
+    ])[0]
+
+
+def emit_usage_events(events: List[Dict[str, Any]]) -> List[UsageEvent]:
+    """
+    Emit several usage events in one multi-row insert.
+    
+    Writes are synchronous so entitlement checks (get_usage_count) see them
+    immediately; batching only saves the per-event session and round-trip.
+    
+    Args:
+        events: Dicts with user_id, usage_key and optional occurred_at/metadata
+    
+    Returns:
+        UsageEvent instances in input order
+    """
+    now = datetime.now(timezone.utc)
+    rows = []
+    for event in events:
+        occurred_at = event.get("occurred_at") or now
+        if occurred_at.tzinfo is None:
+            occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+        rows.append({
+            "user_id": event["user_id"],
+            "usage_key": event["usage_key"],
+            "occurred_at": occurred_at,
+            "metadata": event.get("metadata"),
+        })
+    
+    if not rows:
+        return []
     
-    # Insert usage event (allow duplicates for now; Phase 4.2+ can add idempotency)
+    # Insert usage events (allow duplicates for now; Phase 4.2+ can add idempotency)
     with get_db_session() as session:
-        session.execute(
-            insert(usage_events).values(
-                user_id=user_id,
-                usage_key=usage_key,
-                occurred_at=occurred_at,
-                metadata=metadata
-            )
-        )
+        session.execute(insert(usage_events).values(rows))
     
-    return UsageEvent(
-        user_id=user_id,
-        usage_key=usage_key,
-        occurred_at=occurred_at,
-        metadata=metadata
-    )
+    return [UsageEvent(**row) for row in rows]
 
 
-def get_usage_events(
+# Rows per server-side cursor fetch when streaming usage events.
+USAGE_EVENTS_FETCH_SIZE = 1000
+
+
+def iter_usage_events(
     user_id: str,
     usage_key: Optional[str] = None,
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None
-) -> List[UsageEvent]:
+) -> Iterator[UsageEvent]:
     """
-    Get usage events for a user.
+    Stream usage events for a user, oldest first.
     
-    Args:
-        user_id: User to query
-        usage_key: Optional filter by usage key
-        start_time: Optional start of time window (inclusive)
-        end_time: Optional end of time window (inclusive)
-    
-    Returns:
-        List of UsageEvent instances
+    Same filters as get_usage_events, but rows come from a server-side
+    cursor in batches of USAGE_EVENTS_FETCH_SIZE, so large windows never sit
+    in memory at once. The session stays open until the iterator is
+    exhausted or closed.
     """
     with get_db_session() as session:
         query = select(usage_events).where(usage_events.c.user_id == user_id)
@@ -93,17 +115,70 @@ def get_usage_events(
                 end_time = end_time.replace(tzinfo=timezone.utc)
             query = query.where(usage_events.c.occurred_at <= end_time)
         
-        rows = session.execute(query.order_by(usage_events.c.occurred_at)).all()
+        rows = session.execute(
+            query.order_by(usage_events.c.occurred_at),
+            execution_options={"yield_per": USAGE_EVENTS_FETCH_SIZE},
+        )
         
-        return [
-            UsageEvent(
+        # Rows are already typed by the column definitions; skip validation.
+        for row in rows:
+            yield UsageEvent.model_construct(
                 user_id=row.user_id,
                 usage_key=row.usage_key,
                 occurred_at=row.occurred_at,
                 metadata=row.metadata
             )
-            for row in rows
-        ]
+
+
+def get_usage_events(
+    user_id: str,
+    usage_key: Optional[str] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None
+) -> List[UsageEvent]:
+    """
+    Get usage events for a user.
+    
+    Args:
+        user_id: User to query
+        usage_key: Optional filter by usage key
+        start_time: Optional start of time window (inclusive)
+        end_time: Optional end of time window (inclusive)
+    
+    Returns:
+        List of UsageEvent instances
+    """
+    return list(iter_usage_events(user_id, usage_key, start_time, end_time))
+
+
+def _count_usage_by_key(
+    user_id: str,
+    usage_key: Optional[str] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None
+) -> Dict[str, int]:
+    """
+    Count usage events per usage_key in the database (GROUP BY).
+    
+    Same filters as get_usage_events, without materializing rows.
+    """
+    with get_db_session() as session:
+        query = (
+            select(usage_events.c.usage_key, func.count())
+            .where(usage_events.c.user_id == user_id)
+            .group_by(usage_events.c.usage_key)
+        )
+        
+        if usage_key:
+            query = query.where(usage_events.c.usage_key == usage_key)
+        
+        if start_time:
+            query = query.where(usage_events.c.occurred_at >= start_time)
+        
+        if end_time:
+            query = query.where(usage_events.c.occurred_at <= end_time)
+        
+        return {key: int(count) for key, count in session.execute(query).all()}
 
 
 def reduce_usage(
@@ -134,14 +209,7 @@ def reduce_usage(
     if window_days:
         start_time = now - timedelta(days=window_days)
     
-    events = get_usage_events(user_id, start_time=start_time, end_time=now)
-    
-    # Count events by usage_key
-    counts: Dict[str, int] = {}
-    for event in events:
-        counts[event.usage_key] = counts.get(event.usage_key, 0) + 1
-    
-    return counts
+    return _count_usage_by_key(user_id, start_time=start_time, end_time=now)
 
 
 def get_usage_count(
@@ -162,5 +230,14 @@ def get_usage_count(
     Returns:
         Count of usage events
     """
-    counts = reduce_usage(user_id, now, window_days)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    elif now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    
+    start_time = None
+    if window_days:
+        start_time = now - timedelta(days=window_days)
+    
+    counts = _count_usage_by_key(user_id, usage_key=usage_key, start_time=start_time, end_time=now)
     return counts.get(usage_key, 0)
@@ -7,7 +7,8 @@ User domain service (Phase 4.0).
 
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import select, insert
+from sqlalchemy import exists, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from backend.core.database import get_db_session, users as app_users
 from backend.models.user import User
@@ -17,36 +18,66 @@ def normalize_display_name(user_id: str, display_name: Optional[str]) -> str:
     return User.normalized_display_name(user_id, display_name)
 
 
+_USER_COLUMNS = (
+    app_users.c.user_id,
+    app_users.c.display_name,
+    app_users.c.status,
+    app_users.c.created_at,
+)
+
+
+def _row_to_user(row) -> User:
+    display = row.display_name or normalize_display_name(row.user_id, None)
+    return User(
+        user_id=row.user_id,
+        created_at=row.created_at,
+        display_name=display,
+        status=row.status,
+    )
+
+
 def get_user(user_id: str) -> Optional[User]:
     with get_db_session() as session:
         row = session.execute(select(app_users).where(app_users.c.user_id == user_id)).first()
         if not row:
             return None
-        display = row.display_name or normalize_display_name(row.user_id, None)
-        return User(
-            user_id=row.user_id,
-            created_at=row.created_at,
-            display_name=display,
-            status=row.status,
-        )
+        return _row_to_user(row)
 
 
 def get_or_create_user(user_id: str) -> User:
-    existing = get_user(user_id)
-    if existing:
-        return existing
-
     now = datetime.now(timezone.utc)
     display = normalize_display_name(user_id, None)
-    with get_db_session() as session:
-        session.execute(
-            insert(app_users).values(
-                user_id=user_id,
-                display_name=display,
-                status="active",
-                created_at=now,
-            )
+    # Insert-or-read in one statement: the INSERT ... ON CONFLICT DO NOTHING
+    # returns the new row, otherwise the statement snapshot supplies the
+    # existing one. A row committed by a concurrent first request while the
+    # INSERT waited is invisible to that snapshot, so the statement returns
+    # nothing and a follow-up SELECT (fresh snapshot) reads it.
+    inserted = (
+        pg_insert(app_users)
+        .values(
+            user_id=user_id,
+            display_name=display,
+            status="active",
+            created_at=now,
         )
+        .on_conflict_do_nothing(index_elements=[app_users.c.user_id])
+        .returning(*_USER_COLUMNS, literal(True).label("created"))
+        .cte("inserted")
+    )
+    stmt = select(inserted).union_all(
+        select(*_USER_COLUMNS, literal(False).label("created"))
+        .where(app_users.c.user_id == user_id)
+        .where(~exists(select(inserted.c.user_id)))
+    )
+    with get_db_session() as session:
+        row = session.execute(stmt).first()
+        if row is None:
+            row = session.execute(
+                select(*_USER_COLUMNS).where(app_users.c.user_id == user_id)
+            ).first()
+            return _row_to_user(row)
+    if not row.created:
+        return _row_to_user(row)
     
     # Phase 4.1: Auto-assign default plan
     try:
@@ -7,9 +7,11 @@ Private artifacts for users waiting for the ring:
 """
 
 from datetime import datetime
-from typing import Optional, Literal
+from typing import Generic, Optional, Literal, TypeVar
 from pydantic import BaseModel, Field, ConfigDict
 
+T = TypeVar("T")
+
 
 class ScratchNote(BaseModel):
     """Private note created by non-ring holder."""
@@ -73,6 +75,15 @@ class VoteRequest(BaseModel):
     value: Literal[1, -1] = Field(description="+1 for upvote, -1 for downvote")
 
 
+class BulkVoteItem(BaseModel):
+    segment_id: str
+    value: Literal[1, -1] = Field(description="+1 for upvote, -1 for downvote")
+
+
+class BulkVoteRequest(BaseModel):
+    votes: list[BulkVoteItem] = Field(min_length=1, max_length=100)
+
+
 class VoteSummary(BaseModel):
     """Aggregate vote counts for a segment."""
     segment_id: str
@@ -85,3 +96,27 @@ class DraftVotesResponse(BaseModel):
     """All vote summaries for a draft."""
     draft_id: str
     segments: list[VoteSummary]
+
+
+class WaitStateResponse(BaseModel):
+    """A user's notes, suggestions and vote summary for one draft."""
+    draft_id: str
+    notes: list[ScratchNote]
+    suggestions: list[QueuedSuggestion]
+    votes: DraftVotesResponse
+
+
+# API envelopes. Declared as response models so FastAPI serializes them
+# straight to JSON bytes in pydantic-core instead of via jsonable_encoder.
+
+class WaitModeEnvelope(BaseModel, Generic[T]):
+    """Standard {data, request_id} response body."""
+    data: T
+    request_id: Optional[str] = None
+
+
+class WaitModePage(BaseModel, Generic[T]):
+    """One page of a cursor-paginated listing."""
+    data: list[T]
+    next_cursor: Optional[str] = None
+    request_id: Optional[str] = None
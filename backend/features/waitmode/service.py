@@ -8,12 +8,15 @@ All operations enforce:
 """
 
 import uuid
-from datetime import datetime, timezone
-from typing import Optional, List
-from sqlalchemy import select, update, delete, and_, func
+from datetime import datetime
+from typing import Optional, List, Set, Tuple
+from sqlalchemy import select, update, delete, func, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 from backend.core.database import get_db_session, wait_notes, wait_suggestions, wait_votes
 from backend.core.errors import NotFoundError, PermissionError, ValidationError
-from backend.features.collaboration.service import get_draft
+from backend.features.collaboration.service import filter_member_drafts, get_draft, get_draft_access
+from backend.models.collab import CollabDraft
 from backend.features.audit.service import record_audit_event
 from backend.core.tracing import start_span
 from backend.core.logging import get_request_id
@@ -23,31 +26,189 @@ from backend.features.waitmode.models import (
     SegmentVote,
     VoteSummary,
     DraftVotesResponse,
+    WaitStateResponse,
 )
 
+# Default page size for note/suggestion listings
+LIST_PAGE_SIZE = 50
+
+# Fixed-shape statements are built once at import and executed with bound
+# parameters, so each call skips constructing (and cache-keying) the Core
+# expression. Bind names avoid column names, which UPDATE/INSERT reserve.
+_INSERT_NOTE = wait_notes.insert().values(
+    note_id=bindparam("b_note_id"),
+    draft_id=bindparam("b_draft_id"),
+    author_user_id=bindparam("b_author_user_id"),
+    content=bindparam("b_content"),
+).returning(wait_notes.c.created_at, wait_notes.c.updated_at)
+
+_UPDATE_OWN_NOTE = (
+    update(wait_notes)
+    .where(
+        wait_notes.c.note_id == bindparam("b_note_id"),
+        wait_notes.c.author_user_id == bindparam("b_user_id"),
+    )
+    .values(content=bindparam("b_content"), updated_at=func.now())
+    .returning(
+        wait_notes.c.draft_id,
+        wait_notes.c.author_user_id,
+        wait_notes.c.created_at,
+        wait_notes.c.updated_at,
+    )
+)
+
+_DELETE_OWN_NOTE = (
+    delete(wait_notes)
+    .where(
+        wait_notes.c.note_id == bindparam("b_note_id"),
+        wait_notes.c.author_user_id == bindparam("b_user_id"),
+    )
+    .returning(wait_notes.c.draft_id)
+)
+
+_INSERT_SUGGESTION = wait_suggestions.insert().values(
+    suggestion_id=bindparam("b_suggestion_id"),
+    draft_id=bindparam("b_draft_id"),
+    author_user_id=bindparam("b_author_user_id"),
+    kind=bindparam("b_kind"),
+    content=bindparam("b_content"),
+    status="queued",
+).returning(wait_suggestions.c.created_at)
+
+_SELECT_SUGGESTION = select(wait_suggestions).where(
+    wait_suggestions.c.suggestion_id == bindparam("b_suggestion_id")
+)
+
+_DISMISS_OWN_SUGGESTION = (
+    update(wait_suggestions)
+    .where(
+        wait_suggestions.c.suggestion_id == bindparam("b_suggestion_id"),
+        wait_suggestions.c.author_user_id == bindparam("b_user_id"),
+    )
+    .values(status="dismissed")
+    .returning(
+        wait_suggestions.c.draft_id,
+        wait_suggestions.c.author_user_id,
+        wait_suggestions.c.kind,
+        wait_suggestions.c.content,
+        wait_suggestions.c.created_at,
+    )
+)
+
+_CONSUME_SUGGESTION = (
+    update(wait_suggestions)
+    .where(wait_suggestions.c.suggestion_id == bindparam("b_suggestion_id"))
+    .values(
+        status="consumed",
+        consumed_at=func.now(),
+        consumed_by_user_id=bindparam("b_user_id"),
+        consumed_segment_id=bindparam("b_segment_id"),
+    )
+    .returning(wait_suggestions.c.consumed_at)
+)
+
+# Upsert on uq_segment_voter: a re-vote keeps its vote_id/created_at.
+# Executed with a parameter list it runs as one multi-row statement.
+_vote_insert = pg_insert(wait_votes).values(
+    vote_id=bindparam("b_vote_id"),
+    draft_id=bindparam("b_draft_id"),
+    segment_id=bindparam("b_segment_id"),
+    voter_user_id=bindparam("b_voter_user_id"),
+    value=bindparam("b_value"),
+)
+_UPSERT_VOTE = _vote_insert.on_conflict_do_update(
+    index_elements=[wait_votes.c.segment_id, wait_votes.c.voter_user_id],
+    set_={"value": _vote_insert.excluded.value},
+).returning(wait_votes.c.vote_id, wait_votes.c.segment_id, wait_votes.c.created_at)
+
+# Per-segment counts and the caller's own vote, aggregated in SQL
+_SELECT_VOTE_COUNTS = (
+    select(
+        wait_votes.c.segment_id,
+        func.count().filter(wait_votes.c.value == 1).label("upvotes"),
+        func.count().filter(wait_votes.c.value != 1).label("downvotes"),
+        func.max(wait_votes.c.value)
+        .filter(wait_votes.c.voter_user_id == bindparam("b_user_id"))
+        .label("user_vote"),
+    )
+    .where(wait_votes.c.draft_id == bindparam("b_draft_id"))
+    .group_by(wait_votes.c.segment_id)
+)
+
+
+def _require_uuid(value: str, kind: str) -> str:
+    """Ids are native UUID columns; anything else cannot exist."""
+    try:
+        uuid.UUID(value)
+    except (ValueError, TypeError, AttributeError):
+        raise NotFoundError(f"{kind.capitalize()} {value} not found")
+    return value
+
 
 class WaitModeService:
     """Service for wait mode operations."""
     
-    def _check_collaborator_access(self, draft_id: str, user_id: str) -> None:
-        """Verify user is creator or collaborator on draft."""
-        draft = get_draft(draft_id)
+    def _check_collaborator_access(
+        self,
+        draft_id: str,
+        user_id: str,
+        session: Optional[Session] = None,
+    ) -> None:
+        """Verify user is creator or collaborator on draft (cached membership)."""
+        access = get_draft_access(draft_id, session=session)
+        if access is None:
+            raise NotFoundError(f"Draft {draft_id} not found")
+        
+        if not access.is_member(user_id):
+            raise PermissionError(f"User {user_id} is not a collaborator on draft {draft_id}")
+    
+    def _get_collaborator_draft(
+        self,
+        draft_id: str,
+        user_id: str,
+        session: Optional[Session] = None,
+    ) -> CollabDraft:
+        """Verify user is creator or collaborator on draft; return the draft.
+        
+        For callers that need the segments; the draft is read fresh.
+        """
+        # Metrics are never needed for authorization; skip computing them.
+        draft = get_draft(draft_id, compute_metrics_flag=False, session=session)
         if not draft:
             raise NotFoundError(f"Draft {draft_id} not found")
         
         # Check if user is creator or collaborator
         if draft.creator_id != user_id and user_id not in draft.collaborators:
             raise PermissionError(f"User {user_id} is not a collaborator on draft {draft_id}")
+        
+        return draft
+    
+    def check_many_collaborator_access(self, draft_ids: List[str], user_id: str) -> Set[str]:
+        """Return the subset of draft_ids the user may access, in one lookup."""
+        return filter_member_drafts(draft_ids, user_id)
     
-    def _check_ring_holder(self, draft_id: str, user_id: str) -> None:
-        """Verify user currently holds the ring."""
-        draft = get_draft(draft_id)
+    def _check_ring_holder(self, draft_id: str, user_id: str, session: Optional[Session] = None) -> None:
+        """Verify user currently holds the ring.
+        
+        Gates writes, so the draft is read fresh: the access cache can lag a
+        ring pass made in another worker.
+        """
+        draft = get_draft(draft_id, compute_metrics_flag=False, session=session)
         if not draft:
             raise NotFoundError(f"Draft {draft_id} not found")
         
         if draft.ring_state.current_holder_id != user_id:
             raise PermissionError(f"User {user_id} does not hold the ring for draft {draft_id}")
     
+    def _raise_not_owned(self, session, table, key_column, key: str, user_id: str, kind: str) -> None:
+        """Explain why an author-scoped write matched no row."""
+        row = session.execute(
+            select(table.c.author_user_id).where(key_column == key)
+        ).fetchone()
+        if not row:
+            raise NotFoundError(f"{kind.capitalize()} {key} not found")
+        raise PermissionError(f"User {user_id} is not the author of {kind} {key}")
+    
     # ===== SCRATCH NOTES =====
     
     def create_note(
@@ -59,72 +220,91 @@ class WaitModeService:
     ) -> ScratchNote:
         """Create a private scratch note."""
         with start_span("waitmode.create_note", {"draft_id": draft_id, "user_id": author_user_id}):
-            self._check_collaborator_access(draft_id, author_user_id)
-            
             note_id = str(uuid.uuid4())
-            now = datetime.now(timezone.utc)
             
             with get_db_session() as session:
-                session.execute(
-                    wait_notes.insert().values(
-                        note_id=note_id,
-                        draft_id=draft_id,
-                        author_user_id=author_user_id,
-                        content=content,
-                        created_at=now,
-                        updated_at=now,
-                    )
+                self._check_collaborator_access(draft_id, author_user_id, session=session)
+                
+                # Timestamps come from the column defaults (database clock)
+                row = session.execute(
+                    _INSERT_NOTE,
+                    {
+                        "b_note_id": note_id,
+                        "b_draft_id": draft_id,
+                        "b_author_user_id": author_user_id,
+                        "b_content": content,
+                    },
+                ).fetchone()
+                record_audit_event(
+                    action="wait_note_created",
+                    user_id=author_user_id,
+                    draft_id=draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={"note_id": note_id},
+                    session=session,
                 )
                 session.commit()
             
-            record_audit_event(
-                action="wait_note_created",
-                user_id=author_user_id,
-                draft_id=draft_id,
-                request_id=request_id or get_request_id(),
-                metadata={"note_id": note_id},
-            )
-            
             return ScratchNote(
                 note_id=note_id,
                 draft_id=draft_id,
                 author_user_id=author_user_id,
                 content=content,
-                created_at=now,
-                updated_at=now,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
             )
     
     def list_notes(
         self,
         draft_id: str,
         user_id: str,
+        limit: int = LIST_PAGE_SIZE,
+        cursor: Optional[datetime] = None,
     ) -> List[ScratchNote]:
-        """List notes for a draft (author-only)."""
-        with start_span("waitmode.list_notes", {"draft_id": draft_id, "user_id": user_id}):
-            self._check_collaborator_access(draft_id, user_id)
-            
+        """List notes for a draft (author-only), newest first.
+        
+        Returns at most `limit` notes created before `cursor` (the
+        created_at of the last note of the previous page).
+        """
+        with start_span("waitmode.list_notes", {"draft_id": draft_id, "user_id": user_id, "limit": limit}):
             with get_db_session() as session:
-                result = session.execute(
-                    select(wait_notes)
-                    .where(and_(
-                        wait_notes.c.draft_id == draft_id,
-                        wait_notes.c.author_user_id == user_id,
-                    ))
-                    .order_by(wait_notes.c.created_at.desc())
-                )
-                rows = result.fetchall()
-            
-            return [
-                ScratchNote(
-                    note_id=row.note_id,
-                    draft_id=row.draft_id,
-                    author_user_id=row.author_user_id,
-                    content=row.content,
-                    created_at=row.created_at,
-                    updated_at=row.updated_at,
-                )
-                for row in rows
-            ]
+                self._check_collaborator_access(draft_id, user_id, session=session)
+                return self._query_notes(session, draft_id, user_id, limit=limit, cursor=cursor)
+    
+    def _query_notes(
+        self,
+        session: Session,
+        draft_id: str,
+        user_id: str,
+        limit: int = LIST_PAGE_SIZE,
+        cursor: Optional[datetime] = None,
+    ) -> List[ScratchNote]:
+        query = select(wait_notes).where(
+            wait_notes.c.draft_id == draft_id,
+            wait_notes.c.author_user_id == user_id,
+        )
+        
+        # Keyset pagination: seeks idx_wait_notes_draft_author_created
+        if cursor is not None:
+            query = query.where(wait_notes.c.created_at < cursor)
+        
+        rows = session.execute(
+            query.order_by(wait_notes.c.created_at.desc()).limit(limit)
+        )
+        
+        # Rows are already typed by the column definitions; skip validation.
+        # Models are built straight off the cursor (no intermediate row list).
+        return [
+            ScratchNote.model_construct(
+                note_id=row.note_id,
+                draft_id=row.draft_id,
+                author_user_id=row.author_user_id,
+                content=row.content,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in rows
+        ]
     
     def update_note(
         self,
@@ -135,42 +315,34 @@ class WaitModeService:
     ) -> ScratchNote:
         """Update a note (author only)."""
         with start_span("waitmode.update_note", {"note_id": note_id, "user_id": user_id}):
+            _require_uuid(note_id, "note")
             with get_db_session() as session:
-                # Fetch existing note
-                result = session.execute(
-                    select(wait_notes).where(wait_notes.c.note_id == note_id)
-                )
-                row = result.fetchone()
+                # Ownership is part of the UPDATE; only a miss costs a lookup
+                row = session.execute(
+                    _UPDATE_OWN_NOTE,
+                    {"b_note_id": note_id, "b_user_id": user_id, "b_content": content},
+                ).fetchone()
                 
                 if not row:
-                    raise NotFoundError(f"Note {note_id} not found")
-                
-                if row.author_user_id != user_id:
-                    raise PermissionError(f"User {user_id} is not the author of note {note_id}")
+                    self._raise_not_owned(session, wait_notes, wait_notes.c.note_id, note_id, user_id, "note")
                 
-                now = datetime.now(timezone.utc)
-                session.execute(
-                    update(wait_notes)
-                    .where(wait_notes.c.note_id == note_id)
-                    .values(content=content, updated_at=now)
+                record_audit_event(
+                    action="wait_note_updated",
+                    user_id=user_id,
+                    draft_id=row.draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={"note_id": note_id},
+                    session=session,
                 )
                 session.commit()
             
-            record_audit_event(
-                action="wait_note_updated",
-                user_id=user_id,
-                draft_id=row.draft_id,
-                request_id=request_id or get_request_id(),
-                metadata={"note_id": note_id},
-            )
-            
             return ScratchNote(
                 note_id=note_id,
                 draft_id=row.draft_id,
                 author_user_id=row.author_user_id,
                 content=content,
                 created_at=row.created_at,
-                updated_at=now,
+                updated_at=row.updated_at,
             )
     
     def delete_note(
@@ -181,31 +353,25 @@ class WaitModeService:
     ) -> None:
         """Delete a note (author only)."""
         with start_span("waitmode.delete_note", {"note_id": note_id, "user_id": user_id}):
+            _require_uuid(note_id, "note")
             with get_db_session() as session:
-                # Fetch to verify ownership
-                result = session.execute(
-                    select(wait_notes).where(wait_notes.c.note_id == note_id)
-                )
-                row = result.fetchone()
+                row = session.execute(
+                    _DELETE_OWN_NOTE,
+                    {"b_note_id": note_id, "b_user_id": user_id},
+                ).fetchone()
                 
                 if not row:
-                    raise NotFoundError(f"Note {note_id} not found")
-                
-                if row.author_user_id != user_id:
-                    raise PermissionError(f"User {user_id} is not the author of note {note_id}")
+                    self._raise_not_owned(session, wait_notes, wait_notes.c.note_id, note_id, user_id, "note")
                 
-                session.execute(
-                    delete(wait_notes).where(wait_notes.c.note_id == note_id)
+                record_audit_event(
+                    action="wait_note_deleted",
+                    user_id=user_id,
+                    draft_id=row.draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={"note_id": note_id},
+                    session=session,
                 )
                 session.commit()
-            
-            record_audit_event(
-                action="wait_note_deleted",
-                user_id=user_id,
-                draft_id=row.draft_id,
-                request_id=request_id or get_request_id(),
-                metadata={"note_id": note_id},
-            )
     
     # ===== QUEUED SUGGESTIONS =====
     
@@ -219,33 +385,31 @@ class WaitModeService:
     ) -> QueuedSuggestion:
         """Create a queued suggestion."""
         with start_span("waitmode.create_suggestion", {"draft_id": draft_id, "user_id": author_user_id, "kind": kind}):
-            self._check_collaborator_access(draft_id, author_user_id)
-            
             suggestion_id = str(uuid.uuid4())
-            now = datetime.now(timezone.utc)
             
             with get_db_session() as session:
-                session.execute(
-                    wait_suggestions.insert().values(
-                        suggestion_id=suggestion_id,
-                        draft_id=draft_id,
-                        author_user_id=author_user_id,
-                        kind=kind,
-                        content=content,
-                        status="queued",
-                        created_at=now,
-                    )
+                self._check_collaborator_access(draft_id, author_user_id, session=session)
+                
+                created_at = session.execute(
+                    _INSERT_SUGGESTION,
+                    {
+                        "b_suggestion_id": suggestion_id,
+                        "b_draft_id": draft_id,
+                        "b_author_user_id": author_user_id,
+                        "b_kind": kind,
+                        "b_content": content,
+                    },
+                ).scalar_one()
+                record_audit_event(
+                    action="wait_suggestion_created",
+                    user_id=author_user_id,
+                    draft_id=draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={"suggestion_id": suggestion_id, "kind": kind},
+                    session=session,
                 )
                 session.commit()
             
-            record_audit_event(
-                action="wait_suggestion_created",
-                user_id=author_user_id,
-                draft_id=draft_id,
-                request_id=request_id or get_request_id(),
-                metadata={"suggestion_id": suggestion_id, "kind": kind},
-            )
-            
             return QueuedSuggestion(
                 suggestion_id=suggestion_id,
                 draft_id=draft_id,
@@ -253,7 +417,7 @@ class WaitModeService:
                 kind=kind,
                 content=content,
                 status="queued",
-                created_at=now,
+                created_at=created_at,
             )
     
     def list_suggestions(
@@ -261,40 +425,60 @@ class WaitModeService:
         draft_id: str,
         user_id: str,
         status: Optional[str] = None,
+        limit: int = LIST_PAGE_SIZE,
+        cursor: Optional[datetime] = None,
     ) -> List[QueuedSuggestion]:
-        """List suggestions for a draft (author-only by default)."""
-        with start_span("waitmode.list_suggestions", {"draft_id": draft_id, "user_id": user_id, "status": status}):
-            self._check_collaborator_access(draft_id, user_id)
-            
+        """List suggestions for a draft (author-only by default), newest first.
+        
+        Returns at most `limit` suggestions created before `cursor`.
+        """
+        with start_span("waitmode.list_suggestions", {"draft_id": draft_id, "user_id": user_id, "status": status, "limit": limit}):
             with get_db_session() as session:
-                query = select(wait_suggestions).where(and_(
-                    wait_suggestions.c.draft_id == draft_id,
-                    wait_suggestions.c.author_user_id == user_id,
-                ))
-                
-                if status:
-                    query = query.where(wait_suggestions.c.status == status)
-                
-                query = query.order_by(wait_suggestions.c.created_at.desc())
-                
-                result = session.execute(query)
-                rows = result.fetchall()
-            
-            return [
-                QueuedSuggestion(
-                    suggestion_id=row.suggestion_id,
-                    draft_id=row.draft_id,
-                    author_user_id=row.author_user_id,
-                    kind=row.kind,
-                    content=row.content,
-                    status=row.status,
-                    created_at=row.created_at,
-                    consumed_at=row.consumed_at,
-                    consumed_by_user_id=row.consumed_by_user_id,
-                    consumed_segment_id=row.consumed_segment_id,
+                self._check_collaborator_access(draft_id, user_id, session=session)
+                return self._query_suggestions(
+                    session, draft_id, user_id, status, limit=limit, cursor=cursor
                 )
-                for row in rows
-            ]
+    
+    def _query_suggestions(
+        self,
+        session: Session,
+        draft_id: str,
+        user_id: str,
+        status: Optional[str] = None,
+        limit: int = LIST_PAGE_SIZE,
+        cursor: Optional[datetime] = None,
+    ) -> List[QueuedSuggestion]:
+        query = select(wait_suggestions).where(
+            wait_suggestions.c.draft_id == draft_id,
+            wait_suggestions.c.author_user_id == user_id,
+        )
+        
+        if status:
+            query = query.where(wait_suggestions.c.status == status)
+        if cursor is not None:
+            query = query.where(wait_suggestions.c.created_at < cursor)
+        
+        rows = session.execute(
+            query.order_by(wait_suggestions.c.created_at.desc()).limit(limit)
+        )
+        
+        # Rows are already typed by the column definitions; skip validation.
+        # Models are built straight off the cursor (no intermediate row list).
+        return [
+            QueuedSuggestion.model_construct(
+                suggestion_id=row.suggestion_id,
+                draft_id=row.draft_id,
+                author_user_id=row.author_user_id,
+                kind=row.kind,
+                content=row.content,
+                status=row.status,
+                created_at=row.created_at,
+                consumed_at=row.consumed_at,
+                consumed_by_user_id=row.consumed_by_user_id,
+                consumed_segment_id=row.consumed_segment_id,
+            )
+            for row in rows
+        ]
     
     def dismiss_suggestion(
         self,
@@ -304,33 +488,29 @@ class WaitModeService:
     ) -> QueuedSuggestion:
         """Dismiss a suggestion (author only)."""
         with start_span("waitmode.dismiss_suggestion", {"suggestion_id": suggestion_id, "user_id": user_id}):
+            _require_uuid(suggestion_id, "suggestion")
             with get_db_session() as session:
-                result = session.execute(
-                    select(wait_suggestions).where(wait_suggestions.c.suggestion_id == suggestion_id)
-                )
-                row = result.fetchone()
+                row = session.execute(
+                    _DISMISS_OWN_SUGGESTION,
+                    {"b_suggestion_id": suggestion_id, "b_user_id": user_id},
+                ).fetchone()
                 
                 if not row:
-                    raise NotFoundError(f"Suggestion {suggestion_id} not found")
-                
-                if row.author_user_id != user_id:
-                    raise PermissionError(f"User {user_id} is not the author of suggestion {suggestion_id}")
+                    self._raise_not_owned(
+                        session, wait_suggestions, wait_suggestions.c.suggestion_id,
+                        suggestion_id, user_id, "suggestion",
+                    )
                 
-                session.execute(
-                    update(wait_suggestions)
-                    .where(wait_suggestions.c.suggestion_id == suggestion_id)
-                    .values(status="dismissed")
+                record_audit_event(
+                    action="wait_suggestion_dismissed",
+                    user_id=user_id,
+                    draft_id=row.draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={"suggestion_id": suggestion_id},
+                    session=session,
                 )
                 session.commit()
             
-            record_audit_event(
-                action="wait_suggestion_dismissed",
-                user_id=user_id,
-                draft_id=row.draft_id,
-                request_id=request_id or get_request_id(),
-                metadata={"suggestion_id": suggestion_id},
-            )
-            
             return QueuedSuggestion(
                 suggestion_id=suggestion_id,
                 draft_id=row.draft_id,
@@ -350,39 +530,32 @@ class WaitModeService:
     ) -> QueuedSuggestion:
         """Consume a suggestion (ring holder only)."""
         with start_span("waitmode.consume_suggestion", {"suggestion_id": suggestion_id, "user_id": user_id}):
+            _require_uuid(suggestion_id, "suggestion")
             with get_db_session() as session:
-                result = session.execute(
-                    select(wait_suggestions).where(wait_suggestions.c.suggestion_id == suggestion_id)
-                )
-                row = result.fetchone()
+                row = session.execute(
+                    _SELECT_SUGGESTION, {"b_suggestion_id": suggestion_id}
+                ).fetchone()
                 
                 if not row:
                     raise NotFoundError(f"Suggestion {suggestion_id} not found")
                 
                 # Check ring holder permission
-                self._check_ring_holder(row.draft_id, user_id)
+                self._check_ring_holder(row.draft_id, user_id, session=session)
                 
-                now = datetime.now(timezone.utc)
-                session.execute(
-                    update(wait_suggestions)
-                    .where(wait_suggestions.c.suggestion_id == suggestion_id)
-                    .values(
-                        status="consumed",
-                        consumed_at=now,
-                        consumed_by_user_id=user_id,
-                        consumed_segment_id=segment_id,
-                    )
+                consumed_at = session.execute(
+                    _CONSUME_SUGGESTION,
+                    {"b_suggestion_id": suggestion_id, "b_user_id": user_id, "b_segment_id": segment_id},
+                ).scalar_one()
+                record_audit_event(
+                    action="wait_suggestion_consumed",
+                    user_id=user_id,
+                    draft_id=row.draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={"suggestion_id": suggestion_id, "segment_id": segment_id},
+                    session=session,
                 )
                 session.commit()
             
-            record_audit_event(
-                action="wait_suggestion_consumed",
-                user_id=user_id,
-                draft_id=row.draft_id,
-                request_id=request_id or get_request_id(),
-                metadata={"suggestion_id": suggestion_id, "segment_id": segment_id},
-            )
-            
             return QueuedSuggestion(
                 suggestion_id=suggestion_id,
                 draft_id=row.draft_id,
@@ -391,7 +564,7 @@ class WaitModeService:
                 content=row.content,
                 status="consumed",
                 created_at=row.created_at,
-                consumed_at=now,
+                consumed_at=consumed_at,
                 consumed_by_user_id=user_id,
                 consumed_segment_id=segment_id,
             )
@@ -408,64 +581,101 @@ class WaitModeService:
     ) -> SegmentVote:
         """Vote on a segment (upsert behavior)."""
         with start_span("waitmode.vote_segment", {"draft_id": draft_id, "segment_id": segment_id, "user_id": voter_user_id, "value": value}):
-            self._check_collaborator_access(draft_id, voter_user_id)
-            
             vote_id = str(uuid.uuid4())
-            now = datetime.now(timezone.utc)
             
             with get_db_session() as session:
-                # Check if vote exists
-                result = session.execute(
-                    select(wait_votes).where(and_(
-                        wait_votes.c.segment_id == segment_id,
-                        wait_votes.c.voter_user_id == voter_user_id,
-                    ))
-                )
-                existing = result.fetchone()
-                
-                if existing:
-                    # Update existing vote
-                    session.execute(
-                        update(wait_votes)
-                        .where(and_(
-                            wait_votes.c.segment_id == segment_id,
-                            wait_votes.c.voter_user_id == voter_user_id,
-                        ))
-                        .values(value=value)
-                    )
-                    vote_id = existing.vote_id
-                else:
-                    # Insert new vote
-                    session.execute(
-                        wait_votes.insert().values(
-                            vote_id=vote_id,
-                            draft_id=draft_id,
-                            segment_id=segment_id,
-                            voter_user_id=voter_user_id,
-                            value=value,
-                            created_at=now,
-                        )
-                    )
+                self._check_collaborator_access(draft_id, voter_user_id, session=session)
                 
+                row = session.execute(
+                    _UPSERT_VOTE,
+                    {
+                        "b_vote_id": vote_id,
+                        "b_draft_id": draft_id,
+                        "b_segment_id": segment_id,
+                        "b_voter_user_id": voter_user_id,
+                        "b_value": value,
+                    },
+                ).fetchone()
+                record_audit_event(
+                    action="wait_vote_set",
+                    user_id=voter_user_id,
+                    draft_id=draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={"segment_id": segment_id, "value": value},
+                    session=session,
+                )
                 session.commit()
             
-            record_audit_event(
-                action="wait_vote_set",
-                user_id=voter_user_id,
-                draft_id=draft_id,
-                request_id=request_id or get_request_id(),
-                metadata={"segment_id": segment_id, "value": value},
-            )
-            
             return SegmentVote(
-                vote_id=vote_id,
+                vote_id=row.vote_id,
                 draft_id=draft_id,
                 segment_id=segment_id,
                 voter_user_id=voter_user_id,
                 value=value,
-                created_at=now,
+                created_at=row.created_at,
             )
     
+    def vote_segments_bulk(
+        self,
+        draft_id: str,
+        voter_user_id: str,
+        votes: List[Tuple[str, int]],
+        request_id: Optional[str] = None,
+    ) -> List[SegmentVote]:
+        """Vote on several segments at once (upsert behavior).
+        
+        One access check, one multi-row upsert and one audit event. If a
+        segment appears more than once, its last vote wins.
+        """
+        # A single upsert statement cannot touch the same row twice
+        latest = dict(votes)
+        if not latest:
+            raise ValidationError("At least one vote is required")
+        
+        with start_span("waitmode.vote_segments_bulk", {"draft_id": draft_id, "user_id": voter_user_id, "count": len(latest)}):
+            with get_db_session() as session:
+                self._check_collaborator_access(draft_id, voter_user_id, session=session)
+                
+                rows = session.execute(
+                    _UPSERT_VOTE,
+                    [
+                        {
+                            "b_vote_id": str(uuid.uuid4()),
+                            "b_draft_id": draft_id,
+                            "b_segment_id": segment_id,
+                            "b_voter_user_id": voter_user_id,
+                            "b_value": value,
+                        }
+                        for segment_id, value in latest.items()
+                    ],
+                ).fetchall()
+                record_audit_event(
+                    action="wait_votes_set",
+                    user_id=voter_user_id,
+                    draft_id=draft_id,
+                    request_id=request_id or get_request_id(),
+                    metadata={
+                        "votes": [
+                            {"segment_id": segment_id, "value": value}
+                            for segment_id, value in latest.items()
+                        ],
+                    },
+                    session=session,
+                )
+                session.commit()
+            
+            return [
+                SegmentVote(
+                    vote_id=row.vote_id,
+                    draft_id=draft_id,
+                    segment_id=row.segment_id,
+                    voter_user_id=voter_user_id,
+                    value=latest[row.segment_id],
+                    created_at=row.created_at,
+                )
+                for row in rows
+            ]
+    
     def list_votes(
         self,
         draft_id: str,
@@ -473,51 +683,56 @@ class WaitModeService:
     ) -> DraftVotesResponse:
         """List votes for all segments in a draft."""
         with start_span("waitmode.list_votes", {"draft_id": draft_id, "user_id": user_id}):
-            self._check_collaborator_access(draft_id, user_id)
-            
-            draft = get_draft(draft_id)
-            if not draft:
-                raise NotFoundError(f"Draft {draft_id} not found")
-            
             with get_db_session() as session:
-                result = session.execute(
-                    select(wait_votes).where(wait_votes.c.draft_id == draft_id)
-                )
-                votes = result.fetchall()
-            
-            # Aggregate votes by segment
-            vote_map = {}
-            user_votes = {}
-            
-            for vote in votes:
-                seg_id = vote.segment_id
-                if seg_id not in vote_map:
-                    vote_map[seg_id] = {"upvotes": 0, "downvotes": 0}
-                
-                if vote.value == 1:
-                    vote_map[seg_id]["upvotes"] += 1
-                else:
-                    vote_map[seg_id]["downvotes"] += 1
-                
-                if vote.voter_user_id == user_id:
-                    user_votes[seg_id] = vote.value
-            
-            # Build response for each segment
-            summaries = []
-            for segment in draft.segments:
-                seg_id = segment.segment_id
-                summary = VoteSummary(
-                    segment_id=seg_id,
-                    upvotes=vote_map.get(seg_id, {}).get("upvotes", 0),
-                    downvotes=vote_map.get(seg_id, {}).get("downvotes", 0),
-                    user_vote=user_votes.get(seg_id),
-                )
-                summaries.append(summary)
-            
-            return DraftVotesResponse(
-                draft_id=draft_id,
-                segments=summaries,
+                draft = self._get_collaborator_draft(draft_id, user_id, session=session)
+                return self._query_votes(session, draft, user_id)
+    
+    def _query_votes(self, session: Session, draft: CollabDraft, user_id: str) -> DraftVotesResponse:
+        result = session.execute(
+            _SELECT_VOTE_COUNTS, {"b_draft_id": draft.draft_id, "b_user_id": user_id}
+        )
+        # Keyed by segment in a single pass over the cursor
+        counts = {row.segment_id: row for row in result}
+        
+        # Build response for each segment (counts are computed here, so
+        # skip validation)
+        summaries = []
+        for segment in draft.segments:
+            row = counts.get(segment.segment_id)
+            summary = VoteSummary.model_construct(
+                segment_id=segment.segment_id,
+                upvotes=row.upvotes if row else 0,
+                downvotes=row.downvotes if row else 0,
+                user_vote=row.user_vote if row else None,
             )
+            summaries.append(summary)
+        
+        return DraftVotesResponse.model_construct(
+            draft_id=draft.draft_id,
+            segments=summaries,
+        )
+    
+    # ===== COMBINED =====
+    
+    def get_user_wait_state(
+        self,
+        draft_id: str,
+        user_id: str,
+    ) -> WaitStateResponse:
+        """Notes, suggestions and vote summary for a draft with one access check and one session.
+        
+        Notes and suggestions are the first page of each list; later pages
+        come from list_notes/list_suggestions with a cursor.
+        """
+        with start_span("waitmode.get_user_wait_state", {"draft_id": draft_id, "user_id": user_id}):
+            with get_db_session() as session:
+                draft = self._get_collaborator_draft(draft_id, user_id, session=session)
+                return WaitStateResponse.model_construct(
+                    draft_id=draft_id,
+                    notes=self._query_notes(session, draft_id, user_id),
+                    suggestions=self._query_suggestions(session, draft_id, user_id),
+                    votes=self._query_votes(session, draft, user_id),
+                )
 
 
 # Singleton service
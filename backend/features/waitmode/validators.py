@@ -1,11 +1,13 @@
 """Wait mode validators (Phase 8.4)."""
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict
 from typing import Literal, Optional
 
 
 class WaitModeFilters(BaseModel):
     """Query filters for wait mode lists."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     status: Optional[Literal["queued", "consumed", "dismissed"]] = None
     shared: Optional[bool] = False  # For future: shared suggestions visible to others
@@ -1,16 +1,22 @@
+import hashlib
+import importlib
+import io
 import logging
 import json
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Annotated, Literal, Optional
 
 import re
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from dotenv import load_dotenv
 
 # Load env from backend/.env
@@ -40,12 +46,9 @@ try:
     from backend.core.middleware.ratelimit import RateLimitMiddleware
     from backend.core.ratelimit import build_rate_limit_config_from_env
     from backend.core.tracing import setup_tracing
-    from backend.api import auth, posts, analytics, streaks, challenges, coach, momentum, profile, archetypes, sharecard, collaboration, collaboration_invites, health, billing, admin_billing, realtime, metrics, ai, format as format_api, timeline, export as export_api, waitmode, insights, enforcement, monitoring_enforcement, monitoring_tokens, monitoring_external, tokens, external, external_admin
-    from backend.agents.viral_thread import generate_viral_thread
-    from backend.features.enforcement.service import EnforcementRequest, run_enforcement_pipeline, get_enforcement_mode
+    from backend.features.enforcement.service import EnforcementRequest, EnforcementResult, run_enforcement_pipeline, get_enforcement_mode
     import groq
-    from redis import Redis
-    from rq import Queue
+    import httpx
 except ImportError as e:
     print(f"[FATAL] Import error: {e}")
     print(f"[FATAL] backend_dir: {backend_dir}")
@@ -73,6 +76,11 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         logging.getLogger("onering").info("Stopping OneRing backend...")
+        # Only close the Groq pool if a request actually opened it.
+        if get_groq_http_client.cache_info().currsize:
+            await get_groq_http_client().aclose()
+            get_groq_http_client.cache_clear()
+            get_async_groq_client.cache_clear()
 
 
 app = FastAPI(title="OneRing - Backend (dev)", lifespan=lifespan)
@@ -82,11 +90,41 @@ app.add_middleware(RequestIdMiddleware)
 app.add_middleware(TracingMiddleware)
 app.add_middleware(RateLimitMiddleware, config=build_rate_limit_config_from_env(os.environ))
 app.add_middleware(MetricsMiddleware)
+# JSON bodies over 1 KiB are gzipped when the client accepts it;
+# text/event-stream responses are excluded by the middleware (Starlette
+# 0.46.0+, pinned in requirements.txt).
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+_NUMBERING_RE = re.compile(r"^\s*(?:\d+(?:/\d+)?[.):\-\]]*\s*|(?:Tweet\s+)?\d+\s*[-:).]?\s*|[(\[]\d+[)\]]\s*|[-•*]+\s*)")
 
 
 def strip_numbering_line(text: str) -> str:
     """Remove any leading numbering or bullets from a single line."""
-    return re.sub(r"^\s*(?:\d+(?:/\d+)?[.):\-\]]*\s*|(?:Tweet\s+)?\d+\s*[-:).]?\s*|[-•*]+\s*)", "", text).lstrip()
+    # Hand-rolled equivalent of _NUMBERING_RE for digit and bullet prefixes;
+    # only "Tweet N", "(N)" and "[N]" lines still go through the regex engine.
+    line = text.lstrip()
+    if not line:
+        return line
+    first = line[0]
+    if first.isdecimal():
+        # "<digits>[/<digits>]" then any run of . ) : - ]
+        n = len(line)
+        i = 1
+        while i < n and line[i].isdecimal():
+            i += 1
+        if i + 1 < n and line[i] == "/" and line[i + 1].isdecimal():
+            i += 2
+            while i < n and line[i].isdecimal():
+                i += 1
+        while i < n and line[i] in ".):-]":
+            i += 1
+        return line[i:].lstrip()
+    if first in "-•*":
+        return line.lstrip("-•*").lstrip()
+    if first in "T([":
+        return _NUMBERING_RE.sub("", line).lstrip()
+    return line
 
 app.add_exception_handler(AppError, app_error_handler)
 app.add_exception_handler(HTTPException, http_error_handler)
@@ -101,39 +139,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
-app.include_router(posts.router, prefix="/api/posts", tags=["posts"])
-app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
-# Legacy alias to support direct /v1/analytics/* paths used in tests/clients
-app.include_router(analytics.router, tags=["analytics-legacy"])
-app.include_router(insights.router, tags=["insights"])
-app.include_router(streaks.router, tags=["streaks"])
-app.include_router(challenges.router, tags=["challenges"])
-app.include_router(coach.router, tags=["coach"])
-app.include_router(momentum.router, tags=["momentum"])
-app.include_router(profile.router, tags=["profile"])
-app.include_router(sharecard.router, prefix="/v1", tags=["sharecard"])
-app.include_router(collaboration.router, tags=["collaboration"])
-app.include_router(collaboration_invites.router, tags=["collaboration-invites"])
-app.include_router(realtime.router, tags=["realtime"])
-app.include_router(archetypes.router, tags=["archetypes"])
-app.include_router(health.router, tags=["health"])
-app.include_router(health.root_router, tags=["health"])
-app.include_router(metrics.router, tags=["metrics"])
-app.include_router(billing.router, prefix="/api", tags=["billing"])
-app.include_router(admin_billing.router, tags=["admin-billing"])
-app.include_router(ai.router, tags=["ai"])
-app.include_router(enforcement.router, tags=["enforcement"])
-app.include_router(monitoring_enforcement.router, tags=["monitoring"])
-app.include_router(monitoring_tokens.router, tags=["monitoring"])
-app.include_router(monitoring_external.router, tags=["monitoring"])
-app.include_router(format_api.router, tags=["format"])
-app.include_router(timeline.router, tags=["timeline"])
-app.include_router(export_api.router, tags=["export"])
-app.include_router(waitmode.router, tags=["waitmode"])
-app.include_router(tokens.router, tags=["tokens"])
-app.include_router(external.router, tags=["external"])
-app.include_router(external_admin.router, tags=["admin-external"])
+# (backend.api module, router attribute, include_router kwargs), in mount
+# order. Modules are imported by _mount_routers, so a worker only loads the
+# routers it actually serves.
+_ROUTERS = [
+    ("auth", "router", {"prefix": "/api/auth", "tags": ["auth"]}),
+    ("posts", "router", {"prefix": "/api/posts", "tags": ["posts"]}),
+    ("analytics", "router", {"prefix": "/api/analytics", "tags": ["analytics"]}),
+    # Legacy alias to support direct /v1/analytics/* paths used in tests/clients
+    ("analytics", "router", {"tags": ["analytics-legacy"]}),
+    ("insights", "router", {"tags": ["insights"]}),
+    ("streaks", "router", {"tags": ["streaks"]}),
+    ("challenges", "router", {"tags": ["challenges"]}),
+    ("coach", "router", {"tags": ["coach"]}),
+    ("momentum", "router", {"tags": ["momentum"]}),
+    ("profile", "router", {"tags": ["profile"]}),
+    ("sharecard", "router", {"prefix": "/v1", "tags": ["sharecard"]}),
+    ("collaboration", "router", {"tags": ["collaboration"]}),
+    ("collaboration_invites", "router", {"tags": ["collaboration-invites"]}),
+    ("realtime", "router", {"tags": ["realtime"]}),
+    ("archetypes", "router", {"tags": ["archetypes"]}),
+    ("health", "router", {"tags": ["health"]}),
+    ("health", "root_router", {"tags": ["health"]}),
+    ("metrics", "router", {"tags": ["metrics"]}),
+    ("billing", "router", {"prefix": "/api", "tags": ["billing"]}),
+    ("admin_billing", "router", {"tags": ["admin-billing"]}),
+    ("ai", "router", {"tags": ["ai"]}),
+    ("enforcement", "router", {"tags": ["enforcement"]}),
+    ("monitoring_enforcement", "router", {"tags": ["monitoring"]}),
+    ("monitoring_tokens", "router", {"tags": ["monitoring"]}),
+    ("monitoring_external", "router", {"tags": ["monitoring"]}),
+    ("format", "router", {"tags": ["format"]}),
+    ("timeline", "router", {"tags": ["timeline"]}),
+    ("export", "router", {"tags": ["export"]}),
+    ("waitmode", "router", {"tags": ["waitmode"]}),
+    ("tokens", "router", {"tags": ["tokens"]}),
+    ("external", "router", {"tags": ["external"]}),
+    ("external_admin", "router", {"tags": ["admin-external"]}),
+]
+
+# Operator-only routers, skipped (and never imported) when
+# ADMIN_ROUTES_ENABLED is off, e.g. on public-facing workers.
+_ADMIN_ROUTER_MODULES = {"admin_billing", "external_admin"}
+
+
+def _mount_routers(app: FastAPI) -> None:
+    for module_name, attr, kwargs in _ROUTERS:
+        if module_name in _ADMIN_ROUTER_MODULES and not settings.ADMIN_ROUTES_ENABLED:
+            continue
+        module = importlib.import_module(f"backend.api.{module_name}")
+        app.include_router(getattr(module, attr), **kwargs)
+
+
+_mount_routers(app)
 
 @app.get("/v1/test")
 def test_endpoint():
@@ -145,78 +203,144 @@ def test_endpoint():
 
 # Define request schema for generation endpoint
 class GenerateRequest(BaseModel):
-    prompt: str
-    type: str  # "simple" or "viral_thread"
-    platform: str
-    user_id: str
+    # Whitespace is stripped before the length checks, so blank fields are
+    # rejected with a 422 before the handler runs.
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    prompt: Annotated[str, StringConstraints(min_length=1)]
+    type: Literal["simple", "viral_thread"]
+    platform: Annotated[str, StringConstraints(min_length=1)]
+    user_id: Annotated[str, StringConstraints(min_length=1)]
     stream: bool = True
 
 
-async def stream_groq_response(prompt: str, collector: list | None = None):
+# SSE frames are yielded as bytes so StreamingResponse sends them without
+# re-encoding each chunk.
+_SSE_DATA = b"data: "
+_SSE_END = b"\n\n"
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+class SSEResponse(StreamingResponse):
+    """Event stream with the no-cache / no-proxy-buffering headers every SSE endpoint sends."""
+
+    media_type = "text/event-stream"
+
+    def __init__(self, content) -> None:
+        super().__init__(content, headers=_SSE_HEADERS)
+
+
+@lru_cache(maxsize=1)
+def get_groq_http_client() -> httpx.AsyncClient:
+    """Process-wide HTTP client for Groq; keeps TLS connections alive between streams."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_groq_client():
+    """Process-wide AsyncGroq client, so streams share one connection pool."""
+    return groq.AsyncGroq(api_key=os.getenv("GROQ_API_KEY"), http_client=get_groq_http_client())
+
+
+_GROQ_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an elite viral content creator for X/Twitter. Write in first person, raw, emotional, zero fluff. Use short sentences. Add controversy when possible. End with a strong CTA. Always return exactly one long tweet or a numbered thread.",
+}
+_GROQ_COMPLETION_PARAMS = {
+    "model": "llama-3.1-8b-instant",
+    "temperature": 0.9,
+    "max_tokens": 1024,
+    "stream": True,
+}
+
+
+async def stream_groq_response(prompt: str, collector: io.StringIO | None = None):
     """Stream tokens from Groq API as server-sent events."""
-    groq_client = groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
     logger = logging.getLogger("onering")
 
     logger.info(f"[/v1/generate/content] streaming from Groq for prompt: {prompt[:50]}...")
 
     try:
-        stream = groq_client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an elite viral content creator for X/Twitter. Write in first person, raw, emotional, zero fluff. Use short sentences. Add controversy when possible. End with a strong CTA. Always return exactly one long tweet or a numbered thread.",
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                },
-            ],
-            model="llama-3.1-8b-instant",
-            temperature=0.9,
-            max_tokens=1024,
-            stream=True,
+        # Async client: the event loop keeps serving other requests while
+        # this stream waits on the socket.
+        groq_client = get_async_groq_client()
+        stream = await groq_client.chat.completions.create(
+            messages=[_GROQ_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            **_GROQ_COMPLETION_PARAMS,
         )
 
-        buffer = ""
+        # Pieces of the current (unterminated) line; joined only when a
+        # token completes it, so per-token work does not grow with the line.
+        parts: list[str] = []
 
-        for chunk in stream:
+        async for chunk in stream:
             if not chunk.choices[0].delta.content:
                 continue
             token = chunk.choices[0].delta.content
-            buffer += token
+            if "\n" not in token:
+                parts.append(token)
+                continue
 
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
+            pieces = token.split("\n")
+            parts.append(pieces[0])
+            lines = ["".join(parts), *pieces[1:-1]]
+            parts = [pieces[-1]]
+            # Lines completed by the same token go out as one chunk (still one
+            # SSE event per line), so a multi-line token costs one ASGI send.
+            frames = []
+            for line in lines:
                 cleaned = strip_numbering_line(line)
                 if collector is not None and cleaned:
-                    collector.append(cleaned)
+                    collector.write(f"{cleaned}\n")
                 if cleaned:
-                    yield f"data: {cleaned}\n\n"
+                    frames.append(_SSE_DATA + cleaned.encode("utf-8") + _SSE_END)
+            if frames:
+                yield b"".join(frames)
 
+        buffer = "".join(parts)
         if buffer.strip():
             cleaned = strip_numbering_line(buffer)
             if collector is not None and cleaned:
-                collector.append(cleaned)
-            yield f"data: {cleaned}\n\n"
+                collector.write(f"{cleaned}\n")
+            yield _SSE_DATA + cleaned.encode("utf-8") + _SSE_END
 
         logger.info("[/v1/generate/content] streaming completed")
     except Exception as e:
         logger.error(f"[/v1/generate/content] Groq streaming error: {e}", exc_info=True)
-        yield f"data: ERROR: {str(e)}\n\n"
+        yield _SSE_DATA + f"ERROR: {e}".encode("utf-8") + _SSE_END
+
 
+def generate_viral_thread(prompt: str, user_id: Optional[str] = None) -> list[str]:
+    """
+    Run the viral thread agent chain. The chain (LangGraph, langchain-groq,
+    pgvector) is imported on first use rather than at app startup.
+    """
+    from backend.agents.viral_thread import generate_viral_thread as _generate_viral_thread
+
+    return _generate_viral_thread(prompt, user_id=user_id)
 
-async def stream_viral_thread_response(prompt: str, user_id: str = None, collector: list | None = None):
+
+async def stream_viral_thread_response(prompt: str, user_id: str = None, collector: io.StringIO | None = None):
     """Stream a viral thread from LangGraph agent chain with pgvector context."""
     logger = logging.getLogger("onering")
     logger.info(f"[/v1/generate/content] generating viral thread for: {prompt[:50]}...")
 
     try:
-        # Call sync function - it should not block since LangGraph is fast
-        thread_lines = generate_viral_thread(prompt, user_id=user_id)
+        # The LangGraph chain (pgvector lookup + several LLM hops) is
+        # synchronous; run it on the threadpool so the event loop keeps
+        # serving other streams while it works.
+        thread_lines = await run_in_threadpool(generate_viral_thread, prompt, user_id=user_id)
 
         if not thread_lines:
             logger.warning(f"[/v1/generate/content] no tweets generated for prompt")
-            yield "data: ERROR: Failed to generate thread\n\n"
+            yield b"data: ERROR: Failed to generate thread\n\n"
             return
 
         logger.info(f"[/v1/generate/content] generated thread with {len(thread_lines)} tweets")
@@ -227,17 +351,107 @@ async def stream_viral_thread_response(prompt: str, user_id: str = None, collect
 
             if tweet_clean:
                 if collector is not None:
-                    collector.append(tweet_clean)
-                yield f"data: {tweet_clean}\n\n"
+                    collector.write(f"{tweet_clean}\n")
+                yield _SSE_DATA + tweet_clean.encode("utf-8") + _SSE_END
 
         logger.info("[/v1/generate/content] viral thread streaming completed")
     except Exception as e:
         logger.error(f"[/v1/generate/content] viral thread error: {e}", exc_info=True)
-        yield f"data: ERROR: {str(e)}\n\n"
+        yield _SSE_DATA + f"ERROR: {e}".encode("utf-8") + _SSE_END
+
+
+def _serialize_enforcement(result: EnforcementResult) -> dict:
+    """JSON-ready enforcement payload, shared by the streaming and non-streaming paths."""
+    return {
+        "request_id": result.request_id,
+        "mode": result.mode,
+        "receipt": result.receipt.model_dump(mode="json") if result.receipt else None,
+        "decisions": [
+            {
+                "agent_name": d.agent_name,
+                "status": d.status,
+                "violation_codes": d.violation_codes,
+                "required_edits": d.required_edits,
+                "decision_id": d.decision_id,
+            }
+            for d in result.decisions
+        ],
+        "qa_summary": result.qa_summary,
+        "would_block": result.would_block,
+        "required_edits": result.required_edits,
+        "audit_ok": result.audit_ok,
+        "warnings": result.warnings,
+    }
+
+
+def _format_enforcement_event(payload: dict) -> bytes:
+    # Compact separators: the payload (receipt + decisions) is sent once per
+    # stream and clients only parse it.
+    data = json.dumps(payload, default=str, separators=(',', ':')).encode("utf-8")
+    return b"event: enforcement\n" + _SSE_DATA + data + _SSE_END
+
+
+def _generation_cache_key(body: GenerateRequest) -> str:
+    # Viral threads pull the user's own history from pgvector, so they are
+    # cached per user; simple generations are shared across users.
+    parts = [body.type, body.platform, body.prompt]
+    if body.type == "viral_thread":
+        parts.append(body.user_id)
+    return "gen:" + hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+async def _replay_cached_generation(content: str, collector: io.StringIO | None = None):
+    """Stream a cached generation back as the same SSE frames it was built from."""
+    for line in content.split("\n"):
+        if collector is not None:
+            collector.write(f"{line}\n")
+        yield _SSE_DATA + line.encode("utf-8") + _SSE_END
+
+
+async def _cache_generation(response_generator, key: str, ttl: int, collector: io.StringIO):
+    """Pass frames through and store the generated lines once the stream ends cleanly."""
+    failed = False
+    async for chunk in response_generator:
+        if chunk.startswith(b"data: ERROR:"):
+            failed = True
+        yield chunk
+
+    content = collector.getvalue().rstrip("\n")
+    if failed or not content:
+        return
+    try:
+        await run_in_threadpool(get_redis_conn().setex, key, ttl, content)
+    except Exception as e:
+        logging.getLogger("onering").warning(f"[/v1/generate/content] cache store failed: {e}")
+
+
+async def _open_generation_stream(body: GenerateRequest, collector: io.StringIO | None = None):
+    """
+    SSE generator for a generate request, served from the Redis generation
+    cache when GENERATE_CACHE_TTL_SECONDS is set. Cache errors fall back to a
+    fresh generation.
+    """
+    def _generate(collector: io.StringIO | None):
+        if body.type == "viral_thread":
+            return stream_viral_thread_response(body.prompt, user_id=body.user_id, collector=collector)
+        return stream_groq_response(body.prompt, collector=collector)
+
+    ttl = settings.GENERATE_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return _generate(collector)
 
+    key = _generation_cache_key(body)
+    try:
+        cached = await run_in_threadpool(get_redis_conn().get, key)
+    except Exception as e:
+        logging.getLogger("onering").warning(f"[/v1/generate/content] cache lookup failed: {e}")
+        cached = None
+    if cached is not None:
+        return _replay_cached_generation(cached.decode("utf-8"), collector)
 
-def _format_enforcement_event(payload: dict) -> str:
-    return f"event: enforcement\ndata: {json.dumps(payload, default=str)}\n\n"
+    if collector is None:
+        collector = io.StringIO()
+    return _cache_generation(_generate(collector), key, ttl, collector)
 
 
 @app.post("/v1/generate/content")
@@ -248,22 +462,6 @@ async def generate_content(body: GenerateRequest, request: Request):
         f"[/v1/generate/content] POST received, type={body.type}, platform={body.platform}, stream={body.stream}"
     )
 
-    if not body.prompt or not body.prompt.strip():
-        logger.error("[/v1/generate/content] empty prompt provided")
-        raise HTTPException(status_code=422, detail="prompt cannot be empty")
-
-    if not body.platform.strip():
-        logger.error("[/v1/generate/content] empty platform provided")
-        raise HTTPException(status_code=422, detail="platform is required")
-
-    if not body.user_id.strip():
-        logger.error("[/v1/generate/content] empty user_id provided")
-        raise HTTPException(status_code=422, detail="user_id is required")
-
-    if body.type not in {"simple", "viral_thread"}:
-        logger.error(f"[/v1/generate/content] invalid type: {body.type}")
-        raise HTTPException(status_code=422, detail="type must be 'simple' or 'viral_thread'")
-
     enforcement_mode = get_enforcement_mode()
 
     def _build_enforcement_request(content: str) -> EnforcementRequest:
@@ -276,106 +474,38 @@ async def generate_content(body: GenerateRequest, request: Request):
             publish_intent=False,
         )
 
-    if body.stream:
-        if enforcement_mode == "off":
-            response_generator = (
-                stream_viral_thread_response(body.prompt, user_id=body.user_id)
-                if body.type == "viral_thread"
-                else stream_groq_response(body.prompt)
-            )
-            return StreamingResponse(
-                response_generator,
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no",
-                },
-            )
-
-        collector: list[str] = []
-        response_generator = (
-            stream_viral_thread_response(body.prompt, user_id=body.user_id, collector=collector)
-            if body.type == "viral_thread"
-            else stream_groq_response(body.prompt, collector=collector)
-        )
+    if body.stream and enforcement_mode == "off":
+        return SSEResponse(await _open_generation_stream(body))
+
+    # Cleaned lines, newline-terminated, as the generator emits them; both
+    # the enforcement pass and the non-streaming response read them from here.
+    collector = io.StringIO()
+    response_generator = await _open_generation_stream(body, collector)
 
+    if body.stream:
         async def _stream_with_enforcement():
             async for chunk in response_generator:
                 yield chunk
-            content = "\n".join(collector)
-            result = run_enforcement_pipeline(_build_enforcement_request(content))
-            enforcement_payload = {
-                "request_id": result.request_id,
-                "mode": result.mode,
-                "receipt": result.receipt.model_dump(mode="json") if result.receipt else None,
-                "decisions": [
-                    {
-                        "agent_name": d.agent_name,
-                        "status": d.status,
-                        "violation_codes": d.violation_codes,
-                        "required_edits": d.required_edits,
-                        "decision_id": d.decision_id,
-                    }
-                    for d in result.decisions
-                ],
-                "qa_summary": result.qa_summary,
-                "would_block": result.would_block,
-                "required_edits": result.required_edits,
-                "audit_ok": result.audit_ok,
-                "warnings": result.warnings,
-            }
-            yield _format_enforcement_event(enforcement_payload)
-
-        return StreamingResponse(
-            _stream_with_enforcement(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            },
-        )
+            content = collector.getvalue().rstrip("\n")
+            # The pipeline is synchronous (agent calls + audit writes); run it
+            # on the threadpool so the event loop keeps serving other streams.
+            result = await run_in_threadpool(run_enforcement_pipeline, _build_enforcement_request(content))
+            yield _format_enforcement_event(_serialize_enforcement(result))
 
-    # Non-streaming: collect the same cleaned tokens deterministically
-    content_parts = []
-    response_generator = (
-        stream_viral_thread_response(body.prompt, user_id=body.user_id)
-        if body.type == "viral_thread"
-        else stream_groq_response(body.prompt)
-    )
-    async for chunk in response_generator:
-        token = chunk.replace("data: ", "", 1).strip()
-        if token and not token.startswith("ERROR:"):
-            content_parts.append(token)
+        return SSEResponse(_stream_with_enforcement())
+
+    # Non-streaming: drain the same generator; only the collected lines matter.
+    async for _ in response_generator:
+        pass
 
-    content = "".join(content_parts)
+    content = collector.getvalue().rstrip("\n")
     if enforcement_mode == "off":
         return {"content": content}
 
-    enforcement_result = run_enforcement_pipeline(_build_enforcement_request(content))
+    enforcement_result = await run_in_threadpool(run_enforcement_pipeline, _build_enforcement_request(content))
     return {
         "content": content,
-        "enforcement": {
-            "request_id": enforcement_result.request_id,
-            "mode": enforcement_result.mode,
-            "receipt": enforcement_result.receipt.model_dump(mode="json") if enforcement_result.receipt else None,
-            "decisions": [
-                {
-                    "agent_name": d.agent_name,
-                    "status": d.status,
-                    "violation_codes": d.violation_codes,
-                    "required_edits": d.required_edits,
-                    "decision_id": d.decision_id,
-                }
-                for d in enforcement_result.decisions
-            ],
-            "qa_summary": enforcement_result.qa_summary,
-            "would_block": enforcement_result.would_block,
-            "required_edits": enforcement_result.required_edits,
-            "audit_ok": enforcement_result.audit_ok,
-            "warnings": enforcement_result.warnings,
-        },
+        "enforcement": _serialize_enforcement(enforcement_result),
     }
 
 # (startup handled by lifespan)
@@ -389,10 +519,30 @@ class SchedulePostRequest(BaseModel):
     post_id: str = None
 
 
+class SchedulePostsRequest(BaseModel):
+    posts: list[SchedulePostRequest] = Field(min_length=1, max_length=100)
+
+
+# Enqueued by import path: only the RQ worker process needs to load the
+# worker module.
+_SCHEDULE_POST_JOB = "backend.workers.post_worker.schedule_post"
+
+
+@lru_cache(maxsize=1)
 def get_redis_conn():
-    """Get Redis connection."""
+    """Get the process-wide Redis client (its connection pool is reused across requests)."""
     redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
-    return Redis.from_url(redis_url)
+    from redis import Redis
+
+    return Redis.from_url(redis_url, socket_keepalive=True, socket_timeout=5, health_check_interval=30)
+
+
+@lru_cache(maxsize=1)
+def get_schedule_queue():
+    """Get the RQ queue scheduled posts are enqueued on."""
+    from rq import Queue
+
+    return Queue(connection=get_redis_conn())
 
 
 @app.post("/v1/jobs/schedule-post")
@@ -405,13 +555,14 @@ async def schedule_twitter_post(body: SchedulePostRequest):
     logger.info(f"[/v1/jobs/schedule-post] received request for user: {body.user_id}, delay: {body.delay_seconds}s")
 
     try:
-        redis_conn = get_redis_conn()
-        queue = Queue(connection=redis_conn)
-
-        # Enqueue the job to run after delay_seconds
-        job = queue.enqueue_in(
-            timedelta(seconds=body.delay_seconds),
-            schedule_post,
+        queue = get_schedule_queue()
+        scheduled_for = datetime.now(timezone.utc) + timedelta(seconds=body.delay_seconds)
+
+        # Enqueue the job to run after delay_seconds; enqueue_at with the
+        # reported UTC time so the response matches the job exactly.
+        job = queue.enqueue_at(
+            scheduled_for,
+            _SCHEDULE_POST_JOB,
             body.content,
             body.user_id,
             body.delay_seconds,
@@ -425,15 +576,64 @@ async def schedule_twitter_post(body: SchedulePostRequest):
         return {
             "success": True,
             "job_id": job.id,
-            "scheduled_for": (datetime.now() + timedelta(seconds=body.delay_seconds)).isoformat(),
+            "scheduled_for": scheduled_for.isoformat(),
             "message": f"Post scheduled for {body.delay_seconds} seconds from now",
         }
     except Exception as e:
-        logger.error(f"[/v1/jobs/schedule-post] error: {e}")
+        logger.exception(f"[/v1/jobs/schedule-post] error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/v1/jobs/schedule-posts")
+async def schedule_twitter_posts(body: SchedulePostsRequest):
+    """
+    Enqueue several scheduled post jobs to RQ in one Redis round trip.
+    Each job is scheduled exactly as /v1/jobs/schedule-post would schedule it.
+    """
+    logger = logging.getLogger("onering")
+    logger.info(f"[/v1/jobs/schedule-posts] received request for {len(body.posts)} posts")
+
+    try:
+        queue = get_schedule_queue()
+        now = datetime.now(timezone.utc)
+        scheduled = [now + timedelta(seconds=post.delay_seconds) for post in body.posts]
+
+        # enqueue_at queues each job's writes on the pipeline we pass it and
+        # the batch goes out on execute(). RQ still sends the scheduled-registry
+        # ZADD directly, so N posts cost N + 1 round trips rather than 2N.
+        with get_redis_conn().pipeline(transaction=False) as pipe:
+            jobs = [
+                queue.enqueue_at(
+                    scheduled_for,
+                    _SCHEDULE_POST_JOB,
+                    post.content,
+                    post.user_id,
+                    post.delay_seconds,
+                    post.post_id,
+                    job_timeout="10m",
+                    result_ttl=3600,
+                    pipeline=pipe,
+                )
+                for post, scheduled_for in zip(body.posts, scheduled)
+            ]
+            pipe.execute()
+
+        logger.info(f"[/v1/jobs/schedule-posts] enqueued {len(jobs)} jobs")
+
         return {
-            "success": False,
-            "error": str(e),
-        }, 500
+            "success": True,
+            "jobs": [
+                {
+                    "job_id": job.id,
+                    "post_id": post.post_id,
+                    "scheduled_for": scheduled_for.isoformat(),
+                }
+                for job, post, scheduled_for in zip(jobs, body.posts, scheduled)
+            ],
+        }
+    except Exception as e:
+        logger.exception(f"[/v1/jobs/schedule-posts] error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 # (shutdown handled by lifespan)
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 import json
 from typing import Optional, Dict, Any
 from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, JSON, Index
-from sqlalchemy import Text
+from sqlalchemy import Text, func
 from sqlalchemy.orm import relationship, synonym, declarative_base
 import uuid
 
@@ -15,15 +15,20 @@ Base = declarative_base()
 
 
 def utc_now():
-    """Timezone-aware UTC now for SQLAlchemy defaults."""
+    """Timezone-aware UTC now for application-side timestamps."""
     return datetime.now(timezone.utc)
 
 
+def new_id() -> str:
+    """Primary key for billing rows (hyphenated UUID4, fits String(36))."""
+    return str(uuid.uuid4())
+
+
 class BillingSubscription(Base):
     """User billing subscription state."""
     __tablename__ = "billing_subscriptions"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=new_id)
     user_id = Column(String(255), ForeignKey("user.id"), nullable=False, unique=True, index=True)
     
     # Stripe details
@@ -40,8 +45,8 @@ class BillingSubscription(Base):
     is_on_grace_period = Column(Boolean, default=False)
     
     # Metadata
-    created_at = Column(DateTime, default=utc_now, index=True)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relations
     events = relationship("BillingEvent", back_populates="subscription")
@@ -56,7 +61,7 @@ class BillingEvent(Base):
     """Billing event log (webhooks, plan changes, etc.)."""
     __tablename__ = "billing_events"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=new_id)
     user_id = Column(String(255), ForeignKey("user.id"), nullable=False, index=True)
     subscription_id = Column(String(36), ForeignKey("billing_subscriptions.id"), nullable=True)
     
@@ -72,7 +77,7 @@ class BillingEvent(Base):
     event_data = Column(JSON, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=utc_now, index=True)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
     processed_at = Column(DateTime, nullable=True)
     
     # Relations
@@ -80,6 +85,7 @@ class BillingEvent(Base):
     
     __table_args__ = (
         Index("ix_billing_events_user_id_status", "user_id", "status"),
+        Index("ix_billing_events_user_id_created_at", "user_id", "created_at"),
         Index("ix_billing_events_event_type_status", "event_type", "status"),
     )
 
@@ -88,7 +94,7 @@ class BillingGracePeriod(Base):
     """Grace period for failed payments."""
     __tablename__ = "billing_grace_periods"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=new_id)
     subscription_id = Column(String(36), ForeignKey("billing_subscriptions.id"), nullable=False, unique=True)
     
     # Grace period dates
@@ -96,8 +102,8 @@ class BillingGracePeriod(Base):
     reason = Column(String(255), nullable=True)  # payment_failed, manual_override, etc.
     
     # Audit
-    created_at = Column(DateTime, default=utc_now)
-    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relations
     subscription = relationship("BillingSubscription", back_populates="grace_periods")
@@ -122,7 +128,7 @@ class BillingAdminAudit(Base):
     target_user_id = Column(String(100), nullable=True, index=True)
     target_resource = Column(String(200), nullable=True)
     payload_json = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), default=utc_now, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     # Backward compatibility: tests and legacy code still expect user_id
     user_id = synonym("target_user_id")
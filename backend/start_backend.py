@@ -22,13 +22,26 @@ if __name__ == "__main__":
     try:
         import uvicorn
         # Use the app from backend.main
+        # loop/http "auto" pick uvloop and httptools (both shipped with
+        # uvicorn[standard]) and fall back to asyncio/h11 where they are
+        # unavailable (uvloop has no Windows build).
+        # WEB_CONCURRENCY sets the worker count. It defaults to 1 because the
+        # realtime hub and the in-memory rate limiter are per-process; only
+        # raise it where WebSocket clients are pinned to one worker.
+        workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+        print(f"[Backend] Workers: {workers}")
         uvicorn.run(
             "backend.main:app",
             host="0.0.0.0",
             port=8000,
             reload=False,
             log_level="info",
-            access_log=True
+            access_log=True,
+            loop="auto",
+            http="auto",
+            limit_concurrency=1000,
+            timeout_keep_alive=30,
+            workers=workers,
         )
     except KeyboardInterrupt:
         print("\n[Backend] Shutting down...")
@@ -1,7 +1,9 @@
+from uuid import uuid4
+
 from sqlalchemy import select
 
-from backend.features.audit.service import record_audit_event, get_buffered_audit_events
-from backend.core.database import audit_events, create_all_tables, get_engine
+from backend.features.audit.service import record_audit_event, get_buffered_audit_events, flush_audit_events
+from backend.core.database import audit_events, create_all_tables, get_engine, get_session_factory
 from backend.core.config import settings
 
 
@@ -46,3 +48,46 @@ def test_audit_buffer_when_no_db(monkeypatch):
     after = len(get_buffered_audit_events())
 
     assert after == before + 1
+
+
+def test_audit_async_writes_after_flush(monkeypatch):
+    monkeypatch.setattr(settings, "AUDIT_ENABLED", True)
+    monkeypatch.setattr(settings, "AUDIT_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "AUDIT_ASYNC", True)
+
+    create_all_tables()
+
+    prefix = f"rid-async-{uuid4()}"
+    for i in range(3):
+        record_audit_event(action="collab.async_test", user_id="user-async", request_id=f"{prefix}-{i}")
+    flush_audit_events()
+
+    engine = get_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(audit_events).where(audit_events.c.request_id.like(f"{prefix}-%"))
+        ).fetchall()
+    assert sorted(row.request_id for row in rows) == [f"{prefix}-{i}" for i in range(3)]
+
+
+def test_audit_event_follows_caller_session(monkeypatch):
+    monkeypatch.setattr(settings, "AUDIT_ENABLED", True)
+    monkeypatch.setattr(settings, "AUDIT_SAMPLE_RATE", 1.0)
+
+    create_all_tables()
+    prefix = f"rid-session-{uuid4()}"
+
+    session = get_session_factory()()
+    try:
+        record_audit_event(action="collab.test", user_id="u1", request_id=f"{prefix}-rolled-back", session=session)
+        session.rollback()
+        record_audit_event(action="collab.test", user_id="u1", request_id=f"{prefix}-committed", session=session)
+        session.commit()
+    finally:
+        session.close()
+
+    with get_engine().connect() as conn:
+        rows = conn.execute(
+            select(audit_events.c.request_id).where(audit_events.c.request_id.like(f"{prefix}-%"))
+        ).fetchall()
+    assert [row.request_id for row in rows] == [f"{prefix}-committed"]
@@ -13,6 +13,8 @@ from backend.features.collaboration.service import (
     append_segment,
     pass_ring,
     get_draft,
+    get_draft_access,
+    invalidate_draft_access,
 )
 from backend.models.collab import (
     CollabDraftRequest,
@@ -215,6 +217,38 @@ class TestCollabRingTracking:
             assert segment.content == contents[i]
 
 
+class TestCollabAccessCache:
+    """Cached access entries are reused until a mutation invalidates them"""
+
+    def test_access_entry_reused_until_invalidated(self):
+        creator = str(uuid4())
+        draft = create_draft(creator, CollabDraftRequest(title="Test", platform="x"))
+
+        access = get_draft_access(draft.draft_id)
+        assert access.is_member(creator)
+        assert not access.is_member(str(uuid4()))
+        assert access.ring_holder_id == creator
+        assert get_draft_access(draft.draft_id) is access
+
+        invalidate_draft_access(draft.draft_id)
+        refreshed = get_draft_access(draft.draft_id)
+        assert refreshed is not access
+        assert refreshed.version == access.version + 1
+
+    def test_pass_ring_invalidates_access_entry(self):
+        creator = str(uuid4())
+        draft = create_draft(creator, CollabDraftRequest(title="Test", platform="x"))
+        access = get_draft_access(draft.draft_id)
+
+        pass_ring(draft.draft_id, creator, RingPassRequest(
+            to_user_id=creator, idempotency_key=str(uuid4())
+        ))
+        assert get_draft_access(draft.draft_id) is not access
+
+    def test_missing_draft_has_no_access_entry(self):
+        assert get_draft_access(str(uuid4())) is None
+
+
 class TestCollabValidation:
     """Input validation: title length, content bounds, platform"""
 
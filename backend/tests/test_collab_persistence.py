@@ -449,5 +449,38 @@ def test_clear_all(clean_collab_db):
     assert retrieved2 is None
 
 
+def test_filter_member_drafts(clean_collab_db):
+    """Bulk access check returns only drafts the user created or joined."""
+    persistence = clean_collab_db
+    
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    for draft_id, creator in [("draft-own", "user-1"), ("draft-joined", "user-2"), ("draft-other", "user-3")]:
+        persistence.create_draft(CollabDraft(
+            draft_id=draft_id,
+            creator_id=creator,
+            title="Access Test",
+            platform="X",
+            status=DraftStatus.ACTIVE,
+            segments=[],
+            ring_state=RingState(
+                draft_id=draft_id,
+                current_holder_id=creator,
+                holders_history=[creator],
+                passed_at=now,
+                last_passed_at=now,
+            ),
+            created_at=now,
+            updated_at=now,
+        ))
+    persistence.add_collaborator("draft-joined", "user-1")
+    
+    allowed = persistence.filter_member_drafts(
+        ["draft-own", "draft-joined", "draft-other", "draft-missing"], "user-1"
+    )
+    
+    assert allowed == {"draft-own", "draft-joined"}
+    assert persistence.filter_member_drafts([], "user-1") == set()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
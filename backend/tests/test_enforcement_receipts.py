@@ -87,3 +87,60 @@ async def test_validate_receipt_pass(client, monkeypatch):
     data = res.json()
     assert data["ok"] is True
     assert data["receipt"]["qa_status"] == "PASS"
+
+
+def test_resolve_receipt_with_qa_reads_single_decision():
+    from sqlalchemy import delete, insert
+
+    from backend.core.database import audit_agent_decisions, create_all_tables, get_db_session
+    from backend.features.enforcement.audit import resolve_receipt_with_qa
+    from backend.features.enforcement.contracts import QA_AGENT_NAME
+
+    create_all_tables()
+    request_id = f"req-with-qa-{datetime.now(timezone.utc).timestamp()}"
+    receipt = EnforcementReceipt(
+        receipt_id=f"rec-{request_id}",
+        request_id=request_id,
+        draft_id=None,
+        ring_id=None,
+        turn_id=None,
+        qa_status="PASS",
+        qa_decision_hash="hash",
+        policy_version="v1",
+        created_at=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    with get_db_session() as session:
+        session.execute(
+            insert(audit_agent_decisions).values(
+                request_id=request_id,
+                agent_name=QA_AGENT_NAME,
+                agent_version="v1",
+                contract_version="v1",
+                policy_version="v1",
+                input_hash="i",
+                output_hash="o",
+                prompt_hash="p",
+                decision_json={
+                    "output": {
+                        "receipt": receipt.model_dump(mode="json"),
+                        "qa": {"status": "PASS", "violation_codes": []},
+                    }
+                },
+                status="PASS",
+            )
+        )
+    try:
+        resolved, qa_details, error_code = resolve_receipt_with_qa(
+            request_id=request_id,
+            receipt_id=receipt.receipt_id,
+        )
+        assert error_code is None
+        assert resolved.receipt_id == receipt.receipt_id
+        assert qa_details == {"status": "PASS", "violation_codes": []}
+
+        missing = resolve_receipt_with_qa(request_id=None, receipt_id="rec-missing")
+        assert missing == (None, None, "ENFORCEMENT_RECEIPT_INVALID")
+    finally:
+        with get_db_session() as session:
+            session.execute(delete(audit_agent_decisions).where(audit_agent_decisions.c.request_id == request_id))
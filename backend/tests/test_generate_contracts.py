@@ -32,6 +32,16 @@ async def test_generate_requires_fields(client):
     })
     assert res.status_code == 422
 
+    # Whitespace-only prompt
+    res = await client.post("/v1/generate/content", json={
+        "prompt": "   ",
+        "type": "simple",
+        "platform": "x",
+        "user_id": "u",
+        "stream": True,
+    })
+    assert res.status_code == 422
+
 @pytest.mark.asyncio
 async def test_generate_openapi_snapshot():
     # Snapshot the openapi schema for the endpoint and assert required fields
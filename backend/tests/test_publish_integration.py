@@ -147,3 +147,112 @@ def test_reconciliation_detects_missing_publish_issuance(db_session, monkeypatch
     monkeypatch.setattr("backend.features.tokens.reconciliation.get_token_issuance_mode", lambda: "shadow")
     report = run_reconciliation(db_session)
     assert any(item["event_id"] == event_id for item in report["publish_missing"])
+
+
+def test_publish_event_concurrent_delivery_is_replay(db_session, monkeypatch):
+    _ensure_publish_events_table(db_session)
+    event_id = "evt-test-race"
+    _cleanup_publish_rows(db_session, event_id)
+
+    receipt = EnforcementReceipt(
+        receipt_id="rec-race",
+        request_id="req-race",
+        draft_id=None,
+        ring_id=None,
+        turn_id=None,
+        qa_status="PASS",
+        qa_decision_hash="hash",
+        policy_version="v1",
+        created_at=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+
+    monkeypatch.setattr(publish_module, "_validate_receipt", lambda **kwargs: (receipt, None, {"status": "PASS"}))
+    monkeypatch.setattr(publish_module, "get_token_issuance_mode", lambda: "shadow")
+    monkeypatch.setattr("backend.features.tokens.ledger.get_token_issuance_mode", lambda: "shadow")
+
+    kwargs = dict(
+        event_id=event_id,
+        user_id="user-1",
+        platform="x",
+        content_hash="hash",
+        published_at=datetime.now(timezone.utc),
+        platform_post_id="post-race",
+        enforcement_request_id="req-race",
+        enforcement_receipt_id="rec-race",
+        metadata={},
+    )
+    first = publish_module.handle_publish_event(db_session, **kwargs)
+
+    # Simulate a second worker whose replay lookup ran before the first committed.
+    real_lookup = publish_module._find_existing_publish_state
+    calls = {"n": 0}
+
+    def stale_lookup(db, eid):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return None, None, None
+        return real_lookup(db, eid)
+
+    monkeypatch.setattr(publish_module, "_find_existing_publish_state", stale_lookup)
+    second = publish_module.handle_publish_event(db_session, **kwargs)
+
+    pending_count = db_session.execute(
+        text("SELECT COUNT(*) FROM ring_pending WHERE publish_event_id = :id"),
+        {"id": event_id},
+    ).scalar()
+    assert pending_count == 1
+    assert second["token_result"]["pending_id"] == first["token_result"]["pending_id"]
+
+
+def test_publish_events_batch_dedupes_and_keeps_order(db_session, monkeypatch):
+    _ensure_publish_events_table(db_session)
+    event_ids = ["evt-batch-1", "evt-batch-2"]
+    for event_id in event_ids:
+        _cleanup_publish_rows(db_session, event_id)
+
+    receipt = EnforcementReceipt(
+        receipt_id="rec-batch",
+        request_id="req-batch",
+        draft_id=None,
+        ring_id=None,
+        turn_id=None,
+        qa_status="PASS",
+        qa_decision_hash="hash",
+        policy_version="v1",
+        created_at=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+
+    monkeypatch.setattr(publish_module, "_validate_receipt", lambda **kwargs: (receipt, None, {"status": "PASS"}))
+    monkeypatch.setattr(publish_module, "get_token_issuance_mode", lambda: "shadow")
+    monkeypatch.setattr("backend.features.tokens.ledger.get_token_issuance_mode", lambda: "shadow")
+
+    def event(event_id):
+        return dict(
+            event_id=event_id,
+            user_id="user-batch",
+            platform="x",
+            content_hash="hash",
+            published_at=datetime.now(timezone.utc),
+            platform_post_id=f"post-{event_id}",
+            enforcement_request_id="req-batch",
+            enforcement_receipt_id="rec-batch",
+            metadata={},
+        )
+
+    first = publish_module.handle_publish_event(db_session, **event(event_ids[0]))
+    results = publish_module.handle_publish_events(
+        db_session,
+        [event(event_ids[1]), event(event_ids[0]), event(event_ids[1])],
+    )
+
+    assert [r["event_id"] for r in results] == [event_ids[1], event_ids[0], event_ids[1]]
+    assert results[0]["token_result"]["mode"] == "shadow"
+    assert results[1]["token_result"]["pending_id"] == first["token_result"]["pending_id"]
+    assert results[2]["token_result"]["pending_id"] == results[0]["token_result"]["pending_id"]
+    stored = db_session.execute(
+        text("SELECT COUNT(*) FROM publish_events WHERE id = ANY(:ids)"),
+        {"ids": event_ids},
+    ).scalar()
+    assert stored == 2
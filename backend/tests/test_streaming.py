@@ -1,3 +1,4 @@
+import io
 import pytest
 from httpx import AsyncClient, ASGITransport
 from types import SimpleNamespace
@@ -31,3 +32,121 @@ async def test_simple_streaming(monkeypatch):
         body = await res.aread()
         text = body.decode("utf-8")
         assert "data: " in text
+
+
+class FakeAsyncStream:
+    def __init__(self, tokens):
+        self._tokens = iter(tokens)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            token = next(self._tokens)
+        except StopIteration:
+            raise StopAsyncIteration
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+
+
+class FakeAsyncCompletions:
+    async def create(self, *args, **kwargs):
+        assert kwargs["stream"] is True
+        return FakeAsyncStream(["1/2 Hello ", "World\n", "2/2 Bye"])
+
+
+@pytest.mark.asyncio
+async def test_simple_streaming_uses_async_client(monkeypatch):
+    import backend.main as main_mod
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=FakeAsyncCompletions()))
+    monkeypatch.setattr(main_mod, "get_async_groq_client", lambda: fake_client)
+
+    collector = io.StringIO()
+    events = [event async for event in main_mod.stream_groq_response("hello", collector=collector)]
+
+    assert events == [b"data: Hello World\n\n", b"data: Bye\n\n"]
+    assert collector.getvalue() == "Hello World\nBye\n"
+
+
+@pytest.mark.asyncio
+async def test_gzip_applies_to_json_but_not_event_streams(monkeypatch):
+    import backend.main as main_mod
+    monkeypatch.setattr(main_mod, "get_enforcement_mode", lambda: "off")
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=FakeAsyncCompletions()))
+    monkeypatch.setattr(main_mod, "get_async_groq_client", lambda: fake_client)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        schema = await ac.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert schema.headers.get("content-encoding") == "gzip"
+
+        res = await ac.post(
+            "/v1/generate/content",
+            headers={"Accept-Encoding": "gzip"},
+            json={
+                "type": "simple",
+                "prompt": "hello world",
+                "platform": "x",
+                "user_id": "test-user",
+                "stream": True,
+            },
+        )
+        assert res.status_code == 200
+        assert "content-encoding" not in res.headers
+        assert "data: Hello World" in res.text
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_generation_cache_replays_identical_requests(monkeypatch):
+    import backend.main as main_mod
+    calls = []
+
+    class CountingCompletions(FakeAsyncCompletions):
+        async def create(self, *args, **kwargs):
+            calls.append(kwargs)
+            return await super().create(*args, **kwargs)
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=CountingCompletions()))
+    monkeypatch.setattr(main_mod, "get_async_groq_client", lambda: fake_client)
+    monkeypatch.setattr(main_mod, "get_enforcement_mode", lambda: "off")
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(main_mod, "get_redis_conn", lambda: fake_redis)
+    monkeypatch.setattr(main_mod.settings, "GENERATE_CACHE_TTL_SECONDS", 60)
+
+    payload = {"type": "simple", "prompt": "cache me", "platform": "x", "user_id": "u1", "stream": True}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post("/v1/generate/content", json=payload)
+        second = await ac.post("/v1/generate/content", json={**payload, "user_id": "u2"})
+        plain = await ac.post("/v1/generate/content", json={**payload, "stream": False})
+
+    assert len(calls) == 1
+    assert second.text == first.text == "data: Hello World\n\ndata: Bye\n\n"
+    assert plain.json() == {"content": "Hello World\nBye"}
+
+
+@pytest.mark.asyncio
+async def test_lines_from_one_token_share_a_chunk(monkeypatch):
+    import backend.main as main_mod
+
+    class MultiLineCompletions:
+        async def create(self, *args, **kwargs):
+            return FakeAsyncStream(["1. One\n2. Two\n3. Th", "ree"])
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=MultiLineCompletions()))
+    monkeypatch.setattr(main_mod, "get_async_groq_client", lambda: fake_client)
+
+    events = [event async for event in main_mod.stream_groq_response("hello")]
+
+    assert events == [b"data: One\n\ndata: Two\n\n", b"data: Three\n\n"]
@@ -41,3 +41,21 @@ async def test_viral_thread_stream_strips_numbering(monkeypatch):
         assert "[4]" not in text
         assert "5." not in text
         assert text.count("data: ") >= 1
+
+
+def test_strip_numbering_line_fast_path_matches_regex():
+    from backend.main import _NUMBERING_RE, strip_numbering_line
+
+    for line in ["Plain sentence", "(3) Third", "[4] Fourth", "", " 2. Indented", "Tweet 7: x", "• bullet", "Two words"]:
+        assert strip_numbering_line(line) == _NUMBERING_RE.sub("", line).lstrip()
+
+
+def test_strip_numbering_line_removes_parenthesized_and_bracketed_numbers():
+    from backend.main import strip_numbering_line
+
+    assert strip_numbering_line("(3) Third") == "Third"
+    assert strip_numbering_line("[4] Fourth") == "Fourth"
+    assert strip_numbering_line("  (12)Twelfth") == "Twelfth"
+    # Only a bracketed number is a prefix; other parenthetical openers stay
+    assert strip_numbering_line("(aside) text") == "(aside) text"
+    assert strip_numbering_line("[link] here") == "[link] here"
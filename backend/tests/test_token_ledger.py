@@ -7,6 +7,7 @@ from sqlalchemy import text
 from backend.core.database import get_db
 from backend.features.tokens.ledger import (
     append_ledger_entry,
+    append_ledger_entries,
     LedgerEntry,
     get_user_balance,
     update_user_balance,
@@ -95,6 +96,24 @@ class TestLedgerAppend:
         ledger_id = append_ledger_entry(db_session, entry)
         assert ledger_id is not None
     
+    def test_append_ledger_entries_batch(self, db_session, clean_test_user):
+        """Batch append returns IDs in input order and syncs the last balance."""
+        entries = [
+            LedgerEntry(user_id=clean_test_user, event_type="EARN", reason_code="batch", amount=10, balance_after=10),
+            LedgerEntry(user_id=clean_test_user, event_type="SPEND", reason_code="batch", amount=-3, balance_after=7),
+        ]
+        
+        ledger_ids = append_ledger_entries(db_session, entries, sync_balance=True)
+        assert len(ledger_ids) == 2
+        
+        rows = db_session.execute(
+            text("SELECT id, amount FROM ring_ledger WHERE id = ANY(CAST(:ids AS UUID[]))"),
+            {"ids": ledger_ids},
+        ).fetchall()
+        amounts = {str(row[0]): row[1] for row in rows}
+        assert [amounts[i] for i in ledger_ids] == [10, -3]
+        assert get_user_balance(db_session, clean_test_user) == 7
+    
     def test_ledger_is_append_only(self, db_session, clean_test_user):
         """Ledger should be append-only (no updates)."""
         entry = LedgerEntry(
@@ -257,6 +276,43 @@ class TestIssuanceRules:
         
         # Should have violations and reduced amount
         assert len(result["violations"]) > 0
+    
+    def test_concurrent_earns_see_each_other(self, db_session, clean_test_user, monkeypatch):
+        """Two concurrent earns for one user serialize on the guardrail row."""
+        import threading
+        monkeypatch.setattr("backend.features.tokens.ledger.get_token_issuance_mode", lambda: "live")
+        
+        barrier = threading.Barrier(2)
+        results = []
+        
+        def earn(request_id):
+            db = next(get_db())
+            try:
+                barrier.wait()
+                results.append(issue_ring_for_publish(
+                    db, clean_test_user, None, request_id, None,
+                    qa_status="PASS", audit_ok=True, platform="x"
+                ))
+            finally:
+                db.close()
+        
+        threads = [threading.Thread(target=earn, args=(f"req{i}",)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 2
+        # Exactly one earn ran before the other's guardrail check
+        penalized = [r for r in results if any("min_interval" in v for v in r["violations"])]
+        assert len(penalized) == 1
+        
+        row = db_session.execute(
+            text("SELECT daily_earn_count, daily_earn_total FROM ring_guardrails_state WHERE user_id = :user_id"),
+            {"user_id": clean_test_user}
+        ).fetchone()
+        assert row[0] == 2
+        assert row[1] == sum(r["amount"] for r in results)
 
 
 class TestReconciliation:
@@ -326,6 +382,106 @@ class TestReconciliation:
         new_balance = get_user_balance(db_session, clean_test_user)
         assert new_balance != initial_balance
 
+    def test_reconciliation_skips_balanced_users(self, db_session, clean_test_user, monkeypatch):
+        """Users whose ledger sum matches their balance are counted but not reported."""
+        monkeypatch.setattr("backend.features.tokens.reconciliation.get_token_issuance_mode", lambda: "shadow")
+        
+        entry = LedgerEntry(
+            user_id=clean_test_user,
+            event_type="EARN",
+            reason_code="test",
+            amount=10,
+            balance_after=10,
+        )
+        append_ledger_entry(db_session, entry)
+        update_user_balance(db_session, clean_test_user, 10)
+        
+        report = run_reconciliation(db_session)
+        
+        assert report["users_checked"] >= 1
+        assert all(m["user_id"] != clean_test_user for m in report["mismatches"])
+    
+    def test_reconciliation_flags_overflow_without_adjustment(self, db_session, clean_test_user, monkeypatch):
+        """Drift beyond the amount cap is reported as overflow and not adjusted."""
+        monkeypatch.setattr("backend.features.tokens.reconciliation.get_token_issuance_mode", lambda: "shadow")
+        
+        for balance_after in (1_500_000_000, 2_000_000_000):
+            append_ledger_entry(db_session, LedgerEntry(
+                user_id=clean_test_user,
+                event_type="EARN",
+                reason_code="test",
+                amount=1_500_000_000,
+                balance_after=balance_after,
+            ))
+        
+        report = run_reconciliation(db_session)
+        
+        mismatch = next(m for m in report["mismatches"] if m["user_id"] == clean_test_user)
+        assert mismatch["overflow"] is True
+        assert mismatch["difference"] == 3_000_000_000
+        assert all(a["user_id"] != clean_test_user for a in report["adjustments"])
+    
+    def test_reconciliation_tracks_ledger_rewrites(self, db_session, clean_test_user, monkeypatch):
+        """Ledger sums follow updates and deletes, not just appends."""
+        monkeypatch.setattr("backend.features.tokens.reconciliation.get_token_issuance_mode", lambda: "shadow")
+        
+        append_ledger_entry(db_session, LedgerEntry(
+            user_id=clean_test_user,
+            event_type="EARN",
+            reason_code="test",
+            amount=10,
+            balance_after=10,
+        ))
+        db_session.execute(
+            text("UPDATE ring_ledger SET amount = 25 WHERE user_id = :user_id"),
+            {"user_id": clean_test_user},
+        )
+        db_session.commit()
+        
+        report = run_reconciliation(db_session)
+        mismatch = next(m for m in report["mismatches"] if m["user_id"] == clean_test_user)
+        assert mismatch["ledger_sum"] == 25
+        
+        db_session.execute(
+            text("DELETE FROM ring_ledger WHERE user_id = :user_id"),
+            {"user_id": clean_test_user},
+        )
+        db_session.commit()
+        
+        report = run_reconciliation(db_session)
+        assert all(m["user_id"] != clean_test_user for m in report["mismatches"])
+    
+    def test_reconciliation_shards_partition_users(self, db_session, clean_test_user, monkeypatch):
+        """Each user is reconciled by exactly one shard; bad shards are rejected."""
+        monkeypatch.setattr("backend.features.tokens.reconciliation.get_token_issuance_mode", lambda: "shadow")
+        
+        append_ledger_entry(db_session, LedgerEntry(
+            user_id=clean_test_user,
+            event_type="EARN",
+            reason_code="test",
+            amount=10,
+            balance_after=10,
+        ))
+        
+        reports = [run_reconciliation(db_session, shard=(index, 4)) for index in range(4)]
+        
+        owners = [r for r in reports if any(m["user_id"] == clean_test_user for m in r["mismatches"])]
+        assert len(owners) == 1
+        assert all(r["publish_missing"] == [] and r["publish_duplicates"] == [] for r in reports[1:])
+        with pytest.raises(ValueError):
+            run_reconciliation(db_session, shard=(4, 4))
+    
+    def test_reconciliation_applies_configured_work_mem(self, db_session, clean_test_user, monkeypatch):
+        """ONERING_RECONCILIATION_WORK_MEM is set for the reconciliation transaction."""
+        from backend.core.config import settings
+        monkeypatch.setattr("backend.features.tokens.reconciliation.get_token_issuance_mode", lambda: "shadow")
+        monkeypatch.setattr(settings, "ONERING_RECONCILIATION_WORK_MEM", "64MB")
+        
+        report = run_reconciliation(db_session)
+        
+        assert report["status"] == "completed"
+        assert db_session.execute(text("SHOW work_mem")).scalar() == "64MB"
+        db_session.rollback()
 
 class TestLedgerQueries:
     def test_get_user_ledger(self, db_session, clean_test_user):
@@ -6,7 +6,9 @@ from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 from backend.features.usage.service import (
     emit_usage_event,
+    emit_usage_events,
     get_usage_events,
+    iter_usage_events,
     reduce_usage,
     get_usage_count,
 )
@@ -42,6 +44,24 @@ def test_emit_usage_event():
     assert event.metadata["draft_id"] == "draft-123"
 
 
+def test_emit_usage_events_batch():
+    """Should emit several usage events in one call, visible immediately."""
+    from backend.features.users.service import get_or_create_user
+    user = get_or_create_user(f"user-{uuid4()}")
+    user_id = user.user_id
+    now = datetime.now(timezone.utc)
+    
+    events = emit_usage_events([
+        {"user_id": user_id, "usage_key": "drafts.created", "occurred_at": now},
+        {"user_id": user_id, "usage_key": "segments.appended", "metadata": {"segment_id": "s1"}},
+    ])
+    
+    assert [e.usage_key for e in events] == ["drafts.created", "segments.appended"]
+    assert events[1].metadata == {"segment_id": "s1"}
+    assert get_usage_count(user_id, "drafts.created", now=now + timedelta(minutes=1)) == 1
+    assert emit_usage_events([]) == []
+
+
 def test_get_usage_events():
     """Should retrieve usage events for user."""
     from backend.features.users.service import get_or_create_user
@@ -59,6 +79,22 @@ def test_get_usage_events():
     assert len(events) >= 3
 
 
+def test_iter_usage_events_streams_in_order():
+    """Should stream the same events as get_usage_events, oldest first."""
+    from backend.features.users.service import get_or_create_user
+    user = get_or_create_user(f"user-{uuid4()}")
+    user_id = user.user_id
+    now = datetime.now(timezone.utc)
+    
+    emit_usage_event(user_id, "segments.appended", now + timedelta(seconds=1))
+    emit_usage_event(user_id, "drafts.created", now)
+    
+    events = iter_usage_events(user_id)
+    first = next(events)
+    assert first.usage_key == "drafts.created"
+    assert [first, *events] == get_usage_events(user_id)
+
+
 def test_get_usage_events_filtered_by_key():
     """Should filter events by usage key."""
     from backend.features.users.service import get_or_create_user
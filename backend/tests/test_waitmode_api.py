@@ -60,6 +60,36 @@ class TestWaitModeNotes:
         assert delete.status_code == 200
         assert delete.json()["success"] is True
 
+    def test_list_notes_paginates_with_cursor(self):
+        draft_id = create_draft("pager1")
+        for i in range(3):
+            create = client.post(
+                f"/v1/wait/drafts/{draft_id}/notes",
+                headers={"X-User-Id": "pager1"},
+                json={"content": f"note {i}"},
+            )
+            assert create.status_code == 200
+
+        first = client.get(
+            f"/v1/wait/drafts/{draft_id}/notes",
+            headers={"X-User-Id": "pager1"},
+            params={"limit": 2},
+        )
+        assert first.status_code == 200
+        body = first.json()
+        assert [n["content"] for n in body["data"]] == ["note 2", "note 1"]
+        assert body["next_cursor"] is not None
+
+        second = client.get(
+            f"/v1/wait/drafts/{draft_id}/notes",
+            headers={"X-User-Id": "pager1"},
+            params={"limit": 2, "cursor": body["next_cursor"]},
+        )
+        assert second.status_code == 200
+        body = second.json()
+        assert [n["content"] for n in body["data"]] == ["note 0"]
+        assert body["next_cursor"] is None
+
 
 class TestWaitModeSuggestions:
     def test_queue_dismiss_and_consume_requires_ring_holder(self):
@@ -164,3 +194,73 @@ class TestWaitModeVotes:
         # At least reflect user's final vote
         assert seg_totals["downvotes"] >= 1
         assert seg_totals["user_vote"] == -1
+
+    def test_bulk_vote_upserts_and_last_vote_wins(self):
+        draft_id = create_draft("bulkvoter1")
+        seg_resp = client.post(
+            f"/v1/collab/drafts/{draft_id}/segments",
+            headers={"X-User-Id": "bulkvoter1"},
+            json={"content": "Segment A", "idempotency_key": "bulkA"},
+        )
+        assert seg_resp.status_code == 200
+        segment_id = seg_resp.json()["data"]["segments"][0]["segment_id"]
+
+        bulk = client.post(
+            f"/v1/wait/drafts/{draft_id}/votes",
+            headers={"X-User-Id": "bulkvoter1"},
+            json={"votes": [
+                {"segment_id": segment_id, "value": 1},
+                {"segment_id": segment_id, "value": -1},
+            ]},
+        )
+        assert bulk.status_code == 200
+        votes = bulk.json()["data"]
+        assert len(votes) == 1
+        assert votes[0]["segment_id"] == segment_id
+        assert votes[0]["value"] == -1
+
+        totals = client.get(
+            f"/v1/wait/drafts/{draft_id}/votes",
+            headers={"X-User-Id": "bulkvoter1"},
+        )
+        seg_totals = next(s for s in totals.json()["data"]["segments"] if s["segment_id"] == segment_id)
+        assert seg_totals["user_vote"] == -1
+
+        empty = client.post(
+            f"/v1/wait/drafts/{draft_id}/votes",
+            headers={"X-User-Id": "bulkvoter1"},
+            json={"votes": []},
+        )
+        assert empty.status_code in (400, 422)
+
+
+class TestWaitModeState:
+    def test_combined_state(self):
+        draft_id = create_draft("stateuser")
+        client.post(
+            f"/v1/wait/drafts/{draft_id}/notes",
+            headers={"X-User-Id": "stateuser"},
+            json={"content": "note for state"},
+        )
+        client.post(
+            f"/v1/wait/drafts/{draft_id}/suggestions",
+            headers={"X-User-Id": "stateuser"},
+            json={"kind": "idea", "content": "suggestion for state"},
+        )
+
+        resp = client.get(
+            f"/v1/wait/drafts/{draft_id}/state",
+            headers={"X-User-Id": "stateuser"},
+        )
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert data["draft_id"] == draft_id
+        assert [n["content"] for n in data["notes"]] == ["note for state"]
+        assert [s["content"] for s in data["suggestions"]] == ["suggestion for state"]
+        assert data["votes"]["draft_id"] == draft_id
+
+        outsider = client.get(
+            f"/v1/wait/drafts/{draft_id}/state",
+            headers={"X-User-Id": "not-a-collaborator"},
+        )
+        assert outsider.status_code == 403
@@ -9,6 +9,7 @@ from backend.features.external.webhooks import (
     sign_webhook,
     verify_webhook,
     enqueue_webhook_event,
+    enqueue_webhook_events,
     deliver_webhook,
     get_pending_deliveries,
     generate_webhook_secret,
@@ -135,6 +136,44 @@ def test_enqueue_webhook_event_creates_deliveries(db, monkeypatch):
     assert delivery[4] == 0
 
 
+def test_enqueue_webhook_events_bulk(db, monkeypatch):
+    """Bulk enqueue matches subscriptions per event and keeps input order."""
+    monkeypatch.setattr("backend.features.external.webhooks.is_webhooks_enabled", lambda: True)
+    user_id = f"user_{uuid.uuid4()}"
+    other_user_id = f"user_{uuid.uuid4()}"
+    db.execute(
+        text(
+            """
+            INSERT INTO external_webhooks (id, owner_user_id, url, secret, events, is_active)
+            VALUES (:id, :user_id, 'https://example.com/webhook', 'whsec_test', ARRAY['ring.drift_detected'], true)
+            """
+        ),
+        {"id": str(uuid.uuid4()), "user_id": user_id},
+    )
+    db.commit()
+
+    results = enqueue_webhook_events(
+        db,
+        [
+            {"event_type": "ring.drift_detected", "payload": {"n": 1}, "user_id": user_id},
+            {"event_type": "ring.drift_detected", "payload": {"n": 2}, "user_id": other_user_id},
+            {"event_type": "ring.drift_detected", "payload": {"n": 3}, "user_id": user_id},
+        ],
+    )
+
+    assert [count for _, count in results] == [1, 0, 1]
+    stored = db.execute(
+        text("SELECT COUNT(*) FROM webhook_events WHERE id = ANY(CAST(:ids AS UUID[]))"),
+        {"ids": [event_id for event_id, _ in results]},
+    ).scalar()
+    assert stored == 3
+    payload = db.execute(
+        text("SELECT payload FROM webhook_deliveries WHERE event_id = :event_id"),
+        {"event_id": results[2][0]},
+    ).scalar()
+    assert payload == {"n": 3}
+
+
 @pytest.mark.asyncio
 async def test_deliver_webhook_success(db, monkeypatch):
     """Test successful webhook delivery marks as succeeded."""
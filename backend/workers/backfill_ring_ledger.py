@@ -89,8 +89,8 @@ def backfill_balances(*, dry_run: bool, starting_balance: int = 0) -> Dict:
                 """
                 SELECT COUNT(*)
                 FROM publish_events pe
-                LEFT JOIN ring_ledger rl ON rl.metadata->>'publish_event_id' = pe.id
-                LEFT JOIN ring_pending rp ON rp.metadata->>'publish_event_id' = pe.id
+                LEFT JOIN ring_ledger rl ON rl.publish_event_id = pe.id
+                LEFT JOIN ring_pending rp ON rp.publish_event_id = pe.id
                 WHERE rl.id IS NULL AND rp.id IS NULL
                 """
             )
@@ -0,0 +1,9 @@
+-- Phase 10.2: Publish replay lookup
+-- Expression indexes backing the publish_event_id lookups performed on every
+-- publish replay / idempotency check (see _find_existing_publish_state).
+
+CREATE INDEX IF NOT EXISTS idx_ring_ledger_publish_event_id
+    ON ring_ledger ((metadata->>'publish_event_id'));
+
+CREATE INDEX IF NOT EXISTS idx_ring_pending_publish_event_id
+    ON ring_pending ((metadata->>'publish_event_id'));
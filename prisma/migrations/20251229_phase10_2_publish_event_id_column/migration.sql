@@ -0,0 +1,22 @@
+-- Phase 10.2: Promote metadata->>'publish_event_id' to a first-class column
+-- Stored generated columns keep the value in sync with metadata without any
+-- application writes; lookups become plain partial-index probes.
+-- TEXT (not UUID) because publish event ids are caller-supplied strings.
+
+ALTER TABLE ring_ledger
+    ADD COLUMN IF NOT EXISTS publish_event_id TEXT
+    GENERATED ALWAYS AS (metadata->>'publish_event_id') STORED;
+
+ALTER TABLE ring_pending
+    ADD COLUMN IF NOT EXISTS publish_event_id TEXT
+    GENERATED ALWAYS AS (metadata->>'publish_event_id') STORED;
+
+CREATE INDEX IF NOT EXISTS idx_ring_ledger_publish_event_id_col
+    ON ring_ledger (publish_event_id) WHERE publish_event_id IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_ring_pending_publish_event_id_col
+    ON ring_pending (publish_event_id) WHERE publish_event_id IS NOT NULL;
+
+-- Superseded by the column indexes above
+DROP INDEX IF EXISTS idx_ring_ledger_publish_event_id;
+DROP INDEX IF EXISTS idx_ring_pending_publish_event_id;
@@ -0,0 +1,45 @@
+-- Phase 10.2: Publish idempotency via unique constraints
+-- A publish event may issue at most one ledger entry and one pending reward.
+-- Concurrent deliveries of the same event now fail on insert instead of
+-- double-issuing; publish.py treats the conflict as an idempotent replay.
+
+-- Databases that already double-issued (reconciliation's publish_duplicates)
+-- would fail the unique indexes below. Quarantine every row but the earliest
+-- per publish_event_id: the id moves to metadata->>'duplicate_publish_event_id',
+-- which clears the generated column. Rows are kept so ledger history and
+-- balances are unchanged.
+WITH ranked AS (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY publish_event_id ORDER BY created_at, id
+    ) AS rn
+    FROM ring_ledger
+    WHERE publish_event_id IS NOT NULL
+)
+UPDATE ring_ledger l
+SET metadata = (l.metadata - 'publish_event_id')
+    || jsonb_build_object('duplicate_publish_event_id', l.metadata->>'publish_event_id')
+FROM ranked
+WHERE l.id = ranked.id AND ranked.rn > 1;
+
+WITH ranked AS (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY publish_event_id ORDER BY created_at, id
+    ) AS rn
+    FROM ring_pending
+    WHERE publish_event_id IS NOT NULL
+)
+UPDATE ring_pending p
+SET metadata = (p.metadata - 'publish_event_id')
+    || jsonb_build_object('duplicate_publish_event_id', p.metadata->>'publish_event_id')
+FROM ranked
+WHERE p.id = ranked.id AND ranked.rn > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_ring_ledger_publish_event_id
+    ON ring_ledger (publish_event_id) WHERE publish_event_id IS NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_ring_pending_publish_event_id
+    ON ring_pending (publish_event_id) WHERE publish_event_id IS NOT NULL;
+
+-- Superseded by the unique indexes above; dropped only once those exist
+DROP INDEX IF EXISTS idx_ring_ledger_publish_event_id_col;
+DROP INDEX IF EXISTS idx_ring_pending_publish_event_id_col;
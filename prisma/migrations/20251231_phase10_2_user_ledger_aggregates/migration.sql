@@ -0,0 +1,109 @@
+-- Phase 10.2: Trigger-maintained ledger aggregates on users
+-- Balance reads used to rebuild the latest balance_after and the shadow
+-- delta (SUM of SPEND/PENALTY/ADJUSTMENT) from ring_ledger history on every
+-- call. Both are now denormalized onto users and kept current by triggers,
+-- so the read path never scans ring_ledger.
+
+ALTER TABLE users
+    ADD COLUMN IF NOT EXISTS ledger_balance INTEGER NULL,
+    ADD COLUMN IF NOT EXISTS ledger_last_at TIMESTAMP NULL,
+    ADD COLUMN IF NOT EXISTS shadow_delta INTEGER NOT NULL DEFAULT 0;
+
+-- Fast path: appends only ever move the aggregates forward.
+CREATE OR REPLACE FUNCTION ring_ledger_apply_user_aggregates() RETURNS trigger AS $$
+BEGIN
+    UPDATE users
+    SET ledger_balance = CASE
+            WHEN ledger_last_at IS NULL OR NEW.created_at >= ledger_last_at THEN NEW.balance_after
+            ELSE ledger_balance
+        END,
+        ledger_last_at = GREATEST(ledger_last_at, NEW.created_at),
+        shadow_delta = shadow_delta + CASE
+            WHEN NEW.event_type IN ('SPEND', 'PENALTY', 'ADJUSTMENT') THEN NEW.amount
+            ELSE 0
+        END
+    WHERE "clerkId" = NEW.user_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute one user's aggregates from history.
+CREATE OR REPLACE FUNCTION refresh_user_ledger_aggregates(affected_user TEXT) RETURNS void AS $$
+BEGIN
+    UPDATE users u
+    SET ledger_balance = latest.balance_after,
+        ledger_last_at = latest.created_at,
+        shadow_delta = COALESCE((
+            SELECT SUM(amount)
+            FROM ring_ledger
+            WHERE user_id = affected_user
+              AND event_type IN ('SPEND', 'PENALTY', 'ADJUSTMENT')
+        ), 0)
+    FROM (SELECT 1) AS anchor
+    LEFT JOIN LATERAL (
+        SELECT balance_after, created_at
+        FROM ring_ledger
+        WHERE user_id = affected_user
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) latest ON true
+    WHERE u."clerkId" = affected_user;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Slow path: rewrites (backfill) and deletes recompute from history (both
+-- the old and the new owner when user_id itself changes).
+CREATE OR REPLACE FUNCTION ring_ledger_refresh_user_aggregates() RETURNS trigger AS $$
+DECLARE
+    affected_user TEXT;
+BEGIN
+    FOREACH affected_user IN ARRAY ARRAY[OLD.user_id, NEW.user_id] LOOP
+        CONTINUE WHEN affected_user IS NULL;
+        PERFORM refresh_user_ledger_aggregates(affected_user);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- A users row created after its ledger history (ledger writes for a user_id
+-- without a users row skip the update above) starts from that history.
+CREATE OR REPLACE FUNCTION users_init_ledger_aggregates() RETURNS trigger AS $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM ring_ledger WHERE user_id = NEW."clerkId") THEN
+        PERFORM refresh_user_ledger_aggregates(NEW."clerkId");
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_ring_ledger_aggregate ON ring_ledger;
+CREATE TRIGGER trg_ring_ledger_aggregate
+    AFTER INSERT ON ring_ledger
+    FOR EACH ROW EXECUTE FUNCTION ring_ledger_apply_user_aggregates();
+
+DROP TRIGGER IF EXISTS trg_ring_ledger_aggregate_refresh ON ring_ledger;
+CREATE TRIGGER trg_ring_ledger_aggregate_refresh
+    AFTER UPDATE OF user_id, event_type, amount, balance_after, created_at OR DELETE ON ring_ledger
+    FOR EACH ROW EXECUTE FUNCTION ring_ledger_refresh_user_aggregates();
+
+DROP TRIGGER IF EXISTS trg_users_ledger_aggregate_init ON users;
+CREATE TRIGGER trg_users_ledger_aggregate_init
+    AFTER INSERT ON users
+    FOR EACH ROW EXECUTE FUNCTION users_init_ledger_aggregates();
+
+-- Backfill existing users
+UPDATE users u
+SET ledger_balance = latest.balance_after,
+    ledger_last_at = latest.created_at,
+    shadow_delta = COALESCE(latest.delta, 0)
+FROM (
+    SELECT DISTINCT ON (user_id)
+        user_id,
+        balance_after,
+        created_at,
+        SUM(amount) FILTER (WHERE event_type IN ('SPEND', 'PENALTY', 'ADJUSTMENT'))
+            OVER (PARTITION BY user_id) AS delta
+    FROM ring_ledger
+    ORDER BY user_id, created_at DESC
+) latest
+WHERE u."clerkId" = latest.user_id;
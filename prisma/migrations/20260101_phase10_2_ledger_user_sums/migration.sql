@@ -0,0 +1,63 @@
+-- Phase 10.2: Trigger-maintained per-user ledger sums
+-- Reconciliation used to GROUP BY the whole of ring_ledger on every run to
+-- get SUM(amount) per user. The sums now live in ring_ledger_user_sums and are
+-- kept current by triggers in the same transaction as the ledger write, so
+-- the snapshot is never stale (unlike a REFRESHed materialized view) and the
+-- scan is O(users) instead of O(ledger rows). Rows exist for every user_id
+-- with ledger activity, including ones without a users row.
+
+CREATE TABLE IF NOT EXISTS ring_ledger_user_sums (
+    user_id TEXT PRIMARY KEY,
+    ledger_sum BIGINT NOT NULL DEFAULT 0,
+    entry_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- Fast path: appends only ever add to the running sum.
+CREATE OR REPLACE FUNCTION ring_ledger_apply_user_sum() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO ring_ledger_user_sums (user_id, ledger_sum, entry_count)
+    VALUES (NEW.user_id, NEW.amount, 1)
+    ON CONFLICT (user_id) DO UPDATE
+    SET ledger_sum = ring_ledger_user_sums.ledger_sum + EXCLUDED.ledger_sum,
+        entry_count = ring_ledger_user_sums.entry_count + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Slow path: rewrites and deletes recompute from history (both the old and
+-- the new owner when user_id itself changes).
+CREATE OR REPLACE FUNCTION ring_ledger_refresh_user_sum() RETURNS trigger AS $$
+DECLARE
+    affected_user TEXT;
+BEGIN
+    FOREACH affected_user IN ARRAY ARRAY[OLD.user_id, NEW.user_id] LOOP
+        CONTINUE WHEN affected_user IS NULL;
+        DELETE FROM ring_ledger_user_sums WHERE user_id = affected_user;
+        INSERT INTO ring_ledger_user_sums (user_id, ledger_sum, entry_count)
+        SELECT user_id, SUM(amount), COUNT(*)
+        FROM ring_ledger
+        WHERE user_id = affected_user
+        GROUP BY user_id;
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_ring_ledger_user_sum ON ring_ledger;
+CREATE TRIGGER trg_ring_ledger_user_sum
+    AFTER INSERT ON ring_ledger
+    FOR EACH ROW EXECUTE FUNCTION ring_ledger_apply_user_sum();
+
+DROP TRIGGER IF EXISTS trg_ring_ledger_user_sum_refresh ON ring_ledger;
+CREATE TRIGGER trg_ring_ledger_user_sum_refresh
+    AFTER UPDATE OF user_id, amount OR DELETE ON ring_ledger
+    FOR EACH ROW EXECUTE FUNCTION ring_ledger_refresh_user_sum();
+
+-- Backfill from existing history
+INSERT INTO ring_ledger_user_sums (user_id, ledger_sum, entry_count)
+SELECT user_id, SUM(amount), COUNT(*)
+FROM ring_ledger
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE
+SET ledger_sum = EXCLUDED.ledger_sum,
+    entry_count = EXCLUDED.entry_count;
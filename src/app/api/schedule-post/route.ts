@@ -69,7 +69,7 @@ export async function POST(req: NextRequest) {
     if (!backendRes.ok) {
       console.error("[schedule-post] backend error:", backendData);
       return Response.json(
-        { error: `Backend error: ${backendData.error || "Unknown error"}` },
+        { error: `Backend error: ${backendData.error?.message || backendData.detail || "Unknown error"}` },
         { status: 500 }
       );
     }